@@ -0,0 +1,185 @@
+# ============================================================
+# PRECOMPUTED AGGREGATE CUBE
+# ============================================================
+# One pass over the dataset builds a small cube of
+#     year x experience_years x demand bucket
+# holding sum / count / min / max of every numeric column. Pages roll
+# the cube up to the series they chart instead of grouping the full
+# frame, so a page render costs O(cube) rather than O(rows).
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from profiler import profiled
+from shared_cache import shared_or_compute
+
+CUBE_DIMENSIONS = ["year", "experience_years", "demand_index"]
+CUBE_STATS = ["sum", "count", "min", "max"]
+
+# Width of a demand bucket. With the default of 1 every integer demand
+# level is its own bucket, which matches grouping on raw demand_index.
+DEMAND_BUCKET_WIDTH = 1
+
+# (x, y) pairs whose least-squares sufficient statistics are kept in the
+# cube, so trendlines can be fitted from it (see trendline.py).
+REGRESSION_PAIRS = [("experience_years", "salary_median_cny")]
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else list(value)
+
+
+def demand_buckets(series, width=DEMAND_BUCKET_WIDTH):
+    """Lower edge of the demand bucket each row falls into."""
+    return (series // width) * width
+
+
+def regression_columns(x, y):
+    """Cube column names holding Σx, Σy, Σxy and Σx² for an (x, y) pair.
+
+    Only rows where both x and y are present contribute, so the ``count``
+    of the ``xy`` column is the number of usable observations.
+    """
+    return {"x": f"{x}|{y}", "y": f"{y}|{x}", "xy": f"{x}*{y}", "xx": f"{x}*{x}"}
+
+
+def _regression_terms(df):
+    terms = {}
+    for x, y in REGRESSION_PAIRS:
+        paired = df[x].notna() & df[y].notna()
+        # float64 so products of narrow integer columns cannot overflow.
+        xs = df[x].astype("float64").where(paired)
+        ys = df[y].astype("float64").where(paired)
+        names = regression_columns(x, y)
+        terms[names["x"]] = xs
+        terms[names["y"]] = ys
+        terms[names["xy"]] = xs * ys
+        terms[names["xx"]] = xs * xs
+    return terms
+
+
+def compute_cube(df):
+    """Aggregate ``df`` into the cube (uncached)."""
+    numeric = list(df.select_dtypes("number").columns)
+    # Plain arrays as keys so the dimension columns are aggregated too
+    # (pandas drops grouping columns it recognises from the frame).
+    keys = [
+        df["year"].to_numpy(),
+        df["experience_years"].to_numpy(),
+        demand_buckets(df["demand_index"]).to_numpy(),
+    ]
+    # Narrow (e.g. float32) columns would be summed in their own dtype:
+    # widen them first so the cell sums, and rollups over them, stay exact.
+    narrow = [column for column in numeric if df[column].dtype.kind == "f" and df[column].dtype.itemsize < 8]
+    frame = df[numeric].astype(dict.fromkeys(narrow, "float64")).assign(**_regression_terms(df))
+    cube = frame.groupby(keys, sort=True).agg(CUBE_STATS)
+    cube.index.names = CUBE_DIMENSIONS
+    # Sums of integer columns come back as integers; keep every sum float64.
+    sums = [column for column in cube.columns if column[1] == "sum"]
+    return cube.astype(dict.fromkeys(sums, "float64"))
+
+
+def merge_cubes(left, right):
+    """Combine the cubes of two disjoint row sets into the cube of both.
+
+    Sums and counts add, minima and maxima combine, so a cube can be
+    updated from the cube of newly ingested rows without a full rescan.
+    """
+    cells = left.index.union(right.index)
+    dtypes = {
+        column: np.result_type(*(cube[column].dtype for cube in (left, right) if column in cube))
+        for column in left.columns.union(right.columns, sort=False)
+    }
+    left = left.reindex(cells)
+    right = right.reindex(cells)
+
+    merged = {}
+    for column in left.columns.union(right.columns, sort=False):
+        a = left[column] if column in left else pd.Series(np.nan, index=cells)
+        b = right[column] if column in right else pd.Series(np.nan, index=cells)
+        stat = column[1]
+        if stat == "sum":
+            merged[column] = a.fillna(0) + b.fillna(0)
+        elif stat == "count":
+            merged[column] = (a.fillna(0) + b.fillna(0)).astype("int64")
+        else:
+            combined = np.fmin(a, b) if stat == "min" else np.fmax(a, b)
+            # Reindexing turned integer columns into floats; every cell has a
+            # value on one side at least, so cast back to the input dtype.
+            merged[column] = combined if combined.isna().any() else combined.astype(dtypes[column])
+    cube = pd.DataFrame(merged, index=cells)
+    cube.columns = pd.MultiIndex.from_tuples(cube.columns)
+    return cube
+
+
+# Cubes maintained incrementally (see ingestion.py), by dataset version.
+_maintained_cubes = {}
+MAINTAINED_CUBES_KEPT = 4
+
+
+def register_cube(version, cube):
+    """Publish an incrementally maintained cube for ``version``."""
+    _maintained_cubes[version] = cube
+    while len(_maintained_cubes) > MAINTAINED_CUBES_KEPT:
+        _maintained_cubes.pop(next(iter(_maintained_cubes)))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_cube(_df, version, _rows=None):
+    return shared_or_compute(
+        "cube", version, lambda: compute_cube(_df if _rows is None else _df.take(_rows))
+    )
+
+
+@profiled
+def build_cube(_df, version, rows=None):
+    """The cube for ``_df``, computed at most once per dataset ``version``.
+
+    The frame itself is not hashed (leading underscore) - ``version``
+    is the dataset fingerprint from data_loader and is the only key. A
+    cube already maintained by incremental ingestion is used as is.
+    With ``rows``, only those positions of ``_df`` are aggregated; the
+    version must then identify that subset (see filter_state.py).
+    """
+    if version in _maintained_cubes:
+        return _maintained_cubes[version]
+    return _cached_cube(_df, version, rows)
+
+
+@profiled
+def rollup(cube, by, columns, stat="mean"):
+    """Roll the cube up to the ``by`` dimensions.
+
+    Equivalent to ``df.groupby(by)[columns].<stat>().reset_index()`` for
+    ``stat`` in mean / sum / count / min / max.
+    """
+    by = _as_list(by)
+
+    def rolled(column, source, how):
+        return cube[(column, source)].groupby(level=by, sort=True).agg(how)
+
+    result = {}
+    for column in _as_list(columns):
+        if stat == "mean":
+            result[column] = rolled(column, "sum", "sum") / rolled(column, "count", "sum")
+        elif stat in ("sum", "count"):
+            result[column] = rolled(column, stat, "sum")
+        elif stat in ("min", "max"):
+            result[column] = rolled(column, stat, stat)
+        else:
+            raise ValueError(f"Unsupported cube statistic: {stat!r}")
+
+    frame = pd.DataFrame(result).reset_index()
+    return frame[by + list(result)]
+
+
+def total(cube, column, stat="mean"):
+    """Whole-dataset statistic for ``column``, e.g. ``df[column].mean()``."""
+    if stat == "mean":
+        return cube[(column, "sum")].sum() / cube[(column, "count")].sum()
+    if stat in ("sum", "count"):
+        return cube[(column, stat)].sum()
+    if stat in ("min", "max"):
+        return cube[(column, stat)].agg(stat)
+    raise ValueError(f"Unsupported cube statistic: {stat!r}")
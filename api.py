@@ -0,0 +1,267 @@
+# ============================================================
+# HEADLESS JSON / ARROW API
+# ============================================================
+# Serves the numbers the pages compute - from the same cached backends,
+# cubes, forecasts and indexes - over plain HTTP, so other services do
+# not have to drive a Streamlit render:
+#
+#   GET /kpis              the Job Demand & Market KPIs metrics
+#   GET /rollup            by=year&column=salary_median_cny&stat=mean
+#                          (defaults: the Overview salary trend)
+#   GET /forecast          column=salary_median_cny&stat=mean
+#                          &model=Holt&horizon=3
+#   GET /recommendations   experience=3&min_salary=15000&limit=20
+#
+# Every endpoint takes the global filters as min_experience_years=,
+# min_salary_median_cny= and min_demand_index=. Responses are JSON
+# ({"version": ..., "data": [rows]}) unless format=arrow is passed or
+# the Accept header asks for application/vnd.apache.arrow.stream.
+#
+# The ETag is derived from the dataset version and the request, so a
+# client polling with If-None-Match gets 304 Not Modified, without any
+# computation, until the data changes.
+#
+# Run it standalone:
+#     python api.py --port 8502
+# or inside each Streamlit server process, sharing its caches:
+#     JOB_API_PORT=8502 streamlit run app.py
+# It binds to 127.0.0.1 unless JOB_API_HOST / --host says otherwise.
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import streamlit as st
+
+from aggregates import CUBE_DIMENSIONS
+from filter_index import FILTER_COLUMNS
+from forecast_models import MODELS, forecast, rollup_panel
+from query_backend import SQL_STATS, data_backend, market_kpis
+from recommendations import TOP_K, recommendation_index
+from schema import SCHEMA
+
+logger = logging.getLogger(__name__)
+
+API_PORT_ENV = "JOB_API_PORT"
+API_HOST_ENV = "JOB_API_HOST"
+DEFAULT_API_HOST = "127.0.0.1"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MAX_FORECAST_HORIZON = 10
+
+
+class BadRequest(ValueError):
+    """A request parameter is missing or invalid (HTTP 400)."""
+
+
+def _param(query, name, default=None):
+    values = query.get(name)
+    return values[-1] if values else default
+
+
+def _number(query, name, default, kind=float, low=None, high=None):
+    raw = _param(query, name)
+    if raw is None:
+        return default
+    try:
+        value = kind(raw)
+    except ValueError:
+        raise BadRequest(f"{name} must be a number, got {raw!r}") from None
+    if not math.isfinite(value):
+        raise BadRequest(f"{name} must be a finite number, got {raw!r}")
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise BadRequest(f"{name} must be between {low} and {high}")
+    return value
+
+
+def _columns(query, name, default, allowed):
+    columns = [c for c in (_param(query, name) or default).split(",") if c]
+    unknown = [c for c in columns if c not in allowed]
+    if not columns or unknown:
+        raise BadRequest(f"{name} must be one or more of {', '.join(allowed)}")
+    return columns
+
+
+def _stat(query):
+    stat = _param(query, "stat", "mean")
+    if stat not in SQL_STATS:
+        raise BadRequest(f"stat must be one of {', '.join(SQL_STATS)}")
+    return stat
+
+
+def request_filters(query):
+    """Global filter thresholds from ``min_<column>`` parameters."""
+    thresholds = {}
+    for column in FILTER_COLUMNS:
+        value = _number(query, f"min_{column}", None)
+        if value is not None:
+            # Whole numbers match the sidebar sliders' version suffix and caches.
+            thresholds[column] = int(value) if value.is_integer() else value
+    return thresholds
+
+
+# ------------------------------------------------------------
+# Endpoints: each takes (backend, query) and returns a DataFrame
+# ------------------------------------------------------------
+def kpis_endpoint(backend, query):
+    return pd.DataFrame([market_kpis(backend)])
+
+
+def rollup_endpoint(backend, query):
+    by = _columns(query, "by", "year", CUBE_DIMENSIONS)
+    columns = _columns(query, "column", "salary_median_cny", list(SCHEMA))
+    return backend.rollup(by, columns, _stat(query))
+
+
+def forecast_endpoint(backend, query):
+    column = _columns(query, "column", "salary_median_cny", list(SCHEMA))[0]
+    models = {model.lower(): model for model in MODELS}
+    model = models.get(_param(query, "model", MODELS[0]).lower())
+    if model is None:
+        raise BadRequest(f"model must be one of {', '.join(MODELS)}")
+    horizon = _number(query, "horizon", 1, int, 1, MAX_FORECAST_HORIZON)
+    # Fitted on the backend's yearly series, so the answer matches the ETag's version.
+    history = backend.rollup(["year"], [column], _stat(query))
+    return forecast(rollup_panel(history, column), model, horizon)
+
+
+def recommendations_endpoint(backend, query):
+    experience = _number(query, "experience", backend.total("experience_years", "max"))
+    min_salary = _number(query, "min_salary", 0, low=0)
+    limit = _number(query, "limit", 20, int, 1, TOP_K)
+    return recommendation_index(backend).recommend(experience, min_salary, limit)
+
+
+ENDPOINTS = {
+    "/kpis": kpis_endpoint,
+    "/rollup": rollup_endpoint,
+    "/forecast": forecast_endpoint,
+    "/recommendations": recommendations_endpoint,
+}
+
+
+def etag(version, path, query, media_type):
+    key = json.dumps([version, path, sorted(query.items()), media_type])
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest() + '"'
+
+
+def encode(frame, version, media_type):
+    if media_type == ARROW_MEDIA_TYPE:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"version": version.encode()})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    records = frame.to_json(orient="records", date_format="iso")
+    return f'{{"version": {json.dumps(version)}, "data": {records}}}'.encode("utf-8")
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "JobMarketAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        endpoint = ENDPOINTS.get(url.path.rstrip("/") or "/")
+        if endpoint is None:
+            return self._error(HTTPStatus.NOT_FOUND, f"Unknown endpoint; try one of {', '.join(ENDPOINTS)}")
+
+        wants_arrow = _param(query, "format") == "arrow" or ARROW_MEDIA_TYPE in self.headers.get("Accept", "")
+        media_type = ARROW_MEDIA_TYPE if wants_arrow else "application/json"
+        try:
+            backend = data_backend(request_filters(query))
+            tag = etag(backend.version, url.path, query, media_type)
+            if tag in (self.headers.get("If-None-Match") or ""):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", tag)
+                self.end_headers()
+                return
+            if not backend.row_count():
+                return self._error(HTTPStatus.UNPROCESSABLE_ENTITY, "No rows match these filters")
+            body = encode(endpoint(backend, query), backend.version, media_type)
+        except BadRequest as error:
+            return self._error(HTTPStatus.BAD_REQUEST, str(error))
+        except Exception:
+            logger.exception("API request %s failed", self.path)
+            return self._error(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal error")
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", media_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", tag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        body = json.dumps({"error": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(host, port):
+    return ThreadingHTTPServer((host, port), ApiHandler)
+
+
+def api_port():
+    try:
+        return int(os.environ[API_PORT_ENV])
+    except (KeyError, ValueError):
+        return None
+
+
+def api_host():
+    return os.environ.get(API_HOST_ENV, DEFAULT_API_HOST)
+
+
+@st.cache_resource(show_spinner=False)
+def start_api_server(host, port):
+    """Serve the API from a daemon thread of this process, once.
+
+    Returns None if the port is taken, e.g. by another server process
+    on the same node that started it first.
+    """
+    try:
+        server = make_server(host, port)
+    except OSError as error:
+        logger.warning("API not started on %s:%s: %s", host, port, error)
+        return None
+    threading.Thread(target=server.serve_forever, name="job-api", daemon=True).start()
+    logger.info("API listening on http://%s:%s", host, port)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the dashboard's KPIs and series as JSON / Arrow.")
+    parser.add_argument("--host", default=api_host())
+    parser.add_argument("--port", type=int, default=api_port() or 8502)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"serving on http://{args.host}:{args.port} ({', '.join(ENDPOINTS)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
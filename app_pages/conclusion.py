@@ -0,0 +1,40 @@
+# ============================================================
+# CONCLUSION & INSIGHTS PAGE
+# ============================================================
+import streamlit as st
+
+st.markdown('<div class="title">🏁 Conclusion & Insights</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Key takeaways and recommendations from the job market analysis</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Summary of Findings
+1. **Salary Trends:** Median salaries show a steady increase over the years. Experience strongly impacts compensation.  
+2. **Job Demand:** High-demand skills correspond to higher salaries and more job openings.  
+3. **KPIs:** Average demand index, job openings, and experience provide actionable insights for career planning.  
+4. **Forecasting:** Predicted salary growth and job openings indicate a positive trend in the job market.  
+5. **Skill Focus:** Prioritizing high-demand skills enhances career opportunities and market competitiveness.
+""")
+
+st.markdown("---")
+
+st.markdown("""
+### 💡 Recommendations
+- Focus on acquiring **high-demand skills** identified in the market.  
+- Target roles with **growing job openings** for better career prospects.  
+- Use predictive insights to **plan career path and salary growth**.  
+- Leverage dashboards for continuous **monitoring of market trends**.  
+- Upskill in areas with **high demand index and low experience threshold** to maximize opportunities.
+""")
+
+st.markdown("---")
+
+st.markdown("""
+### 🔹 Final Note
+This dashboard provides **comprehensive insights** into the Chinese job market.  
+By combining **historical analysis, KPIs, forecasting, and skill recommendations**, it serves as a powerful tool for **job seekers, HR professionals, and decision-makers** to make data-driven decisions.
+""")
@@ -0,0 +1,85 @@
+# ============================================================
+# DATA VIEW PAGE
+# ============================================================
+import streamlit as st
+
+from data_loader import get_dataset, get_memory_report
+from exports import EXPORT_FORMATS, export_bytes, export_file_name
+from filter_state import apply_global_filters
+from pagination import PAGE_SIZES, page_count, row_range
+
+data = apply_global_filters(*get_dataset())
+DATA_VERSION = data.version
+
+st.markdown('<div class="title">📂 Data View</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Interactive view of the raw job market dataset</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Page Overview
+This page provides an **interactive table** of the job market dataset.
+You can filter, sort, and explore the data for deeper insights.
+""")
+
+# Server-side pagination: only the current page is sent to the browser.
+# Paging and sorting rerun this fragment only, not the rest of the page.
+@st.fragment
+def table_panel():
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        sort_column = st.selectbox("Sort by", ["(dataset order)"] + list(data.columns))
+
+    with col2:
+        sort_order = st.radio("Order", ["Ascending", "Descending"], horizontal=True)
+
+    with col3:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES)
+
+    with col4:
+        page_number = st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count(len(data), page_size),
+            value=1,
+            step=1
+        )
+
+    permutation = None
+    if sort_column != "(dataset order)":
+        permutation = data.sort_permutation(sort_column, sort_order == "Ascending")
+
+    st.dataframe(data.page(page_number, page_size, permutation))
+
+    first_row, last_row = row_range(len(data), page_number, page_size)
+    st.caption(f"Showing rows {first_row:,}–{last_row:,} of {len(data):,}")
+
+
+table_panel()
+
+with st.expander("🧮 Memory footprint (compact schema)"):
+    report = get_memory_report()
+    saved = 1 - report.loc["TOTAL", "bytes_after"] / max(report.loc["TOTAL", "bytes_before"], 1)
+    st.caption(f"The compact schema saves {saved:.0%} of the raw frame's memory.")
+    st.dataframe(report)
+
+st.markdown("---")
+
+# Optional: Allow user to download the dataset. The file is only built
+# when the button is clicked, and is reused until the dataset changes.
+@st.fragment
+def export_panel():
+    export_format = st.selectbox("Export format", list(EXPORT_FORMATS))
+    st.download_button(
+        label=f"📥 Download Dataset as {export_format}",
+        data=lambda: export_bytes(data.source, DATA_VERSION, export_format, data.rows),
+        file_name=export_file_name(export_format),
+        mime=EXPORT_FORMATS[export_format][1]
+    )
+
+
+export_panel()
@@ -0,0 +1,75 @@
+# ============================================================
+# FILTERS PAGE (FIXED & WORKING)
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from aggregates import total
+from data_loader import get_dataset
+from downsampling import scatter_frame
+from figure_cache import figure_panel
+from filter_state import apply_global_filters
+from pagination import PAGE_SIZES, page_count, row_range
+
+# -------- FILTERS --------
+# The sliders live in the sidebar form and apply to every page; the
+# filtered frame comes back cached under its own dataset version.
+filtered = apply_global_filters(*get_dataset())
+DATA_VERSION = filtered.version
+cube = filtered.cube()
+
+st.markdown("## ⚡ Interactive Filters")
+st.caption("Set the minimum thresholds in the sidebar and press Apply; they carry over to every page.")
+
+st.markdown("---")
+
+# -------- KPIs --------
+col4, col5, col6 = st.columns(3)
+
+col4.metric("💼 Total Jobs", len(filtered))
+col5.metric("💰 Avg Salary (CNY)", int(total(cube, "salary_median_cny")))
+col6.metric("📊 Avg Demand Index", round(total(cube, "demand_index"), 2))
+
+st.markdown("---")
+
+# -------- VISUAL --------
+figure_panel(
+    DATA_VERSION, "Filters", "fig",
+    lambda: px.scatter(
+        scatter_frame(
+            filtered.frame(["experience_years", "salary_median_cny", "job_openings", "demand_index"]),
+            "experience_years", "salary_median_cny", size="job_openings", color="demand_index"
+        ),
+        x="experience_years",
+        y="salary_median_cny",
+        size="job_openings",
+        color="demand_index",
+        title="Filtered Jobs: Salary vs Experience",
+        labels={
+            "experience_years": "Experience (Years)",
+            "salary_median_cny": "Median Salary (CNY)"
+        }
+    )
+)
+
+st.markdown("---")
+
+st.markdown("### 📋 Filtered Data")
+
+
+# Only the positions of the filtered rows are cached (and shared by
+# every session); the visible page is copied out of the dataset.
+@st.fragment
+def filtered_table_panel():
+    col1, col2 = st.columns(2)
+    page_size = col1.selectbox("Rows per page", PAGE_SIZES)
+    page_number = col2.number_input(
+        "Page", min_value=1, max_value=page_count(len(filtered), page_size), value=1, step=1
+    )
+    st.dataframe(filtered.page(page_number, page_size))
+
+    first_row, last_row = row_range(len(filtered), page_number, page_size)
+    st.caption(f"Showing rows {first_row:,}–{last_row:,} of {len(filtered):,}")
+
+
+filtered_table_panel()
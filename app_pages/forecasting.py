@@ -0,0 +1,187 @@
+# ============================================================
+# ADVANCED INSIGHTS & FORECASTING PAGE
+# ============================================================
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from aggregates import rollup, total
+from data_loader import get_dataset
+from figure_cache import figure_panel
+from filter_state import apply_global_filters
+from forecast_models import MODELS, fit_panel, forecast, history_with_forecast
+
+data = apply_global_filters(*get_dataset())
+DATA_VERSION = data.version
+cube = data.cube()
+
+st.markdown('<div class="title">📊 Advanced Insights & Forecasting</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Future trends, predictive analysis, and actionable insights</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Page Overview
+This section provides **advanced insights and forecasts** on the job market, salaries,
+and demand trends using historical data. Predictive analytics can help companies
+and job seekers make **data-driven decisions**.
+""")
+
+st.markdown("---")
+
+# Every panel below depends on the model / horizon controls, so they
+# rerun together as one fragment; the header above is not re-executed.
+@st.fragment
+def forecast_section():
+    # ================= FORECAST SETTINGS =================
+    col1, col2 = st.columns(2)
+
+    with col1:
+        model = st.selectbox("Forecasting model", MODELS)
+
+    with col2:
+        horizon = st.slider("Forecast horizon (years)", min_value=1, max_value=5, value=1)
+
+    # Models are fitted once per dataset version (all segments at once);
+    # changing the model or horizon only re-projects the fitted parameters.
+    salary_history = rollup(cube, "year", "salary_median_cny")
+    jobs_history = rollup(cube, "year", "job_openings", "sum")
+    salary_forecast = forecast(fit_panel(cube, DATA_VERSION, (), "salary_median_cny"), model, horizon)
+    jobs_forecast = forecast(fit_panel(cube, DATA_VERSION, (), "job_openings", "sum"), model, horizon)
+
+    last_salary = salary_history["salary_median_cny"].iloc[-1]
+    last_jobs = jobs_history["job_openings"].iloc[-1]
+    next_salary = salary_forecast["forecast"].iloc[0]
+    next_jobs = jobs_forecast["forecast"].iloc[0]
+    salary_growth = next_salary / last_salary - 1
+    jobs_growth = next_jobs / last_jobs - 1
+
+    st.markdown("---")
+
+    # ================= KPIs =================
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("📈 Projected Avg Salary (Next Year)", int(next_salary), delta=f"{salary_growth:+.1%}")
+
+    with col2:
+        st.metric("💼 Projected Job Openings", int(next_jobs), delta=f"{jobs_growth:+.1%}")
+
+    with col3:
+        st.metric("📊 High-Demand Skill Index", round(total(cube, "demand_index", "max"), 2))
+
+    with col4:
+        st.metric("💡 Insights Count", 5)
+
+    st.markdown("---")
+
+    # ================= VISUALS =================
+    col1, col2 = st.columns(2)
+
+    # -------- VISUAL 1: Salary Forecast (Line + Prediction Interval)
+    with col1:
+        figure_panel(
+            DATA_VERSION, "Advanced Insights & Forecasting", "fig1",
+            lambda: px.line(
+                history_with_forecast(salary_history, salary_forecast, "salary_median_cny"),
+                x="year",
+                y="value",
+                color="series",
+                error_y="error_plus",
+                error_y_minus="error_minus",
+                markers=True,
+                title="Historical vs Forecasted Median Salary (95% interval)",
+                labels={"value": "Avg Median Salary (CNY)"}
+            ),
+            model=model, horizon=horizon
+        )
+
+    # -------- VISUAL 2: Job Openings Forecast (Bar + Prediction Interval)
+    with col2:
+        figure_panel(
+            DATA_VERSION, "Advanced Insights & Forecasting", "fig2",
+            lambda: px.bar(
+                history_with_forecast(jobs_history, jobs_forecast, "job_openings", bridge=False),
+                x="year",
+                y="value",
+                color="series",
+                error_y="error_plus",
+                error_y_minus="error_minus",
+                title="Historical Job Openings with Forecast (95% interval)",
+                labels={"value": "Job Openings"}
+            ),
+            model=model, horizon=horizon
+        )
+
+    st.markdown("---")
+
+    col3, col4 = st.columns(2)
+
+    # -------- VISUAL 3: Skill Demand Radar Chart
+    with col3:
+        skill_demand = rollup(cube, "demand_index", "job_openings", "sum")
+        figure_panel(
+            DATA_VERSION, "Advanced Insights & Forecasting", "fig3",
+            lambda: px.line_polar(
+                skill_demand,
+                r="job_openings",
+                theta="demand_index",
+                line_close=True,
+                title="Skill Demand Radar",
+                markers=True
+            )
+        )
+
+    # -------- VISUAL 4: Experience vs Salary Forecast Heatmap
+    with col4:
+        experience_forecast = forecast(
+            fit_panel(cube, DATA_VERSION, ("experience_years",), "salary_median_cny"), model, horizon
+        )
+        heatmap_data = pd.concat([
+            rollup(cube, ["year", "experience_years"], "salary_median_cny"),
+            experience_forecast.rename(columns={"forecast": "salary_median_cny"})[
+                ["year", "experience_years", "salary_median_cny"]
+            ],
+        ], ignore_index=True)
+        figure_panel(
+            DATA_VERSION, "Advanced Insights & Forecasting", "fig4",
+            lambda: px.density_heatmap(
+                heatmap_data,
+                x="year",
+                y="experience_years",
+                z="salary_median_cny",
+                histfunc="avg",
+                title="Historical & Forecasted Salary by Experience & Year"
+            ),
+            model=model, horizon=horizon
+        )
+
+    st.markdown("---")
+
+    # -------- SEGMENT FORECASTS (experience level x demand bucket)
+    st.markdown("### 🔮 Segment Salary Forecasts (Experience × Demand Level)")
+
+    segment_forecast = forecast(
+        fit_panel(cube, DATA_VERSION, ("experience_years", "demand_index"), "salary_median_cny"),
+        model,
+        horizon
+    )
+    st.dataframe(segment_forecast.round(0), hide_index=True)
+
+    st.markdown("---")
+
+    # -------- INSIGHT TEXT
+    st.markdown(f"""
+    ### 💡 Key Insights
+    1. Median salaries are expected to **change by {salary_growth:+.1%} next year** ({model} model on historical trends).  
+    2. Total job openings are projected to change by **{jobs_growth:+.1%}** next year.  
+    3. Skills with the highest demand index should be prioritized for career growth.  
+    4. Experience continues to play a major role in salary progression across years.  
+    5. Predictive insights can guide both job seekers and employers in **strategic planning**.
+    """)
+
+
+forecast_section()
@@ -0,0 +1,114 @@
+# ============================================================
+# JOB DEMAND & MARKET KPIs PAGE
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from figure_cache import figure_panel
+from query_backend import get_backend, market_kpis
+
+backend = get_backend()
+DATA_VERSION = backend.version
+
+st.markdown('<div class="title">📈 Job Demand & Market KPIs</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Key performance indicators and demand-driven market insights</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Page Overview
+This section focuses on **job demand indicators** and summarizes the job market
+using **Key Performance Indicators (KPIs)**. These metrics help in understanding
+market intensity, hiring trends, and salary behavior in high-demand roles.
+""")
+
+st.markdown("---")
+
+# ================= KPIs =================
+# The same numbers are served by api.py at /kpis.
+kpis = market_kpis(backend)
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("📌 Avg Demand Index", kpis["avg_demand_index"])
+
+with col2:
+    st.metric("💼 Total Job Openings", kpis["total_job_openings"])
+
+with col3:
+    st.metric("💰 Avg Median Salary (CNY)", kpis["avg_median_salary_cny"])
+
+with col4:
+    st.metric("📊 Avg Experience (Years)", kpis["avg_experience_years"])
+
+st.markdown("---")
+
+# ================= VISUALS =================
+col5, col6 = st.columns(2)
+
+with col5:
+    figure_panel(
+        DATA_VERSION, "Job Demand & Market KPIs", "fig1",
+        lambda: backend.histogram_chart(
+            "demand_index",
+            nbins=35,
+            title="Distribution of Market Demand Index"
+        )
+    )
+
+with col6:
+    figure_panel(
+        DATA_VERSION, "Job Demand & Market KPIs", "fig2",
+        lambda: px.scatter(
+            backend.scatter_frame("demand_index", "salary_median_cny", color="experience_years"),
+            x="demand_index",
+            y="salary_median_cny",
+            color="experience_years",
+            title="Relationship Between Demand Index and Salary Levels",
+            opacity=0.7
+        )
+    )
+
+st.markdown("---")
+
+col7, col8 = st.columns(2)
+
+with col7:
+    demand_jobs = backend.rollup("demand_index", "job_openings", "sum")
+    figure_panel(
+        DATA_VERSION, "Job Demand & Market KPIs", "fig3",
+        lambda: px.area(
+            demand_jobs,
+            x="demand_index",
+            y="job_openings",
+            title="Job Openings Across Demand Levels"
+        )
+    )
+
+with col8:
+    demand_trend = backend.rollup("year", "demand_index")
+    figure_panel(
+        DATA_VERSION, "Job Demand & Market KPIs", "fig4",
+        lambda: px.line(
+            demand_trend,
+            x="year",
+            y="demand_index",
+            markers=True,
+            title="Average Demand Index Trend Over Time"
+        )
+    )
+
+st.markdown("---")
+
+figure_panel(
+    DATA_VERSION, "Job Demand & Market KPIs", "fig5",
+    lambda: backend.density_chart(
+        px.density_heatmap,
+        x="experience_years",
+        y="demand_index",
+        title="Density Pattern of Demand Index vs Experience"
+    )
+)
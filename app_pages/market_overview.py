@@ -0,0 +1,94 @@
+# ============================================================
+# MARKET OVERVIEW PAGE
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from figure_cache import figure_panel
+from linked_views import linked_views
+from query_backend import get_backend
+
+backend = get_backend()
+DATA_VERSION = backend.version
+
+st.markdown('<div class="title">📊 Market Overview</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>High-level insights into the job market dynamics</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    figure_panel(
+        DATA_VERSION, "Market Overview", "fig1",
+        lambda: backend.distribution_chart(
+            px.box,
+            y="salary_median_cny",
+            title="Salary Distribution (Median Salary)"
+        )
+    )
+
+with col2:
+    figure_panel(
+        DATA_VERSION, "Market Overview", "fig2",
+        lambda: px.scatter(
+            backend.scatter_frame("demand_index", "job_openings", size="salary_median_cny"),
+            x="demand_index",
+            y="job_openings",
+            size="salary_median_cny",
+            title="Demand Index vs Job Openings",
+            opacity=0.7
+        )
+    )
+
+st.markdown("---")
+
+col3, col4 = st.columns(2)
+
+with col3:
+    yearly_salary = backend.rollup("year", "salary_median_cny")
+    figure_panel(
+        DATA_VERSION, "Market Overview", "fig3",
+        lambda: px.line(
+            yearly_salary,
+            x="year",
+            y="salary_median_cny",
+            markers=True,
+            title="Average Salary Trend Over Years"
+        )
+    )
+
+with col4:
+    yearly_jobs = backend.rollup("year", "job_openings", "sum")
+    figure_panel(
+        DATA_VERSION, "Market Overview", "fig4",
+        lambda: px.area(
+            yearly_jobs,
+            x="year",
+            y="job_openings",
+            title="Total Job Openings Over Time"
+        )
+    )
+
+st.markdown("---")
+
+figure_panel(
+    DATA_VERSION, "Market Overview", "fig5",
+    lambda: backend.histogram_chart(
+        "salary_median_cny",
+        nbins=40,
+        title="Salary Density Distribution"
+    )
+)
+
+st.markdown("---")
+
+st.markdown("### 🔗 Linked Views")
+st.caption(
+    "Drag across the bars of one chart to filter the others; click a bar to select it. "
+    "Selections are computed in your browser, without a page rerun."
+)
+linked_views(DATA_VERSION, backend.rollup, ["year", "demand_index", "experience_years"])
@@ -0,0 +1,74 @@
+# ============================================================
+# FRONT PAGE / OVERVIEW (INTRODUCTORY PAGE)
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from aggregates import rollup
+from data_loader import get_dataset
+from figure_cache import figure_panel
+from filter_state import apply_global_filters
+
+data = apply_global_filters(*get_dataset())
+DATA_VERSION = data.version
+cube = data.cube()
+
+st.markdown('<div class="title">📊 Job Market Analytics Dashboard</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Final Year Project | Professional Data Analytics Application</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📌 Project Introduction
+The Job Market Analytics Dashboard is a professional data-driven application developed
+as a **Final Year Project**. The purpose of this dashboard is to analyze job market trends,
+salary patterns, and demand indicators using real-world data from the Chinese job market.
+
+This project demonstrates the practical use of **Python, Data Visualization, and
+Exploratory Data Analysis (EDA)** techniques to support data-driven decision making.
+""")
+
+st.markdown("""
+### 🎯 Project Objectives
+- To analyze salary trends across different years and experience levels  
+- To study the relationship between demand index and job openings  
+- To visualize hiring patterns using interactive charts  
+- To apply data analytics concepts in a real-world scenario  
+""")
+
+st.markdown("""
+### 📂 Dataset Overview
+The dataset contains structured information related to:
+- Job salaries (minimum, median, maximum)
+- Demand index of skills
+- Number of job openings
+- Experience levels
+- Monthly and yearly trends
+""")
+
+st.markdown("---")
+
+st.markdown("### 📈 Overall Salary Trend (Sample Insight)")
+
+salary_trend = rollup(cube, "year", "salary_median_cny")
+
+figure_panel(
+    DATA_VERSION, "Overview", "fig",
+    lambda: px.line(
+        salary_trend,
+        x="year",
+        y="salary_median_cny",
+        markers=True,
+        title="Average Median Salary Trend Over Time",
+    ),
+    layout=dict(
+        template="plotly_white",
+        xaxis_title="Year",
+        yaxis_title="Average Median Salary (CNY)"
+    )
+)
+
+st.success("📘 This dashboard provides detailed insights in the following sections using interactive analytics.")
@@ -0,0 +1,154 @@
+# ============================================================
+# SALARY & EXPERIENCE ANALYSIS PAGE
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from aggregates import rollup
+from data_loader import get_dataset
+from downsampling import density_chart, distribution_chart, scatter_frame
+from figure_cache import cached_figure, figure_panel
+from filter_state import apply_global_filters
+from linked_views import cube_rollup, linked_views
+from sketches import sketch_box_stats
+from trendline import add_trendlines, ols_fit
+
+data = apply_global_filters(*get_dataset())
+DATA_VERSION = data.version
+cube = data.cube()
+
+st.markdown('<div class="title">💼 Salary & Experience Analysis</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Understanding salary behavior across experience, demand, and time</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Analytical Overview
+This section explores the relationship between **salary levels**, **experience**, and
+**market demand**. By using advanced visualization techniques, this page provides insights
+into how compensation evolves with professional growth and market requirements.
+""")
+
+st.markdown("---")
+
+col1, col2 = st.columns(2)
+
+# The trendline control reruns this panel only, not the other charts.
+@st.fragment
+def experience_trend_panel():
+    trend_by = st.radio("Trendline", ["Overall", "Per year"], horizontal=True)
+    trend_group = "year" if trend_by == "Per year" else None
+
+    # The OLS line comes from the cube's sufficient statistics, so it
+    # fits all rows at O(cube) cost whatever the scatter shows.
+    def build_experience_trend():
+        fig = px.scatter(
+            scatter_frame(data.frame(["experience_years", "salary_median_cny"]), "experience_years", "salary_median_cny"),
+            x="experience_years",
+            y="salary_median_cny",
+            title="Impact of Experience on Median Salary"
+        )
+        fits = ols_fit(cube, "experience_years", "salary_median_cny", by=trend_group)
+        return add_trendlines(fig, fits, by=trend_group)
+
+    fig1 = cached_figure(
+        DATA_VERSION, "Salary & Experience Analysis", "fig1",
+        build_experience_trend,
+        trend_by=trend_by
+    )
+    st.plotly_chart(fig1, use_container_width=True)
+
+
+with col1:
+    experience_trend_panel()
+
+with col2:
+    figure_panel(
+        DATA_VERSION, "Salary & Experience Analysis", "fig2",
+        lambda: px.scatter(
+            scatter_frame(
+                data.frame(["demand_index", "salary_median_cny", "job_openings", "experience_years"]),
+                "demand_index", "salary_median_cny", size="job_openings", color="experience_years"
+            ),
+            x="demand_index",
+            y="salary_median_cny",
+            size="job_openings",
+            color="experience_years",
+            title="Salary Variation by Market Demand & Job Openings",
+            opacity=0.7
+        )
+    )
+
+st.markdown("---")
+
+col3, col4 = st.columns(2)
+
+with col3:
+    figure_panel(
+        DATA_VERSION, "Salary & Experience Analysis", "fig3",
+        lambda: distribution_chart(
+            px.violin,
+            data.frame(["experience_years", "salary_median_cny"]),
+            x="experience_years",
+            y="salary_median_cny",
+            stats=sketch_box_stats(data.sketches(), "salary_median_cny", "experience_years"),
+            box=True,
+            title="Salary Distribution Across Experience Levels"
+        )
+    )
+
+with col4:
+    heatmap_data = rollup(cube, ["year", "experience_years"], "salary_median_cny")
+    figure_panel(
+        DATA_VERSION, "Salary & Experience Analysis", "fig4",
+        lambda: px.density_heatmap(
+            heatmap_data,
+            x="year",
+            y="experience_years",
+            z="salary_median_cny",
+            title="Salary Growth Pattern Over Time & Experience"
+        )
+    )
+
+st.markdown("---")
+
+col5, col6 = st.columns(2)
+
+with col5:
+    figure_panel(
+        DATA_VERSION, "Salary & Experience Analysis", "fig5",
+        lambda: density_chart(
+            px.density_contour,
+            data.frame(["salary_median_cny", "experience_years"]),
+            x="salary_median_cny",
+            y="experience_years",
+            title="Density Distribution of Salary & Experience"
+        )
+    )
+
+with col6:
+    salary_range = rollup(cube, "year", ["salary_min_cny", "salary_max_cny"]).rename(
+        columns={"salary_min_cny": "min_salary", "salary_max_cny": "max_salary"}
+    )
+
+    figure_panel(
+        DATA_VERSION, "Salary & Experience Analysis", "fig6",
+        lambda: px.line(
+            salary_range,
+            x="year",
+            y=["min_salary", "max_salary"],
+            title="Salary Range Volatility Over Time"
+        )
+    )
+
+st.markdown("---")
+
+st.markdown("### 🔗 Linked Views")
+st.caption(
+    "Drag across the bars of one chart to filter the others; click a bar to select it. "
+    "Selections are computed in your browser, without a page rerun."
+)
+linked_views(DATA_VERSION, cube_rollup(cube), ["experience_years", "demand_index", "year"], measure="salary")
@@ -0,0 +1,127 @@
+# ============================================================
+# SKILLS & JOB RECOMMENDATIONS PAGE
+# ============================================================
+import streamlit as st
+import plotly.express as px
+
+from figure_cache import figure_panel
+from query_backend import get_backend
+from recommendations import recommendation_index
+
+backend = get_backend()
+DATA_VERSION = backend.version
+
+st.markdown('<div class="title">💡 Skills & Job Recommendations</div>', unsafe_allow_html=True)
+st.markdown(
+    "<div class='subtitle'>Identify high-demand skills and suitable job roles</div>",
+    unsafe_allow_html=True
+)
+
+st.markdown("---")
+
+st.markdown("""
+### 📘 Page Overview
+This page highlights the most in-demand skills, their associated salaries,
+and provides suggestions for suitable job roles based on market demand
+and experience levels.
+""")
+
+st.markdown("---")
+
+# ================= KPIs =================
+# Demand levels are sorted ascending in the cube, so the last row of
+# each rollup is the top demand level.
+top_demand = backend.total("demand_index", "max")
+top_level = backend.rollup("demand_index", ["salary_median_cny", "experience_years"]).iloc[-1]
+top_jobs = backend.rollup("demand_index", "job_openings", "sum").iloc[-1]["job_openings"]
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("📌 Top Skill Demand Index", top_demand)
+
+with col2:
+    st.metric("💼 Jobs Requiring Top Skill", int(top_jobs))
+
+with col3:
+    st.metric("💰 Avg Salary for Top Skill (CNY)", int(top_level["salary_median_cny"]))
+
+with col4:
+    st.metric("📊 Avg Experience Required", round(top_level["experience_years"], 1))
+
+st.markdown("---")
+
+# ================= VISUALS =================
+col1, col2 = st.columns(2)
+
+# -------- VISUAL 1: Top Skills vs Salary (Bar Chart)
+with col1:
+    top_skills = backend.rollup("demand_index", "salary_median_cny").sort_values(by="demand_index", ascending=False)
+    figure_panel(
+        DATA_VERSION, "Skills & Job Recommendations", "fig1",
+        lambda: px.bar(
+            top_skills,
+            x="demand_index",
+            y="salary_median_cny",
+            text="salary_median_cny",
+            title="Top Skill Demand vs Avg Salary",
+            labels={"demand_index": "Demand Index", "salary_median_cny": "Avg Salary (CNY)"}
+        )
+    )
+
+# -------- VISUAL 2: Experience vs Top Skills (Scatter)
+with col2:
+    figure_panel(
+        DATA_VERSION, "Skills & Job Recommendations", "fig2",
+        lambda: px.scatter(
+            backend.scatter_frame("experience_years", "demand_index", size="job_openings", color="salary_median_cny"),
+            x="experience_years",
+            y="demand_index",
+            size="job_openings",
+            color="salary_median_cny",
+            title="Experience vs Skill Demand & Salary",
+            opacity=0.7,
+            labels={"experience_years": "Experience (Years)", "demand_index": "Demand Index"}
+        )
+    )
+
+st.markdown("---")
+
+# ================= TABLE OF RECOMMENDED JOBS =================
+st.markdown("### 📝 Recommended Jobs Based on High Demand Skills")
+
+index = recommendation_index(backend)
+
+
+# Profile widgets rerun only this panel; ranking reads the precomputed index.
+@st.fragment
+def recommendation_panel():
+    col1, col2, col3 = st.columns(3)
+    experience = col1.slider(
+        "Your Experience (Years)",
+        int(backend.total("experience_years", "min")),
+        int(backend.total("experience_years", "max")),
+        int(backend.total("experience_years", "max")),
+    )
+    min_salary = col2.number_input("Minimum Median Salary (CNY)", min_value=0, value=0, step=1000)
+    limit = col3.number_input("Jobs to Show", min_value=5, max_value=100, value=20, step=5)
+
+    recommended_jobs = index.recommend(experience, min_salary, int(limit))
+    if recommended_jobs.empty:
+        st.info("No high-demand jobs match this profile.")
+        return
+    st.dataframe(recommended_jobs)
+
+
+recommendation_panel()
+
+st.markdown("---")
+
+st.markdown("""
+### 💡 Key Takeaways
+1. Focus on the **highest demand skills** to maximize job opportunities.  
+2. Salaries increase significantly with experience in high-demand roles.  
+3. Prioritize skill development in areas with high demand index.  
+4. Job openings are concentrated among top 25% high-demand skills.  
+5. This insight helps in **career planning and upskilling strategy**.
+""")
@@ -0,0 +1,176 @@
+# ============================================================
+# PAGE RENDER BENCHMARK
+# ============================================================
+# Renders every sidebar page headlessly with streamlit.testing.v1.AppTest
+# against synthetic datasets of increasing size (see synthetic_data.py)
+# and reports, per page:
+#
+#   cold_s         first render (dataset load, cubes, figure builds)
+#   warm_s         a rerun with every cache warm
+#   peak_mb        peak Python/NumPy allocation during the cold render,
+#                  above what earlier pages left cached
+#   figure_bytes   Plotly JSON sent to the browser
+#   table_bytes    Arrow data sent by st.dataframe
+#
+# Results are compared with a stored baseline so regressions show up as
+# diffs:
+#     python benchmark.py                          # 1k, 100k, 1M, 10M rows
+#     python benchmark.py --sizes 1000 100000
+#     python benchmark.py --update-baseline        # rewrite the baseline
+#
+# Timings vary between machines; only compare against a baseline
+# recorded on the same hardware.
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from navigation import PAGES as NAVIGATION
+from synthetic_data import write_parquet
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "app.py")
+BASELINE_PATH = os.path.join(HERE, "benchmark_baseline.json")
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_TOLERANCE = 0.25
+
+# Sidebar pages by title, in navigation order.
+PAGES = {title: path for path, title in NAVIGATION}
+
+METRICS = ["cold_s", "warm_s", "peak_mb", "figure_bytes", "table_bytes"]
+
+
+def write_dataset(rows, directory):
+    path = os.path.join(directory, f"synthetic-{rows}.parquet")
+    if not os.path.exists(path):
+        write_parquet(path, rows)
+    return path
+
+
+def payload_bytes(at):
+    figures = sum(len(chart.proto.spec) for chart in at.get("plotly_chart"))
+    tables = sum(len(table.proto.arrow_data.data) for table in at.dataframe)
+    return figures, tables
+
+
+def render_page(at, page):
+    """Cold and warm render of one page, in the session of ``at``."""
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    at.switch_page(PAGES[page]).run()
+    cold = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+
+    started = time.perf_counter()
+    at.run()
+    warm = time.perf_counter() - started
+
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+    figures, tables = payload_bytes(at)
+    return {
+        "cold_s": round(cold, 3),
+        "warm_s": round(warm, 3),
+        "peak_mb": round((peak - retained) / 2 ** 20, 1),
+        "figure_bytes": figures,
+        "table_bytes": tables,
+    }
+
+
+def run_size(rows, directory, pages, timeout):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["JOB_DATA_PATH"] = write_dataset(rows, directory)
+    # Start every size from empty caches, as a fresh server would.
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    return {page: render_page(at, page) for page in pages}
+
+
+def compare(results, baseline, tolerance):
+    """Lines describing changes against ``baseline``; regressions flagged."""
+    lines, regressions = [], 0
+    for size, pages in results.items():
+        for page, metrics in pages.items():
+            before = baseline.get(size, {}).get(page)
+            if not before:
+                continue
+            for metric in METRICS:
+                old, new = before.get(metric), metrics[metric]
+                if not old or old == new:
+                    continue
+                change = new / old - 1
+                # Ignore jitter on sub-10ms timings.
+                if metric.endswith("_s") and abs(new - old) < 0.01:
+                    continue
+                flag = "REGRESSION" if change > tolerance else ""
+                regressions += bool(flag)
+                lines.append(f"{size:>10} {page:<32} {metric:<13} {old:>12,} -> {new:>12,} ({change:+.0%}) {flag}")
+    return lines, regressions
+
+
+def print_results(results):
+    header = f"{'rows':>10} {'page':<32} " + " ".join(f"{m:>13}" for m in METRICS)
+    print(header)
+    print("-" * len(header))
+    for size, pages in results.items():
+        for page, metrics in pages.items():
+            print(f"{size:>10} {page:<32} " + " ".join(f"{metrics[m]:>13,}" for m in METRICS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page render cost across dataset sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative increase reported as a regression")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "job_dashboard_bench"),
+                        help="where synthetic datasets are cached between runs")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    sys.path.insert(0, HERE)
+    tracemalloc.start()
+
+    results = {}
+    for rows in args.sizes:
+        print(f"rendering {len(args.pages)} pages at {rows:,} rows...", file=sys.stderr)
+        results[str(rows)] = run_size(rows, args.data_dir, args.pages, args.timeout)
+    print_results(results)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+
+    lines, regressions = compare(results, baseline, args.tolerance)
+    if lines:
+        print("\nchanges against baseline:")
+        print("\n".join(lines))
+    print(f"\n{regressions} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
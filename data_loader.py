@@ -0,0 +1,166 @@
+# ============================================================
+# DATASET LOADING LAYER
+# ============================================================
+# Streamlit reruns app.py on every widget interaction. Everything in
+# this module is cached per dataset version so a rerun reuses one
+# in-memory frame instead of re-parsing the input file.
+#
+# Point the dashboard at a real extract with:
+#     JOB_DATA_PATH=/data/china_jobs.parquet streamlit run app.py
+# Supported formats: CSV (optionally gzipped), Parquet and Feather.
+#
+# Or at a partitioned dataset directory that grows by ingestion.py:
+#     JOB_DATA_DIR=/data/jobs streamlit run app.py
+# New parts are picked up at most once per JOB_REFRESH_SECONDS (30).
+#
+# With JOB_SHARED_CACHE_DIR set, the first process to load a dataset
+# version stores it there as an Arrow IPC file; every process then
+# memory-maps that file, so the servers of a node share one copy of the
+# data in the page cache instead of each holding their own. The first
+# load of every version also starts warmup.py in the background (see
+# shared_cache.py). Partitioned datasets are kept in process memory.
+
+import os
+
+import pandas as pd
+import streamlit as st
+
+from ingestion import partitioned_store
+from profiler import profiled
+from schema import apply_schema, footprint, memory_report
+from shared_cache import shared_cache, warm_in_background
+
+DATA_PATH_ENV = "JOB_DATA_PATH"
+DATA_DIR_ENV = "JOB_DATA_DIR"
+REFRESH_SECONDS_ENV = "JOB_REFRESH_SECONDS"
+DEFAULT_REFRESH_SECONDS = 30.0
+SAMPLE_VERSION = "sample"
+
+READERS = {
+    ".csv": pd.read_csv,
+    ".csv.gz": pd.read_csv,
+    ".parquet": pd.read_parquet,
+    ".pq": pd.read_parquet,
+    ".feather": pd.read_feather,
+}
+
+
+def sample_dataset():
+    """Small built-in dataset used when no JOB_DATA_PATH is configured."""
+    return pd.DataFrame({
+        "year": [2019, 2020, 2021, 2022, 2023] * 10,
+        "salary_min_cny": [6000, 6500, 7000, 7500, 8000] * 10,
+        "salary_median_cny": [9000, 9500, 10000, 11000, 12000] * 10,
+        "salary_max_cny": [14000, 15000, 16000, 17000, 18000] * 10,
+        "experience_years": [0, 1, 2, 3, 5] * 10,
+        "demand_index": [60, 65, 70, 75, 80] * 10,
+        "job_openings": [120, 150, 180, 210, 250] * 10
+    })
+
+
+def configured_path():
+    return os.environ.get(DATA_PATH_ENV, "").strip()
+
+
+def configured_dir():
+    return os.environ.get(DATA_DIR_ENV, "").strip()
+
+
+def refresh_seconds():
+    try:
+        return float(os.environ.get(REFRESH_SECONDS_ENV, DEFAULT_REFRESH_SECONDS))
+    except ValueError:
+        return DEFAULT_REFRESH_SECONDS
+
+
+def _partitioned():
+    """The latest snapshot of the partitioned store, or None if it is not configured or empty."""
+    root = configured_dir()
+    if not root:
+        return None
+    store = partitioned_store(root)
+    store.refresh(refresh_seconds())
+    return store.snapshot
+
+
+def reader_for(path):
+    lowered = path.lower()
+    # Longest suffix first so ".csv.gz" wins over ".gz"-less matches.
+    for suffix in sorted(READERS, key=len, reverse=True):
+        if lowered.endswith(suffix):
+            return READERS[suffix]
+    raise ValueError(
+        f"Unsupported dataset format: {path!r} "
+        f"(expected one of {', '.join(sorted(READERS))})"
+    )
+
+
+def dataset_fingerprint(path):
+    """Cache key for a dataset: absolute path + mtime + size.
+
+    Any rewrite of the file changes the fingerprint, which invalidates
+    every cache keyed on it.
+    """
+    if not path:
+        return SAMPLE_VERSION
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+@st.cache_resource(show_spinner="Loading dataset...", max_entries=2)
+def _load(path, fingerprint):
+    shared = shared_cache() if fingerprint != SAMPLE_VERSION else None
+    if shared is not None:
+        df, report = shared.get_frame(fingerprint), shared.get_object("memory_report", fingerprint)
+        if df is not None and report is not None:
+            return df, report
+
+    if fingerprint == SAMPLE_VERSION:
+        df = sample_dataset()
+    else:
+        df = reader_for(path)(path)
+    before = footprint(df)
+    df = apply_schema(df)
+    report = memory_report(before, footprint(df))
+    if shared is not None:
+        shared.put_object("memory_report", fingerprint, report)
+        shared.put_frame(fingerprint, df)
+        # Serve the mapped copy so this process does not keep a private one.
+        df = shared.get_frame(fingerprint)
+    return df, report
+
+
+def load_dataset(path, fingerprint):
+    """Load the dataset behind ``fingerprint`` in the compact schema.
+
+    ``st.cache_resource`` hands every session the same frame without
+    copying it, so callers must treat the result as read-only (columns
+    memory-mapped from the shared cache are read-only arrays).
+    """
+    return _load(path, fingerprint)[0]
+
+
+def load_report(path, fingerprint):
+    """Memory used per column before and after the schema was applied."""
+    return _load(path, fingerprint)[1]
+
+
+@profiled
+def get_dataset():
+    """Return ``(df, version)`` for the configured dataset."""
+    snapshot = _partitioned()
+    if snapshot is not None:
+        warm_in_background(snapshot.version)
+        return snapshot.frame, snapshot.version
+    path = configured_path()
+    version = dataset_fingerprint(path)
+    warm_in_background(version)
+    return load_dataset(path, version), version
+
+
+def get_memory_report():
+    snapshot = _partitioned()
+    if snapshot is not None:
+        return snapshot.report
+    path = configured_path()
+    return load_report(path, dataset_fingerprint(path))
@@ -0,0 +1,211 @@
+# ============================================================
+# SERVER-SIDE DOWNSAMPLING FOR ROW-LEVEL CHARTS
+# ============================================================
+# Scatter, box, violin and density charts serialise every row they are
+# given into the Plotly JSON sent to the browser. Above a fixed point
+# budget the data is reduced here, before the figure is built:
+#
+#   JOB_RENDER_MODE=aggregate  (default) 2D-binned scatters and density
+#                              grids, boxes from precomputed quantiles
+#   JOB_RENDER_MODE=sample     stratified sample per year/experience
+#   JOB_RENDER_MODE=full       send every row (old behaviour)
+#
+#   JOB_MAX_POINTS=5000        point budget per chart
+#
+# Frames at or below the budget are always charted unchanged.
+
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+RENDER_MODE_ENV = "JOB_RENDER_MODE"
+MAX_POINTS_ENV = "JOB_MAX_POINTS"
+RENDER_MODES = ("aggregate", "sample", "full")
+DEFAULT_RENDER_MODE = "aggregate"
+DEFAULT_MAX_POINTS = 5000
+
+SAMPLE_STRATA = ["year", "experience_years"]
+
+
+def render_mode():
+    mode = os.environ.get(RENDER_MODE_ENV, DEFAULT_RENDER_MODE).strip().lower()
+    if mode not in RENDER_MODES:
+        raise ValueError(
+            f"{RENDER_MODE_ENV} must be one of {', '.join(RENDER_MODES)}, got {mode!r}"
+        )
+    return mode
+
+
+def max_points():
+    return int(os.environ.get(MAX_POINTS_ENV, DEFAULT_MAX_POINTS))
+
+
+def needs_reduction(df, mode=None):
+    return (mode or render_mode()) != "full" and len(df) > max_points()
+
+
+# ------------------------------------------------------------
+# Stratified sampling
+# ------------------------------------------------------------
+def stratified_sample(df, limit=None, strata=SAMPLE_STRATA, seed=0):
+    """Sample at most ``limit`` rows, proportionally from every stratum.
+
+    Each non-empty stratum keeps at least one row (while there are no
+    more strata than ``limit``), so rare year / experience combinations
+    stay visible even at tiny sampling rates. Strata columns missing
+    from ``df`` (charts narrow their frames to the plotted columns) are
+    ignored; with none left the sample is uniform.
+    """
+    limit = limit or max_points()
+    if len(df) <= limit:
+        return df
+
+    strata = [column for column in strata if column in df]
+    if strata:
+        codes = df.groupby(strata, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        codes = np.zeros(len(df), dtype=np.int64)
+    sizes = np.bincount(codes)
+
+    # One Bernoulli draw per row at the stratum's rate: O(rows), no sort.
+    rates = np.minimum(1.0, np.maximum(limit / len(df), 1.0 / sizes))
+    rng = np.random.default_rng(seed)
+    keep = rng.random(len(df)) < rates[codes]
+
+    # Strata that drew nothing contribute their first row.
+    drawn = np.bincount(codes[keep], minlength=len(sizes))
+    if (drawn == 0).any():
+        first_rows = pd.Series(codes).drop_duplicates()
+        keep[first_rows.index[drawn[first_rows.to_numpy()] == 0]] = True
+
+    rows = np.flatnonzero(keep)
+    if len(rows) > limit:
+        # Trim to the cap at random, sparing one row per stratum first.
+        rows = rng.permutation(rows)
+        spared = ~pd.Series(codes[rows]).duplicated().to_numpy()
+        rows = np.sort(rows[np.argsort(~spared, kind="stable")[:limit]])
+    return df.iloc[rows]
+
+
+# ------------------------------------------------------------
+# 2D binning
+# ------------------------------------------------------------
+def _bin_codes(values, bins):
+    """Bin index per value plus the centre of every bin.
+
+    Integer columns with fewer distinct levels than ``bins`` keep their
+    exact values, so experience years or demand levels are not smeared.
+    """
+    low, high = values.min(), values.max()
+    if values.dtype.kind in "iu" and high - low < bins:
+        return (values - low).astype(np.int64), np.arange(low, high + 1)
+
+    width = float(high - low) / bins or 1.0
+    codes = ((values - low) // width).astype(np.int64)
+    np.clip(codes, 0, bins - 1, out=codes)
+    return codes, low + (np.arange(bins) + 0.5) * width
+
+
+def binned_points(df, x, y, size=None, color=None, bins=None):
+    """Aggregate rows into an x/y grid, one output row per occupied cell.
+
+    The result keeps the original column names: ``x``/``y`` are cell
+    centres, ``size``/``color`` are cell means and ``rows`` is the number
+    of source rows in the cell.
+    """
+    bins = bins or max(1, int(math.sqrt(max_points())))
+    df = df.dropna(subset=[x, y])
+    x_codes, x_centers = _bin_codes(df[x].to_numpy(), bins)
+    y_codes, y_centers = _bin_codes(df[y].to_numpy(), bins)
+
+    cells = len(x_centers) * len(y_centers)
+    code = x_codes * len(y_centers) + y_codes
+    counts = np.bincount(code, minlength=cells)
+    occupied = np.flatnonzero(counts)
+
+    result = {
+        x: x_centers[occupied // len(y_centers)],
+        y: y_centers[occupied % len(y_centers)],
+        "rows": counts[occupied],
+    }
+    for column in dict.fromkeys(c for c in (size, color) if c and c not in (x, y)):
+        sums = np.bincount(code, weights=df[column].to_numpy(dtype=np.float64), minlength=cells)
+        result[column] = sums[occupied] / counts[occupied]
+    return pd.DataFrame(result)
+
+
+# ------------------------------------------------------------
+# Public helpers used by the pages
+# ------------------------------------------------------------
+def scatter_frame(df, x, y, size=None, color=None, mode=None):
+    """Rows to hand to ``px.scatter`` under the configured render mode."""
+    mode = mode or render_mode()
+    if not needs_reduction(df, mode):
+        return df
+    if mode == "sample":
+        return stratified_sample(df)
+    return binned_points(df, x, y, size=size, color=color)
+
+
+def density_chart(chart, df, x, y, mode=None, **kwargs):
+    """Build ``px.density_contour`` / ``px.density_heatmap`` on reduced data.
+
+    In aggregate mode the chart receives pre-binned counts and sums them
+    instead of counting raw rows itself.
+    """
+    mode = mode or render_mode()
+    if not needs_reduction(df, mode):
+        return chart(df, x=x, y=y, **kwargs)
+    if mode == "sample":
+        return chart(stratified_sample(df), x=x, y=y, **kwargs)
+    return chart(binned_points(df, x, y), x=x, y=y, z="rows", histfunc="sum", **kwargs)
+
+
+def box_stats(df, y, x=None):
+    """Quartiles, mean and Tukey-style fences of ``y`` (per ``x`` level)."""
+    keys = df[x] if x else np.zeros(len(df), dtype=np.int8)
+    grouped = df[y].groupby(keys, sort=True)
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats = pd.DataFrame({
+        "q1": quartiles[0.25], "median": quartiles[0.5], "q3": quartiles[0.75],
+        "min": grouped.min(), "max": grouped.max(), "mean": grouped.mean(),
+    })
+    iqr = stats["q3"] - stats["q1"]
+    # Whiskers stop at 1.5 IQR or the data range, whichever is tighter.
+    stats["lowerfence"] = np.maximum(stats["min"], stats["q1"] - 1.5 * iqr)
+    stats["upperfence"] = np.minimum(stats["max"], stats["q3"] + 1.5 * iqr)
+    return stats
+
+
+def quantile_box_figure(stats, y, x=None, title=None):
+    """Box plot drawn from precomputed ``box_stats`` instead of raw rows."""
+    box = go.Box(
+        q1=stats["q1"], median=stats["median"], q3=stats["q3"],
+        lowerfence=stats["lowerfence"], upperfence=stats["upperfence"],
+        mean=stats["mean"],
+        x=stats.index if x else None,
+        name=y,
+    )
+    fig = go.Figure(box)
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+def distribution_chart(chart, df, y, x=None, mode=None, stats=None, **kwargs):
+    """Build ``px.box`` / ``px.violin``, reduced to the point budget.
+
+    Aggregate mode draws a box from precomputed quantiles (a violin's
+    kernel density needs raw rows, so it degrades to its inner box);
+    pass ``stats`` (e.g. from sketches.sketch_box_stats) to skip the scan.
+    """
+    mode = mode or render_mode()
+    if not needs_reduction(df, mode):
+        return chart(df, x=x, y=y, **kwargs)
+    if mode == "sample":
+        return chart(stratified_sample(df), x=x, y=y, **kwargs)
+    if stats is None:
+        stats = box_stats(df, y, x)
+    return quantile_box_figure(stats, y, x=x, title=kwargs.get("title"))
@@ -0,0 +1,176 @@
+# ============================================================
+# ON-DEMAND DATASET EXPORT
+# ============================================================
+# Exports are only generated when someone clicks a download button. The
+# frame is written in row chunks straight to a file on disk, so a large
+# dataset is never held in memory as one big str plus its bytes copy.
+# Files are named after the dataset version and reused by later clicks,
+# sessions and server processes until the dataset changes. Each write
+# prunes the folder down to the JOB_EXPORT_KEEP (16) most recently used
+# exports, so old versions and filter combinations do not pile up.
+#
+# Set JOB_EXPORT_DIR to choose where exports are kept (defaults to a
+# folder in the system temp directory).
+
+import glob
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from profiler import profiled
+
+EXPORT_DIR_ENV = "JOB_EXPORT_DIR"
+EXPORT_KEEP_ENV = "JOB_EXPORT_KEEP"
+DEFAULT_EXPORT_KEEP = 16
+# Partial files older than this were left by a writer that died.
+STALE_PARTIAL_SECONDS = 3600
+EXPORT_CHUNK_ROWS = 100_000
+EXPORT_BASENAME = "job_market_data"
+
+# Label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+# One lock per export file: concurrent clicks on the same export wait
+# for a single writer, while different exports are written in parallel.
+_export_locks = {}
+_export_locks_guard = threading.Lock()
+
+
+def export_dir():
+    path = os.environ.get(EXPORT_DIR_ENV) or os.path.join(
+        tempfile.gettempdir(), "job_dashboard_exports"
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def export_keep():
+    try:
+        return max(1, int(os.environ.get(EXPORT_KEEP_ENV, DEFAULT_EXPORT_KEEP)))
+    except ValueError:
+        return DEFAULT_EXPORT_KEEP
+
+
+def prune_exports(directory, keep, current=None):
+    """Delete all but the ``keep`` most recently used exports in ``directory``.
+
+    ``current`` is never deleted. Returns the paths removed.
+    """
+    exports, partials = [], []
+    cutoff = time.time() - STALE_PARTIAL_SECONDS
+    for path in glob.glob(os.path.join(directory, f"{EXPORT_BASENAME}-*")):
+        try:
+            used = os.path.getmtime(path)
+        except OSError:
+            continue
+        if path.endswith(".partial"):
+            if used < cutoff:
+                partials.append(path)
+        elif path != current:
+            exports.append((used, path))
+    exports.sort(reverse=True)
+    stale = [path for _, path in exports[max(0, keep - (current is not None)):]] + partials
+    removed = []
+    for path in stale:
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError:
+            pass
+    return removed
+
+
+def _export_lock(path):
+    with _export_locks_guard:
+        return _export_locks.setdefault(path, threading.Lock())
+
+
+def export_file_name(export_format):
+    extension, _ = EXPORT_FORMATS[export_format]
+    return f"{EXPORT_BASENAME}.{extension}"
+
+
+def _chunks(df, rows, chunk_rows):
+    """``df`` (or its ``rows`` positions) in consecutive chunks of rows."""
+    total = len(df) if rows is None else len(rows)
+    for start in range(0, total, chunk_rows):
+        if rows is None:
+            yield df.iloc[start:start + chunk_rows]
+        else:
+            yield df.take(rows[start:start + chunk_rows])
+
+
+def _write_csv(df, handle, chunk_rows, rows=None):
+    df.iloc[:0].to_csv(handle, index=False)
+    for chunk in _chunks(df, rows, chunk_rows):
+        chunk.to_csv(handle, header=False, index=False)
+
+
+def _write_parquet(df, path, chunk_rows, rows=None):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in _chunks(df, rows, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_export(df, path, export_format, chunk_rows=EXPORT_CHUNK_ROWS, rows=None):
+    """Write ``df`` (or its ``rows`` positions) to ``path``, one chunk at a time."""
+    if export_format == "CSV":
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            _write_csv(df, handle, chunk_rows, rows)
+    elif export_format == "CSV (gzip)":
+        with gzip.open(path, "wt", newline="", encoding="utf-8") as handle:
+            _write_csv(df, handle, chunk_rows, rows)
+    elif export_format == "Parquet":
+        _write_parquet(df, path, chunk_rows, rows)
+    else:
+        raise ValueError(f"Unsupported export format: {export_format!r}")
+
+
+def export_path(df, version, export_format, rows=None):
+    """Path of the export for this dataset version, writing it if needed.
+
+    With ``rows``, only those positions of ``df`` are exported; the
+    version must identify that subset.
+    """
+    extension, _ = EXPORT_FORMATS[export_format]
+    digest = hashlib.sha1(version.encode("utf-8")).hexdigest()[:16]
+    path = os.path.join(export_dir(), f"{EXPORT_BASENAME}-{digest}.{extension}")
+
+    with _export_lock(path):
+        if os.path.exists(path):
+            # Mark it recently used, so pruning keeps it.
+            os.utime(path)
+        else:
+            # Write under a temporary name and rename, so another process
+            # never picks up a half-written file.
+            partial = f"{path}.{os.getpid()}.partial"
+            write_export(df, partial, export_format, rows=rows)
+            os.replace(partial, path)
+            removed = prune_exports(os.path.dirname(path), export_keep(), current=path)
+            with _export_locks_guard:
+                for stale in removed:
+                    _export_locks.pop(stale, None)
+    return path
+
+
+@profiled
+def export_bytes(df, version, export_format, rows=None):
+    """Contents of the cached export; used as a deferred download callable."""
+    try:
+        with open(export_path(df, version, export_format, rows), "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        # Pruned by another writer between the check and the read.
+        with open(export_path(df, version, export_format, rows), "rb") as handle:
+            return handle.read()
@@ -0,0 +1,143 @@
+# ============================================================
+# FIGURE MEMOIZATION
+# ============================================================
+# Building a Plotly Express figure (and re-applying the layout template)
+# on every rerun is wasted work when neither the data nor the widget
+# state changed. Figures are memoized per
+#     (dataset version, page, chart id, filter values)
+# in one process-wide LRU cache bounded by JOB_FIGURE_CACHE_MB.
+# st.plotly_chart still encodes the spec it sends, but a hit skips the
+# data preparation, Plotly Express construction and layout update.
+#
+# Cached figures are shared between sessions and must not be modified
+# after they are returned.
+#
+# figure_panel draws a cached chart in place. Charts own no widgets, so
+# they are not fragments themselves: the pages wrap only the regions
+# whose controls should rerun alone (forecast controls, trendline radio,
+# tables), and a chart inside such a region redraws with it.
+#
+# With JOB_SHARED_CACHE_DIR set, a miss is first looked up in the shared
+# on-disk cache (filled by warmup.py and by other server processes), and
+# figures built here are written back to it.
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import streamlit as st
+
+from profiler import span
+from shared_cache import shared_cache
+
+FIGURE_CACHE_MB_ENV = "JOB_FIGURE_CACHE_MB"
+DEFAULT_FIGURE_CACHE_MB = 256
+DEFAULT_LAYOUT = {"template": "plotly_white"}
+# Items of a string array whose lengths are averaged for its size estimate.
+SIZE_SAMPLE = 256
+
+
+def _json_size(value):
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "biuf":
+            # Numeric arrays are sent base64-encoded.
+            return value.nbytes * 4 // 3 + 32
+        items = value.ravel()
+        sample = items[::max(1, len(items) // SIZE_SAMPLE)]
+        return len(items) * sum(len(str(item)) + 3 for item in sample) // max(1, len(sample))
+    if isinstance(value, dict):
+        return sum(len(str(key)) + 4 + _json_size(item) for key, item in value.items()) + 2
+    if isinstance(value, (list, tuple)):
+        return sum(_json_size(item) + 1 for item in value) + 2
+    return len(str(value)) + 2
+
+
+def figure_nbytes(fig):
+    """Approximate size of ``fig``'s JSON spec, without serializing it."""
+    return _json_size(fig.to_plotly_json())
+
+
+class FigureCache:
+    """Thread-safe LRU of figures, bounded by their estimated serialized size."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock so slow figures don't block other sessions.
+        fig = build()
+        nbytes = figure_nbytes(fig)
+        if nbytes > self.max_bytes:
+            return fig
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (fig, nbytes)
+                self.total_bytes += nbytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+@st.cache_resource(show_spinner=False)
+def figure_cache():
+    """The process-wide cache, shared by every session."""
+    limit_mb = float(os.environ.get(FIGURE_CACHE_MB_ENV, DEFAULT_FIGURE_CACHE_MB))
+    return FigureCache(int(limit_mb * 1024 * 1024))
+
+
+def cached_figure(version, page, chart_id, build, layout=None, **filters):
+    """Return the figure for this chart, building it only on a cache miss.
+
+    ``build`` is a zero-argument callable returning a Plotly figure; the
+    ``layout`` (plotly_white template by default) is applied once, before
+    the figure is cached. Widget values the figure depends on are passed
+    as keyword ``filters`` and become part of the key.
+    """
+    key = (version, page, chart_id, tuple(sorted(filters.items())))
+
+    def build_with_layout():
+        shared = shared_cache()
+        if shared is not None:
+            with span("figure", f"{chart_id} shared"):
+                fig = shared.get_figure(key)
+            if fig is not None:
+                return fig
+        with span("figure", f"{chart_id} build"):
+            fig = build()
+            fig.update_layout(**(DEFAULT_LAYOUT if layout is None else layout))
+        if shared is not None:
+            shared.put_figure(key, fig)
+        return fig
+
+    return figure_cache().get_or_build(key, build_with_layout)
+
+
+def figure_panel(version, page, chart_id, build, layout=None, **filters):
+    """Draw ``cached_figure(...)`` with ``st.plotly_chart``."""
+    with span("chart", chart_id):
+        fig = cached_figure(version, page, chart_id, build, layout, **filters)
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,124 @@
+# ============================================================
+# COLUMNAR INDEX FOR RANGE FILTERS
+# ============================================================
+# The Filters page asks for rows where several columns are >= a slider
+# threshold. Instead of building a boolean mask over the full frame on
+# every slider move, each filter column is sorted once per dataset
+# version. A threshold then becomes one binary search, and the row sets
+# are intersected starting from the most selective column.
+
+import math
+
+import numpy as np
+import streamlit as st
+
+from profiler import profiled
+
+FILTER_COLUMNS = ("experience_years", "salary_median_cny", "demand_index")
+
+
+class SortedColumnIndex:
+    """Sort permutation plus per-row rank for one numeric column."""
+
+    def __init__(self, values):
+        values = np.asarray(values)
+        # int32 positions halve memory traffic for anything below 2**31 rows.
+        position_dtype = np.int32 if len(values) < 2 ** 31 else np.int64
+        self.order = np.argsort(values, kind="stable").astype(position_dtype)
+        self.sorted_values = values[self.order]
+        self.rank = np.empty(len(values), dtype=position_dtype)
+        self.rank[self.order] = np.arange(len(values), dtype=position_dtype)
+        # NaNs sort to the end and never satisfy a threshold.
+        if values.dtype.kind == "f":
+            self.valid = int(len(values) - np.isnan(values).sum())
+        else:
+            self.valid = len(values)
+
+    def first_at_least(self, threshold):
+        """Position in sorted order of the first value >= ``threshold``."""
+        dtype = self.sorted_values.dtype
+        if dtype.kind in "iu":
+            # Compare in the column's own dtype: a mixed-type searchsorted
+            # would upcast (copy) the whole sorted array on every call.
+            threshold = math.ceil(threshold)
+            limits = np.iinfo(dtype)
+            if threshold <= limits.min:
+                return 0
+            if threshold > limits.max:
+                return self.valid
+        key = np.asarray(threshold, dtype=dtype)
+        return int(np.searchsorted(self.sorted_values[:self.valid], key, side="left"))
+
+    def count_at_least(self, threshold):
+        return self.valid - self.first_at_least(threshold)
+
+
+class FilterIndex:
+    """Answers conjunctions of ``column >= threshold`` over a frame."""
+
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.size = len(df)
+        self.columns = {
+            column: SortedColumnIndex(df[column].to_numpy()) for column in columns
+        }
+
+    @profiled
+    def rows_at_least(self, thresholds):
+        """Sorted row positions where every ``column >= value`` holds.
+
+        ``thresholds`` maps column name to its minimum value. The result
+        can be passed straight to ``df.iloc``.
+        """
+        bounds = {
+            column: self.columns[column].first_at_least(value)
+            for column, value in thresholds.items()
+        }
+        # A threshold at or below a column's minimum keeps every valid row.
+        bounds = {
+            column: start for column, start in bounds.items()
+            if start > 0 or self.columns[column].valid < self.size
+        }
+        if not bounds:
+            return np.arange(self.size)
+
+        # Enumerate the smallest candidate set, then check the others by
+        # rank, so the work is proportional to the selective column only.
+        driver = min(bounds, key=lambda column: self.columns[column].valid - bounds[column])
+        index = self.columns[driver]
+        if (index.valid - bounds[driver]) * 8 > self.size:
+            return self._scan(bounds)
+        rows = index.order[bounds[driver]:index.valid]
+
+        for column, start in bounds.items():
+            if column == driver:
+                continue
+            other = self.columns[column]
+            rank = other.rank[rows]
+            rows = rows[(rank >= start) & (rank < other.valid)]
+
+        # Restore frame order. For large selections a bitmap pass is
+        # cheaper than sorting the row ids.
+        if len(rows) * 16 > self.size:
+            keep = np.zeros(self.size, dtype=bool)
+            keep[rows] = True
+            return np.flatnonzero(keep)
+        return np.sort(rows)
+
+    def _scan(self, bounds):
+        # Nothing is selective: one sequential pass over the rank arrays
+        # beats gathering millions of random positions.
+        keep = np.ones(self.size, dtype=bool)
+        for column, start in bounds.items():
+            rank = self.columns[column].rank
+            if start:
+                keep &= rank >= start
+            if self.columns[column].valid < self.size:
+                keep &= rank < self.columns[column].valid
+        return np.flatnonzero(keep)
+
+
+@profiled
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_filter_index(_df, version, columns=FILTER_COLUMNS):
+    """Build the index for ``_df`` once per dataset ``version``."""
+    return FilterIndex(_df, columns)
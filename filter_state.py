@@ -0,0 +1,183 @@
+# ============================================================
+# GLOBAL FILTERS SHARED BY EVERY PAGE
+# ============================================================
+# The minimum experience / salary / demand thresholds live in
+# st.session_state, so they follow the user from page to page. The
+# sliders sit in a sidebar st.form: moving them reruns nothing, and
+# "Apply" triggers a single rerun with the new thresholds.
+#
+# The filtered view is computed once per (dataset version, thresholds)
+# and cached. It gets its own version string, so cubes, figures, sort
+# orders and exports built from it are cached per filter combination
+# exactly like those of the full dataset.
+#
+# Only the positions of the matching rows are cached - 4 bytes per row,
+# shared by every session with the same filters - never a copied frame.
+# A FilteredDataset pairs them with the shared dataset: the cube and
+# sketch builders, sort orders and exports read the rows through the
+# positions, tables copy out only the visible page, and frame() copies
+# the matching rows for a chart being built on a cache miss.
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from aggregates import build_cube, total
+from filter_index import FILTER_COLUMNS, build_filter_index
+from pagination import page_slice, sort_permutation
+from profiler import profiled
+from sketches import build_sketches
+
+FILTER_STATE_KEY = "global_filters"
+FILTER_FORM_KEY = "global_filters_form"
+
+FILTER_LABELS = {
+    "experience_years": "Minimum Experience (Years)",
+    "salary_median_cny": "Minimum Median Salary (CNY)",
+    "demand_index": "Minimum Demand Index",
+}
+
+
+def _widget_key(column):
+    return f"filter_{column}"
+
+
+def filter_bounds(total_of):
+    """Slider ``(low, high)`` per filter column from a ``total``-like callable."""
+    return {
+        column: (int(total_of(column, "min")), int(total_of(column, "max")))
+        for column in FILTER_COLUMNS
+    }
+
+
+def active_filters(bounds):
+    """Applied thresholds that actually exclude rows, clamped to ``bounds``."""
+    applied = st.session_state.get(FILTER_STATE_KEY, {})
+    active = {}
+    for column, (low, high) in bounds.items():
+        value = min(max(applied.get(column, low), low), high)
+        if value > low:
+            active[column] = value
+    return active
+
+
+def _apply_form():
+    st.session_state[FILTER_STATE_KEY] = {
+        column: st.session_state[_widget_key(column)] for column in FILTER_COLUMNS
+    }
+
+
+def _reset_form():
+    st.session_state[FILTER_STATE_KEY] = {}
+    for column in FILTER_COLUMNS:
+        st.session_state.pop(_widget_key(column), None)
+
+
+def filter_form(bounds):
+    """Render the sidebar filter form and return the active thresholds.
+
+    The applied values are kept under their own session key rather than
+    in the widget keys, which Streamlit drops on pages without the form.
+    """
+    active = active_filters(bounds)
+    with st.sidebar.form(FILTER_FORM_KEY):
+        st.markdown("### ⚡ Global Filters")
+        for column, (low, high) in bounds.items():
+            st.slider(
+                FILTER_LABELS[column], low, high, active.get(column, low),
+                key=_widget_key(column),
+            )
+        apply, reset = st.columns(2)
+        apply.form_submit_button("Apply", on_click=_apply_form, type="primary")
+        reset.form_submit_button("Reset", on_click=_reset_form)
+    return active
+
+
+def filter_suffix(thresholds):
+    """Version suffix identifying a set of thresholds ('' for none)."""
+    if not thresholds:
+        return ""
+    return "|min:" + ",".join(f"{column}>={value}" for column, value in sorted(thresholds.items()))
+
+
+class FilteredDataset:
+    """The rows of ``source`` passing the global filters, as positions.
+
+    ``rows`` holds the sorted positions of the matching rows, or None
+    when every row matches. Cheap to create on every rerun.
+    """
+
+    def __init__(self, source, version, rows=None):
+        self.source = source
+        self.version = version
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.source) if self.rows is None else len(self.rows)
+
+    @property
+    def columns(self):
+        return self.source.columns
+
+    def frame(self, columns=None):
+        """The matching rows (of ``columns`` only, if given) as a frame.
+
+        Unfiltered, this is the dataset itself. Filtered, the rows are
+        copied: call it where the result is cached, not on every rerun.
+        """
+        if self.rows is None:
+            return self.source if columns is None else self.source[list(columns)]
+        if columns is None:
+            return self.source.take(self.rows)
+        return pd.DataFrame({column: self.source[column].take(self.rows) for column in columns})
+
+    def cube(self):
+        return build_cube(self.source, self.version, self.rows)
+
+    def sketches(self):
+        return build_sketches(self.source, self.version, self.rows)
+
+    def sort_permutation(self, column, ascending=True):
+        """Positions of the matching rows ordered by ``column``."""
+        return sort_permutation(self.source, self.version, column, ascending, self.rows)
+
+    def page(self, page_number, page_size, permutation=None):
+        """The rows shown on one table page, copied from the dataset."""
+        return page_slice(self.source, page_number, page_size, self.rows if permutation is None else permutation)
+
+
+@st.cache_resource(show_spinner="Filtering...", max_entries=8)
+def _filtered_rows(_df, version, thresholds):
+    rows = build_filter_index(_df, version).rows_at_least(dict(thresholds))
+    rows = rows.astype(np.int32 if len(_df) < 2 ** 31 else np.int64)
+    # Shared by every session with these filters.
+    rows.flags.writeable = False
+    return rows
+
+
+def filter_dataset(df, version, thresholds):
+    """The :class:`FilteredDataset` of rows meeting every ``column >= value``.
+
+    With no thresholds it holds every row, under the dataset's own
+    version. Used without the form by api.py.
+    """
+    if not thresholds:
+        return FilteredDataset(df, version)
+    rows = _filtered_rows(df, version, tuple(sorted(thresholds.items())))
+    return FilteredDataset(df, version + filter_suffix(thresholds), rows)
+
+
+@profiled
+def apply_global_filters(df, version):
+    """Render the filter form and return the :class:`FilteredDataset`.
+
+    With no active filter it holds every row, under the dataset's own
+    version.
+    """
+    cube = build_cube(df, version)
+    thresholds = filter_form(filter_bounds(lambda column, stat: total(cube, column, stat)))
+    filtered = filter_dataset(df, version, thresholds)
+    if not len(filtered):
+        st.sidebar.warning("No rows match these filters; showing the full dataset.")
+        return FilteredDataset(df, version)
+    return filtered
@@ -0,0 +1,255 @@
+# ============================================================
+# VECTORIZED FORECASTING ENGINE
+# ============================================================
+# Every segment (e.g. experience level x demand bucket) is one row of a
+# (series x years) matrix, and each model is fitted to all rows at once
+# with NumPy. Only the short loop over years in Holt's method is Python
+# level, so thousands of segment series fit in milliseconds.
+#
+# Models
+#   Linear trend    least-squares line through the observed years
+#   Holt            double exponential smoothing; alpha / beta picked per
+#                   series from a grid by one-step-ahead squared error
+#   Seasonal naive  repeats the last season (season length 1 = naive)
+#
+# Prediction intervals assume normally distributed errors.
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from aggregates import rollup
+from profiler import profiled
+
+MODELS = ("Linear trend", "Holt", "Seasonal naive")
+
+HOLT_ALPHAS = np.linspace(0.1, 0.9, 9)
+HOLT_BETAS = np.linspace(0.05, 0.5, 10)
+
+
+# ------------------------------------------------------------
+# Series panels
+# ------------------------------------------------------------
+def series_panel(cube, by, column, stat="mean"):
+    """Segments of the cube as a (series x years) matrix.
+
+    Returns ``(keys, years, values)`` where ``keys`` holds the segment
+    labels (one row per series) and missing years are NaN.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    frame = rollup(cube, by + ["year"], column, stat)
+    years = np.sort(frame["year"].unique())
+    if by:
+        wide = frame.pivot_table(index=by, columns="year", values=column, aggfunc="first")
+        wide = wide.reindex(columns=years)
+        keys = wide.index.to_frame(index=False)
+        values = wide.to_numpy(dtype=np.float64)
+    else:
+        keys = pd.DataFrame(index=[0])
+        values = frame.set_index("year")[column].reindex(years).to_numpy(dtype=np.float64)[None, :]
+    return keys, years, values
+
+
+# ------------------------------------------------------------
+# Linear trend
+# ------------------------------------------------------------
+def fit_linear(values, years):
+    observed = ~np.isnan(values)
+    t = np.broadcast_to(years.astype(np.float64), values.shape)
+    y = np.where(observed, values, 0.0)
+
+    n = observed.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    t_mean = np.where(observed, t, 0.0).sum(axis=1) / safe_n
+    y_mean = y.sum(axis=1) / safe_n
+    dt = np.where(observed, t - t_mean[:, None], 0.0)
+    sxx = (dt ** 2).sum(axis=1)
+    sxy = (dt * (y - y_mean[:, None])).sum(axis=1)
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+    intercept = y_mean - slope * t_mean
+
+    residuals = np.where(observed, values - (intercept[:, None] + slope[:, None] * t), 0.0)
+    dof = n - 2
+    sigma = np.sqrt(np.divide(
+        (residuals ** 2).sum(axis=1), dof, out=np.full(len(n), np.nan), where=dof > 0
+    ))
+    return {"slope": slope, "intercept": intercept, "sigma": sigma,
+            "n": n, "t_mean": t_mean, "sxx": sxx}
+
+
+def forecast_linear(params, future_years):
+    t = future_years.astype(np.float64)[None, :]
+    mean = params["intercept"][:, None] + params["slope"][:, None] * t
+    n = np.maximum(params["n"], 1)[:, None]
+    leverage = np.divide(
+        (t - params["t_mean"][:, None]) ** 2, params["sxx"][:, None],
+        out=np.zeros(mean.shape), where=params["sxx"][:, None] > 0,
+    )
+    spread = params["sigma"][:, None] * np.sqrt(1 + 1 / n + leverage)
+    return mean, spread
+
+
+# ------------------------------------------------------------
+# Holt's linear exponential smoothing
+# ------------------------------------------------------------
+def _holt_pass(values, alpha, beta):
+    """Run Holt's recursions for every (parameter set, series) pair.
+
+    ``alpha`` / ``beta`` have shape (grid, 1); states have shape
+    (grid, series). A series starts at its first observed year and
+    missing years only advance the trend.
+    """
+    shape = (alpha.shape[0], values.shape[0])
+    level = np.full(shape, np.nan)
+    trend = np.zeros(shape)
+    sse = np.zeros(shape)
+    count = np.zeros(shape)
+
+    for step in range(values.shape[1]):
+        y = values[:, step][None, :]
+        observed = ~np.isnan(y)
+        started = ~np.isnan(level)
+        predicted = level + trend
+        update = observed & started
+
+        error = np.where(update, y - predicted, 0.0)
+        sse += error ** 2
+        count += update
+
+        new_level = alpha * y + (1 - alpha) * predicted
+        new_trend = beta * (new_level - level) + (1 - beta) * trend
+        trend = np.where(update, new_trend, trend)
+        level = np.where(update, new_level, np.where(started, predicted, level))
+        level = np.where(observed & ~started, y, level)
+
+    return level, trend, sse, count
+
+
+def fit_holt(values, alphas=HOLT_ALPHAS, betas=HOLT_BETAS):
+    grid_alpha, grid_beta = (g.ravel()[:, None] for g in np.meshgrid(alphas, betas))
+    level, trend, sse, count = _holt_pass(values, grid_alpha, grid_beta)
+
+    best = np.argmin(np.where(count > 0, sse, np.inf), axis=0)
+    series = np.arange(values.shape[0])
+    best_count = count[best, series]
+    sigma = np.sqrt(np.divide(
+        sse[best, series], best_count, out=np.full(len(series), np.nan), where=best_count > 0
+    ))
+    return {"level": level[best, series], "trend": trend[best, series],
+            "alpha": grid_alpha[best, 0], "beta": grid_beta[best, 0], "sigma": sigma}
+
+
+def forecast_holt(params, horizon):
+    steps = np.arange(1, horizon + 1)[None, :]
+    mean = params["level"][:, None] + steps * params["trend"][:, None]
+    alpha = params["alpha"][:, None]
+    beta = params["beta"][:, None]
+    # Var(h) = sigma^2 * (1 + sum_{j=1}^{h-1} alpha^2 (1 + j beta)^2)
+    j = np.arange(horizon)[None, :]
+    terms = np.where(j > 0, alpha ** 2 * (1 + j * beta) ** 2, 0.0)
+    spread = params["sigma"][:, None] * np.sqrt(1 + np.cumsum(terms, axis=1))
+    return mean, spread
+
+
+# ------------------------------------------------------------
+# Seasonal naive
+# ------------------------------------------------------------
+def fit_seasonal_naive(values, season_length=1):
+    filled = pd.DataFrame(values).ffill(axis=1).to_numpy()
+    last_season = filled[:, -season_length:]
+    residuals = values[:, season_length:] - values[:, :-season_length]
+    observed = ~np.isnan(residuals)
+    count = observed.sum(axis=1)
+    squared = np.where(observed, residuals, 0.0) ** 2
+    sigma = np.sqrt(np.divide(
+        squared.sum(axis=1), count, out=np.full(len(count), np.nan), where=count > 0
+    ))
+    return {"last_season": last_season, "sigma": sigma, "season_length": season_length}
+
+
+def forecast_seasonal_naive(params, horizon):
+    season_length = params["season_length"]
+    steps = np.arange(horizon)
+    mean = params["last_season"][:, steps % season_length]
+    spread = params["sigma"][:, None] * np.sqrt(steps // season_length + 1)[None, :]
+    return mean, spread
+
+
+# ------------------------------------------------------------
+# Cached fitting + forecasting
+# ------------------------------------------------------------
+def fit_all(values, years, season_length=1):
+    return {
+        "Linear trend": fit_linear(values, years),
+        "Holt": fit_holt(values),
+        "Seasonal naive": fit_seasonal_naive(values, season_length),
+    }
+
+
+@profiled
+@st.cache_data(show_spinner=False, max_entries=32)
+def fit_panel(_cube, version, by, column, stat="mean"):
+    """Fit every model to every segment series; cached per dataset version."""
+    keys, years, values = series_panel(_cube, list(by), column, stat)
+    return {"keys": keys, "years": years, "values": values,
+            "params": fit_all(values, years)}
+
+
+def rollup_panel(frame, column):
+    """The single-series panel of a ``by=["year"]`` rollup (see fit_panel).
+
+    For callers holding a query backend rather than a cube.
+    """
+    frame = frame.sort_values("year")
+    years = frame["year"].to_numpy()
+    values = frame[column].to_numpy(dtype=np.float64)[None, :]
+    return {"keys": pd.DataFrame(index=[0]), "years": years, "values": values,
+            "params": fit_all(values, years)}
+
+
+@profiled
+def forecast(panel, model, horizon=1, level=0.95):
+    """Long-format forecasts: segment keys, year, forecast, lower, upper."""
+    if model not in MODELS:
+        raise ValueError(f"Unknown forecasting model: {model!r}")
+    years = panel["years"]
+    future_years = years[-1] + np.arange(1, horizon + 1)
+    params = panel["params"][model]
+
+    if model == "Linear trend":
+        mean, spread = forecast_linear(params, future_years)
+    elif model == "Holt":
+        mean, spread = forecast_holt(params, horizon)
+    else:
+        mean, spread = forecast_seasonal_naive(params, horizon)
+
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    keys = panel["keys"].loc[panel["keys"].index.repeat(horizon)].reset_index(drop=True)
+    return keys.assign(
+        year=np.tile(future_years, len(panel["keys"])),
+        forecast=mean.ravel(),
+        lower=(mean - z * spread).ravel(),
+        upper=(mean + z * spread).ravel(),
+    )
+
+
+def history_with_forecast(history, forecasts, column, bridge=True):
+    """Historical series plus forecasts in one frame for charting.
+
+    Columns: ``year``, ``value``, ``series`` (Historical / Forecast) and
+    ``error_plus`` / ``error_minus`` for the interval error bars. With
+    ``bridge`` the forecast line starts at the last historical point so
+    the two lines connect (leave it off for bar charts).
+    """
+    past = history[["year", column]].rename(columns={column: "value"})
+    past = past.assign(series="Historical", error_plus=0.0, error_minus=0.0)
+    future = forecasts.assign(
+        value=forecasts["forecast"],
+        series="Forecast",
+        error_plus=forecasts["upper"] - forecasts["forecast"],
+        error_minus=forecasts["forecast"] - forecasts["lower"],
+    )[past.columns]
+    parts = [past, past.tail(1).assign(series="Forecast")] if bridge else [past]
+    return pd.concat(parts + [future], ignore_index=True)
@@ -0,0 +1,268 @@
+# ============================================================
+# INCREMENTAL INGESTION INTO PARTITIONED PARQUET
+# ============================================================
+# New postings arrive as batches. Each batch is appended to a dataset
+# directory laid out by year and month:
+#
+#     <root>/year=2024/month=05/part-<timestamp>-<id>.parquet
+#
+# Part files are written once and never modified, so the dashboard only
+# has to read the files it has not seen yet. PartitionedStore keeps the
+# rows loaded so far plus the aggregate cube and quantile sketches, and
+# on refresh reads just the new parts, appends them and merges the cube
+# and sketches of the new rows into the existing ones instead of
+# re-aggregating everything. The rows live in column buffers with spare
+# capacity, so appending copies the new rows rather than every row
+# loaded so far.
+#
+# Point the dashboard at a dataset directory with:
+#     JOB_DATA_DIR=/data/jobs streamlit run app.py
+# and append a batch with:
+#     python ingestion.py postings.csv --root /data/jobs
+# With JOB_SHARED_CACHE_DIR set, the batch is followed by a cache
+# warm-up of the new dataset version (see warmup.py; --no-warm skips it).
+
+import argparse
+import glob
+import os
+import threading
+import time
+import uuid
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from aggregates import compute_cube, merge_cubes, register_cube
+from schema import apply_schema, footprint, memory_report
+from sketches import compute_sketches, merge_sketches, register_sketches
+
+PART_PATTERN = os.path.join("year=*", "month=*", "part-*.parquet")
+
+
+# ------------------------------------------------------------
+# Writing
+# ------------------------------------------------------------
+def partition_dir(root, year, month):
+    return os.path.join(root, f"year={int(year)}", f"month={int(month):02d}")
+
+
+def _write_part(df, directory):
+    os.makedirs(directory, exist_ok=True)
+    name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+    path = os.path.join(directory, name)
+    # Readers only glob finished *.parquet names; never expose a partial file.
+    partial = f"{path}.partial"
+    df.to_parquet(partial, index=False)
+    os.replace(partial, path)
+    return path
+
+
+def ingest(batch, root, month=None):
+    """Append ``batch`` to the partitioned dataset under ``root``.
+
+    Rows are split by ``year`` and by month: the batch's ``month``
+    column if it has one, else ``month``, else the current month.
+    Returns the paths of the part files written.
+    """
+    if "year" not in batch.columns:
+        raise ValueError("Batch has no 'year' column to partition by")
+    if "month" in batch.columns:
+        months = batch["month"]
+    else:
+        months = pd.Series(month or date.today().month, index=batch.index)
+
+    written = []
+    for (year, batch_month), rows in batch.groupby([batch["year"], months], sort=True):
+        written.append(_write_part(rows, partition_dir(root, year, batch_month)))
+    return written
+
+
+# ------------------------------------------------------------
+# Incremental loading
+# ------------------------------------------------------------
+def _concat(frames):
+    """Concatenate frames, keeping categoricals categorical."""
+    frames = [frame for frame in frames if frame is not None and len(frame)]
+    if len(frames) == 1:
+        return frames[0]
+    for column in frames[0].columns:
+        dtypes = [frame[column].dtype for frame in frames if column in frame]
+        if all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            categories = pd.api.types.union_categoricals(
+                [frame[column] for frame in frames if column in frame]
+            ).categories
+            frames = [
+                frame.assign(**{column: frame[column].cat.set_categories(categories)})
+                if column in frame else frame
+                for frame in frames
+            ]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _codes_dtype(categories):
+    for dtype in (np.int8, np.int16, np.int32):
+        if len(categories) < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class FrameBuffer:
+    """The rows appended so far, in column buffers with room to grow.
+
+    A column's buffer doubles when full, so an append copies the new rows
+    (amortized) instead of the whole frame. The frames returned are views
+    of the filled prefix, which later appends never write to. Categorical
+    columns keep their codes in the buffer and only ever add categories at
+    the end, so codes already written stay valid. Columns with any other
+    dtype fall back to concatenating whole frames.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.frame = None
+        self._buffers = {}
+        self._categories = {}
+
+    def _bufferable(self, delta):
+        if self._buffers is None:
+            return False
+        if self.frame is not None and list(delta.columns) != list(self.frame.columns):
+            return False
+        return all(
+            isinstance(dtype, (np.dtype, pd.CategoricalDtype)) for dtype in delta.dtypes
+        )
+
+    def _put(self, column, values, dtype, rows):
+        buffer = self._buffers.get(column)
+        if buffer is None or buffer.dtype != dtype or len(buffer) < rows:
+            grown = np.empty(rows if buffer is None else max(rows, 2 * len(buffer)), dtype=dtype)
+            if buffer is not None:
+                grown[:self.rows] = buffer[:self.rows]
+            buffer = self._buffers[column] = grown
+        buffer[self.rows:rows] = values
+        return buffer[:rows]
+
+    def append(self, delta):
+        """Append ``delta`` and return the frame of every row so far."""
+        if not self._bufferable(delta):
+            self._buffers = None
+            self.frame = _concat([self.frame, delta])
+            self.rows = len(self.frame)
+            return self.frame
+
+        rows = self.rows + len(delta)
+        columns = {}
+        for column in delta.columns:
+            series = delta[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                known = self._categories.get(column, series.cat.categories[:0])
+                categories = known.append(series.cat.categories.difference(known, sort=False))
+                self._categories[column] = categories
+                codes = series.cat.codes.to_numpy()
+                mapped = np.where(codes >= 0, categories.get_indexer(series.cat.categories)[codes], -1)
+                codes = self._put(column, mapped, _codes_dtype(categories), rows)
+                columns[column] = pd.Categorical.from_codes(codes, categories=categories, validate=False)
+            else:
+                buffer = self._buffers.get(column)
+                dtype = series.dtype if buffer is None else np.result_type(buffer.dtype, series.dtype)
+                columns[column] = self._put(column, series.to_numpy(), dtype, rows)
+        self.rows = rows
+        self.frame = pd.DataFrame(columns, copy=False)
+        return self.frame
+
+
+# Everything a reader needs from one refresh, published in a single assignment.
+Snapshot = namedtuple("Snapshot", "frame version cube sketches report")
+
+
+class PartitionedStore:
+    """Rows, aggregate cube and sketches of a partitioned dataset, updated in place.
+
+    Each refresh that finds new parts publishes a new :data:`Snapshot` as
+    ``snapshot`` (None until the first part is loaded). Readers take
+    ``store.snapshot`` once and use its fields, so they never pair the
+    frame of one refresh with the version of another.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.snapshot = None
+        self._rows = FrameBuffer()
+        self._before = None
+        self.loaded = set()
+        self.last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def new_parts(self):
+        parts = glob.glob(os.path.join(self.root, PART_PATTERN))
+        return sorted(part for part in parts if part not in self.loaded)
+
+    def refresh(self, min_interval=0.0):
+        """Load parts written since the last refresh; return how many.
+
+        Checks the directory at most once per ``min_interval`` seconds.
+        """
+        with self._lock:
+            if self.snapshot is not None and time.monotonic() - self.last_refresh < min_interval:
+                return 0
+            self.last_refresh = time.monotonic()
+            parts = self.new_parts()
+            if not parts:
+                return 0
+
+            delta = pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+            before = footprint(delta)
+            if self._before is not None:
+                before = before.assign(bytes=before["bytes"].add(self._before["bytes"], fill_value=0))
+            delta = apply_schema(delta)
+            delta_cube = compute_cube(delta)
+            delta_sketches = compute_sketches(delta)
+
+            previous = self.snapshot
+            frame = self._rows.append(delta)
+            cube = delta_cube if previous is None else merge_cubes(previous.cube, delta_cube)
+            sketches = delta_sketches if previous is None else merge_sketches(previous.sketches, delta_sketches)
+            report = memory_report(before, footprint(frame))
+
+            self.loaded.update(parts)
+            version = f"partitions:{self.root}:{len(self.loaded)}:{os.path.basename(parts[-1])}"
+            register_cube(version, cube)
+            register_sketches(version, sketches)
+            self._before = before
+            self.snapshot = Snapshot(frame, version, cube, sketches, report)
+            return len(parts)
+
+
+@st.cache_resource(show_spinner="Loading dataset...")
+def partitioned_store(root):
+    """The process-wide store for the dataset directory ``root``."""
+    return PartitionedStore(root)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append a batch of postings to a partitioned dataset.")
+    parser.add_argument("batch", help="CSV, Parquet or Feather file with the new rows")
+    parser.add_argument("--root", required=True, help="dataset directory")
+    parser.add_argument("--month", type=int, help="month for rows without a 'month' column")
+    parser.add_argument("--no-warm", action="store_true", help="skip the shared cache warm-up")
+    args = parser.parse_args(argv)
+
+    from data_loader import DATA_DIR_ENV, reader_for
+    from shared_cache import shared_cache_dir
+
+    batch = reader_for(args.batch)(args.batch)
+    for path in ingest(batch, args.root, args.month):
+        print(path)
+
+    if shared_cache_dir() and not args.no_warm:
+        from warmup import warm
+
+        os.environ[DATA_DIR_ENV] = args.root
+        warm()
+
+
+if __name__ == "__main__":
+    main()
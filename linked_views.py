@@ -0,0 +1,123 @@
+# ============================================================
+# LINKED VIEWS (CLIENT-SIDE CROSS-FILTERING)
+# ============================================================
+# Exploring a segment used to mean moving the sidebar sliders and
+# waiting for a server rerun per move. The linked views instead ship
+# the cube rolled up to
+#     year x experience_years x demand bucket (LINKED_DEMAND_WIDTH wide)
+# with postings, openings and salary sums per cell - a few thousand
+# cells whatever the dataset size - once per page render. One bar chart
+# per dimension is drawn in the browser (linked_views.html, plain SVG,
+# no library): brushing a range in one chart filters the others and the
+# summary line, without any message to the server.
+#
+# The cells come from the page's rollup function (a cube or a query
+# backend), so they follow the global filters and are cached per
+# dataset version like every other aggregate.
+
+import json
+import os
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+
+from aggregates import demand_buckets, rollup
+from profiler import profiled
+
+LINKED_DIMENSIONS = {
+    "year": "Year",
+    "experience_years": "Experience (years)",
+    "demand_index": "Demand index",
+}
+LINKED_DEMAND_WIDTH = 5
+LINKED_VIEWS_HEIGHT = 300
+
+# Measures the charts can show: (label, sum column, count column or None).
+# A count column turns the measure into a mean.
+LINKED_MEASURES = {
+    "postings": ("Job postings", "postings", None),
+    "openings": ("Job openings", "openings", None),
+    "salary": ("Avg median salary (CNY)", "salary_sum", "salary_count"),
+}
+VALUE_COLUMNS = ["postings", "openings", "salary_sum", "salary_count"]
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linked_views.html")
+
+
+def compute_linked_cells(rollup_fn):
+    """Cells of the linked views from ``rollup_fn(by, columns, stat)`` (uncached).
+
+    Postings are counted on ``job_openings``: the dimension columns
+    themselves cannot be counted through a rollup that groups on them.
+    """
+    by = list(LINKED_DIMENSIONS)
+    sums = rollup_fn(by, ["job_openings", "salary_median_cny"], "sum")
+    counts = rollup_fn(by, ["job_openings", "salary_median_cny"], "count")
+    cells = sums.merge(counts, on=by, suffixes=("_sum", "_count")).rename(columns={
+        "job_openings_count": "postings",
+        "job_openings_sum": "openings",
+        "salary_median_cny_sum": "salary_sum",
+        "salary_median_cny_count": "salary_count",
+    })
+    cells["demand_index"] = demand_buckets(cells["demand_index"], LINKED_DEMAND_WIDTH)
+    cells = cells.groupby(by, as_index=False, sort=True)[VALUE_COLUMNS].sum()
+    return cells[cells["postings"] > 0].reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _linked_cells(_rollup_fn, version):
+    return compute_linked_cells(_rollup_fn)
+
+
+def _labels(column, levels):
+    if column == "demand_index" and LINKED_DEMAND_WIDTH > 1:
+        return [f"{int(low)}–{int(low) + LINKED_DEMAND_WIDTH - 1}" for low in levels]
+    return [str(int(level)) for level in levels]
+
+
+def linked_payload(cells, dimensions, measure="postings"):
+    """JSON-ready cells rolled up to ``dimensions``, with level codes and labels."""
+    view = cells.groupby(list(dimensions), as_index=False, sort=True)[VALUE_COLUMNS].sum()
+    payload = {"dimensions": [], "codes": [], "values": {}, "measure": measure}
+    for column in dimensions:
+        codes, levels = pd.factorize(view[column], sort=True)
+        payload["dimensions"].append({"key": column, "title": LINKED_DIMENSIONS[column], "labels": _labels(column, levels)})
+        payload["codes"].append(codes.tolist())
+    for column in VALUE_COLUMNS:
+        # Whole numbers keep the JSON small; a yuan per cell does not move the means.
+        payload["values"][column] = view[column].round().astype("int64").tolist()
+    payload["measures"] = [
+        {"key": key, "label": label, "sum": total, "count": count}
+        for key, (label, total, count) in LINKED_MEASURES.items()
+    ]
+    return payload
+
+
+@st.cache_resource(show_spinner=False)
+def _template():
+    with open(TEMPLATE_PATH, encoding="utf-8") as handle:
+        return handle.read()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _linked_html(_rollup_fn, version, dimensions, measure):
+    payload = json.dumps(linked_payload(_linked_cells(_rollup_fn, version), dimensions, measure), separators=(",", ":"))
+    # The payload sits inside a <script> element.
+    return _template().replace("__PAYLOAD__", payload.replace("</", "<\\/"))
+
+
+def cube_rollup(cube):
+    """A ``rollup_fn`` for pages that hold a cube rather than a backend."""
+    return partial(rollup, cube)
+
+
+@profiled
+def linked_views(version, rollup_fn, dimensions=tuple(LINKED_DIMENSIONS), measure="postings",
+                 height=LINKED_VIEWS_HEIGHT):
+    """Draw cross-filtered bar charts of ``dimensions`` for dataset ``version``.
+
+    ``rollup_fn(by, columns, stat)`` is ``backend.rollup`` or
+    ``cube_rollup(cube)``; it is called once per version.
+    """
+    st.iframe(_linked_html(rollup_fn, version, tuple(dimensions), measure), height=height)
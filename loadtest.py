@@ -0,0 +1,496 @@
+# ============================================================
+# CONCURRENT-USER LOAD TEST
+# ============================================================
+# Starts one or more `streamlit run app.py` server processes and drives
+# them with N simulated browser sessions over Streamlit's websocket
+# protocol (the protobuf BackMsg / ForwardMsg the frontend exchanges).
+# Each session, with a short think time between actions:
+#
+#   page       switches to a sidebar page (navigation.PAGES, shuffled)
+#   filter     on Filters, moves the sidebar sliders and presses Apply
+#              (or Reset), which reruns the page with the new thresholds
+#   download   on Data View, clicks the download button: the server
+#              builds the export, then the file is fetched over HTTP
+#
+# and reports the p50 / p95 / p99 latency of each action - a rerun is
+# timed from the message leaving the client to the script finishing -
+# plus CPU and resident memory per server process (read from /proc, so
+# Linux only). Sessions are spread round-robin over the servers, as a
+# load balancer with sticky sessions would.
+#
+#     python loadtest.py --sessions 20 --duration 60
+#     python loadtest.py --sessions 40 --servers 2 --rows 1000000
+#     python loadtest.py --output run.json --baseline loadtest_run.json
+#
+# Without --rows the servers load the dataset configured in this
+# environment (JOB_DATA_PATH / JOB_DATA_DIR); every JOB_* variable is
+# passed through. Each server first renders every page once, so the
+# measured actions hit warm caches unless --no-warmup is given.
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+
+from navigation import PAGES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "app.py")
+
+DEFAULT_PORT = 8600
+DEFAULT_TOLERANCE = 0.25
+PERCENTILES = (50, 95, 99)
+SAMPLE_SECONDS = 0.5
+
+FILTERS_PAGE = "Filters"
+DATA_VIEW_PAGE = "Data View"
+APPLY_LABEL, RESET_LABEL = "Apply", "Reset"
+
+# ForwardMsg.ScriptFinishedStatus values that end a rerun.
+FINISHED_WITH_COMPILE_ERROR = 1
+FINISHED_EARLY_FOR_RERUN = 2
+
+
+# ------------------------------------------------------------
+# Server processes
+# ------------------------------------------------------------
+def start_servers(count, base_port, env):
+    servers = []
+    for port in range(base_port, base_port + count):
+        command = [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ]
+        process = subprocess.Popen(command, cwd=HERE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        servers.append((port, process))
+    return servers
+
+
+def wait_until_healthy(port, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server on port {port} exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"server on port {port} not healthy after {timeout:.0f}s")
+
+
+def stop_servers(servers):
+    for _, process in servers:
+        process.terminate()
+    for _, process in servers:
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def process_usage(pid):
+    """``(cpu seconds, rss MB, peak rss MB)`` of ``pid``, from /proc."""
+    with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+        # Fields after the parenthesised command name; utime and stime are 14 and 15.
+        fields = handle.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    memory = {}
+    with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+        for line in handle:
+            name, _, value = line.partition(":")
+            if name in ("VmRSS", "VmHWM"):
+                memory[name] = int(value.split()[0]) / 1024
+    return cpu, memory.get("VmRSS", 0.0), memory.get("VmHWM", 0.0)
+
+
+class UsageMonitor:
+    """CPU and RSS of each server process over the measured window."""
+
+    def __init__(self, servers):
+        self.servers = servers
+        self.started = {}
+        self.peak_rss = {}
+
+    def _sample(self):
+        usage = {}
+        for port, process in self.servers:
+            try:
+                usage[port] = process_usage(process.pid)
+            except (OSError, IndexError, ValueError):
+                continue
+            self.peak_rss[port] = max(self.peak_rss.get(port, 0.0), usage[port][1])
+        return usage
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.started = self._sample()
+
+    async def run(self):
+        while True:
+            self._sample()
+            await asyncio.sleep(SAMPLE_SECONDS)
+
+    def report(self):
+        elapsed = time.perf_counter() - self.start_time
+        usage = self._sample()
+        rows = []
+        for port, process in self.servers:
+            if port not in usage:
+                rows.append({"port": port, "pid": process.pid})
+                continue
+            cpu, rss, _ = usage[port]
+            cpu_s = cpu - self.started.get(port, (cpu,))[0]
+            rows.append({
+                "port": port,
+                "pid": process.pid,
+                "cpu_s": round(cpu_s, 2),
+                "cpu_percent": round(100 * cpu_s / elapsed, 1),
+                "rss_mb": round(rss, 1),
+                "peak_rss_mb": round(self.peak_rss[port], 1),
+            })
+        return rows
+
+
+# ------------------------------------------------------------
+# Simulated browser sessions
+# ------------------------------------------------------------
+class Session:
+    """One browser tab connected to a server over the websocket protocol."""
+
+    def __init__(self, port, timeout):
+        self.port = port
+        self.timeout = timeout
+        self.session_id = None
+        self.pages = {}
+        self.page_hash = ""
+        self.widgets = {}
+        self.download_id = None
+        self.requests = 0
+
+    async def __aenter__(self):
+        import websockets
+
+        self.socket = await websockets.connect(
+            f"ws://127.0.0.1:{self.port}/_stcore/stream",
+            subprotocols=["streamlit"],
+            max_size=None,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.socket.close()
+
+    async def _receive(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = ForwardMsg()
+        message.ParseFromString(await asyncio.wait_for(self.socket.recv(), self.timeout))
+        return message
+
+    async def rerun(self, page=None, widget_states=()):
+        """Rerun the script; return ``(seconds, error or None)``.
+
+        Widgets that are not in ``widget_states`` take their defaults,
+        as in a browser that has not touched them.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        if page is not None:
+            self.page_hash = self.pages[page]
+        message = BackMsg()
+        message.rerun_script.page_script_hash = self.page_hash
+        message.rerun_script.widget_states.widgets.extend(widget_states)
+
+        started = time.perf_counter()
+        await self.socket.send(message.SerializeToString())
+        self.widgets, self.download_id, error = {}, None, None
+        while True:
+            reply = await self._receive()
+            kind = reply.WhichOneof("type")
+            if kind == "new_session" and reply.new_session.initialize.session_id:
+                self.session_id = reply.new_session.initialize.session_id
+            elif kind == "navigation":
+                self.pages = {p.page_name: p.page_script_hash for p in reply.navigation.app_pages}
+                self.page_hash = reply.navigation.page_script_hash
+            elif kind == "delta" and reply.delta.WhichOneof("type") == "new_element":
+                self._collect(reply.delta.new_element)
+                if reply.delta.new_element.WhichOneof("type") == "exception":
+                    error = error or reply.delta.new_element.exception.message
+            elif kind == "script_finished" and reply.script_finished != FINISHED_EARLY_FOR_RERUN:
+                if reply.script_finished == FINISHED_WITH_COMPILE_ERROR:
+                    error = error or "compile error"
+                return time.perf_counter() - started, error
+
+    def _collect(self, element):
+        kind = element.WhichOneof("type")
+        if kind in ("slider", "button"):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = widget
+        elif kind == "download_button" and element.download_button.deferred_file_id:
+            self.download_id = element.download_button.deferred_file_id
+
+    def filter_states(self, rng):
+        """Widget states moving every slider and pressing Apply (or Reset)."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        states = []
+        button = self.widgets[RESET_LABEL if rng.random() < 0.25 else APPLY_LABEL]
+        for slider in self.widgets.values():
+            if slider.DESCRIPTOR.name != "Slider":
+                continue
+            # Quarter steps over the lower half of the range, so sessions
+            # share filter combinations as real users tend to.
+            value = slider.min + (slider.max - slider.min) * rng.randrange(3) / 4
+            state = WidgetState(id=slider.id)
+            state.double_array_value.data.append(round(value))
+            states.append(state)
+        states.append(WidgetState(id=button.id, trigger_value=True))
+        return states
+
+    async def download(self):
+        """Click the download button and fetch the file; return ``(seconds, error)``."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        if self.download_id is None:
+            return 0.0, "no download button"
+        self.requests += 1
+        request_id = f"loadtest-{self.requests}"
+        message = BackMsg()
+        message.backend_operation_request.request_id = request_id
+        message.backend_operation_request.session_id = self.session_id
+        message.backend_operation_request.deferred_file.file_id = self.download_id
+
+        started = time.perf_counter()
+        await self.socket.send(message.SerializeToString())
+        while True:
+            reply = await self._receive()
+            if reply.WhichOneof("type") != "backend_operation_response":
+                continue
+            response = reply.backend_operation_response
+            if response.request_id == request_id:
+                break
+        if response.error_msg:
+            return time.perf_counter() - started, response.error_msg
+        url = f"http://127.0.0.1:{self.port}{response.deferred_file.url}"
+        await asyncio.to_thread(lambda: urllib.request.urlopen(url, timeout=self.timeout).read())
+        return time.perf_counter() - started, None
+
+
+async def warm_server(port, timeout):
+    """Render every page once in a throwaway session."""
+    async with Session(port, timeout) as session:
+        await session.rerun()
+        for _, page in PAGES:
+            await session.rerun(page)
+
+
+async def warm_servers(servers, timeout):
+    await asyncio.gather(*(warm_server(port, timeout) for port, _ in servers))
+
+
+async def run_session(number, port, deadline, think, timeout, samples):
+    """Browse the dashboard until ``deadline``, appending to ``samples``."""
+    rng = random.Random(number)
+    pages = [page for _, page in PAGES]
+    async with Session(port, timeout) as session:
+        await session.rerun()
+        while time.monotonic() < deadline:
+            rng.shuffle(pages)
+            for page in pages:
+                if time.monotonic() >= deadline:
+                    return
+                seconds, error = await session.rerun(page)
+                samples.append(("page", page, seconds, error))
+                await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+                if page == FILTERS_PAGE:
+                    seconds, error = await session.rerun(widget_states=session.filter_states(rng))
+                    samples.append(("filter", page, seconds, error))
+                elif page == DATA_VIEW_PAGE:
+                    seconds, error = await session.download()
+                    samples.append(("download", page, seconds, error))
+                else:
+                    continue
+                await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+
+
+async def drive(servers, sessions, duration, ramp, think, timeout):
+    monitor = UsageMonitor(servers)
+    monitor.start()
+    sampler = asyncio.create_task(monitor.run())
+    samples = []
+    deadline = time.monotonic() + ramp + duration
+
+    async def delayed(number):
+        await asyncio.sleep(ramp * number / max(sessions, 1))
+        port = servers[number % len(servers)][0]
+        try:
+            await run_session(number, port, deadline, think, timeout, samples)
+        except Exception as error:
+            samples.append(("session", "", 0.0, f"{type(error).__name__}: {error}"))
+
+    try:
+        await asyncio.gather(*(delayed(number) for number in range(sessions)))
+    finally:
+        sampler.cancel()
+    return samples, monitor.report()
+
+
+# ------------------------------------------------------------
+# Reporting
+# ------------------------------------------------------------
+def latency_summary(seconds, errors):
+    summary = {"count": len(seconds) + errors, "errors": errors}
+    if seconds:
+        for p, value in zip(PERCENTILES, np.percentile(seconds, PERCENTILES)):
+            summary[f"p{p}_s"] = round(float(value), 3)
+        summary["max_s"] = round(max(seconds), 3)
+    return summary
+
+
+def summarize(samples, key):
+    groups = {}
+    for sample in samples:
+        timings, errors = groups.setdefault(key(sample), ([], []))
+        if sample[3]:
+            errors.append(sample[3])
+        else:
+            timings.append(sample[2])
+    return {name: latency_summary(timings, len(errors)) for name, (timings, errors) in groups.items()}
+
+
+def print_table(title, rows):
+    columns = ["count", "errors"] + [f"p{p}_s" for p in PERCENTILES] + ["max_s"]
+    header = f"{title:<32} " + " ".join(f"{c:>9}" for c in columns)
+    print(header)
+    print("-" * len(header))
+    for name, summary in rows.items():
+        print(f"{name:<32} " + " ".join(f"{summary.get(c, '-'):>9}" for c in columns))
+    print()
+
+
+def print_processes(processes):
+    columns = ["pid", "cpu_s", "cpu_percent", "rss_mb", "peak_rss_mb"]
+    header = f"{'server':<32} " + " ".join(f"{c:>11}" for c in columns)
+    print(header)
+    print("-" * len(header))
+    for process in processes:
+        print(f"{':' + str(process['port']):<32} " + " ".join(f"{process.get(c, '-'):>11}" for c in columns))
+
+
+def compare(results, baseline, tolerance):
+    """Lines describing changes against ``baseline``; regressions flagged."""
+    pairs = [
+        (f"{action} {metric}", old.get(metric), results["latency"].get(action, {}).get(metric))
+        for action, old in baseline.get("latency", {}).items()
+        for metric in [f"p{p}_s" for p in PERCENTILES]
+    ]
+    for before, after in zip(baseline.get("processes", []), results["processes"]):
+        for metric in ("cpu_percent", "peak_rss_mb"):
+            pairs.append((f":{after['port']} {metric}", before.get(metric), after.get(metric)))
+
+    lines, regressions = [], 0
+    for name, old, new in pairs:
+        if not old or new is None or old == new:
+            continue
+        change = new / old - 1
+        flag = "REGRESSION" if change > tolerance else ""
+        regressions += bool(flag)
+        lines.append(f"{name:<32} {old:>10,} -> {new:>10,} ({change:+.0%}) {flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure rerun latency under concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent browser sessions")
+    parser.add_argument("--servers", type=int, default=1, help="server processes to start")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port of the first server")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load after ramp-up")
+    parser.add_argument("--ramp", type=float, default=10, help="seconds over which sessions connect")
+    parser.add_argument("--think", type=float, default=1.0, help="mean pause between actions, seconds")
+    parser.add_argument("--timeout", type=float, default=300, help="seconds before an action fails")
+    parser.add_argument("--rows", type=int, help="serve a synthetic dataset of this many rows")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "job_dashboard_bench"),
+                        help="where synthetic datasets are cached between runs")
+    parser.add_argument("--no-warmup", action="store_true", help="measure from cold caches")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare with results written by --output")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative increase reported as a regression")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    if args.rows:
+        from benchmark import write_dataset
+
+        os.makedirs(args.data_dir, exist_ok=True)
+        env["JOB_DATA_PATH"] = write_dataset(args.rows, args.data_dir)
+
+    servers = start_servers(args.servers, args.port, env)
+    try:
+        for port, process in servers:
+            wait_until_healthy(port, process, args.timeout)
+        if not args.no_warmup:
+            print(f"warming {len(servers)} server(s)...", file=sys.stderr)
+            asyncio.run(warm_servers(servers, args.timeout))
+        print(f"running {args.sessions} sessions for {args.ramp + args.duration:.0f}s...", file=sys.stderr)
+        samples, processes = asyncio.run(
+            drive(servers, args.sessions, args.duration, args.ramp, args.think, args.timeout)
+        )
+    finally:
+        stop_servers(servers)
+
+    results = {
+        "config": {
+            "sessions": args.sessions,
+            "servers": args.servers,
+            "duration": args.duration,
+            "think": args.think,
+            "rows": args.rows,
+        },
+        # Page switches and filter changes together, as "rerun".
+        "latency": {
+            **summarize(samples, lambda s: s[0]),
+            **summarize([s for s in samples if s[0] in ("page", "filter")], lambda s: "rerun"),
+        },
+        "pages": summarize([s for s in samples if s[0] == "page"], lambda s: s[1]),
+        "processes": processes,
+    }
+
+    print_table("action", results["latency"])
+    print_table("page", results["pages"])
+    print_processes(processes)
+    failures = sorted({s[3] for s in samples if s[3]})
+    if failures:
+        print("\nerrors:")
+        print("\n".join(f"  {message[:200]}" for message in failures))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+            handle.write("\n")
+
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            lines, regressions = compare(results, json.load(handle), args.tolerance)
+        if lines:
+            print("\nchanges against baseline:")
+            print("\n".join(lines))
+        print(f"\n{regressions} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+# ============================================================
+# SIDEBAR PAGES
+# ============================================================
+# The pages of the dashboard, in sidebar order, as (script, title).
+# app.py builds st.navigation from this list; the benchmark, the load
+# test and the cache warm-up iterate over it.
+
+PAGES = (
+    ("app_pages/overview.py", "Overview"),
+    ("app_pages/market_overview.py", "Market Overview"),
+    ("app_pages/salary_experience.py", "Salary & Experience Analysis"),
+    ("app_pages/job_demand_kpis.py", "Job Demand & Market KPIs"),
+    ("app_pages/forecasting.py", "Advanced Insights & Forecasting"),
+    ("app_pages/skills_recommendations.py", "Skills & Job Recommendations"),
+    ("app_pages/filters.py", "Filters"),
+    ("app_pages/data_view.py", "Data View"),
+    ("app_pages/conclusion.py", "Conclusion & Insights"),
+)
@@ -0,0 +1,56 @@
+# ============================================================
+# SERVER-SIDE PAGINATION FOR THE DATA VIEW TABLE
+# ============================================================
+# Only the visible page of rows is sent to st.dataframe. Sorting uses a
+# permutation computed once per (dataset version, column, direction) and
+# cached, so flipping pages never re-sorts the frame.
+
+import math
+
+import pandas as pd
+import streamlit as st
+
+from profiler import profiled
+
+PAGE_SIZES = [20, 50, 100, 500]
+
+
+@profiled
+@st.cache_resource(show_spinner="Sorting...", max_entries=8)
+def sort_permutation(_df, version, column, ascending=True, _rows=None):
+    """Row positions of ``_df`` ordered by ``column`` (stable, NaNs last).
+
+    With ``_rows`` only those positions are ordered; ``version`` must
+    identify that subset.
+    """
+    values = _df[column].to_numpy()
+    positions = pd.Series(values if _rows is None else values[_rows])
+    ordered = positions.sort_values(ascending=ascending, kind="stable", na_position="last")
+    order = ordered.index.to_numpy()
+    return order if _rows is None else _rows[order]
+
+
+def page_count(total_rows, page_size):
+    return max(1, math.ceil(total_rows / page_size))
+
+
+@profiled
+def page_slice(df, page_number, page_size, permutation=None):
+    """Rows shown on 1-based ``page_number``, in ``permutation`` order.
+
+    ``permutation`` may list only some rows of ``df`` (e.g. the filtered
+    ones); the pages then cover those rows.
+    """
+    start = (page_number - 1) * page_size
+    stop = min(start + page_size, len(df) if permutation is None else len(permutation))
+    if permutation is None:
+        return df.iloc[start:stop]
+    return df.iloc[permutation[start:stop]]
+
+
+def row_range(total_rows, page_number, page_size):
+    """1-based first/last row numbers shown on a page, for captions."""
+    if not total_rows:
+        return 0, 0
+    start = (page_number - 1) * page_size
+    return start + 1, min(start + page_size, total_rows)
@@ -0,0 +1,212 @@
+# ============================================================
+# OPT-IN RENDER PROFILER
+# ============================================================
+# Times the data steps, figure builds and element calls of a script run
+# and shows them in a sidebar panel, so the slow chart on a page can be
+# found in production. Off by default; enable it for every session with
+#     JOB_PROFILE=1 streamlit run app.py
+# or for one browser tab by opening the app with ?profile=1.
+#
+# Recorded spans
+#   data     functions decorated with @profiled (loading, cubes, rollups,
+#            filters, forecasts, sorting, backend queries)
+#   chart    one figure_panel: figure lookup / build plus its element
+#   figure   Plotly figure construction on a figure-cache miss
+#   element  st.plotly_chart / st.dataframe calls, with payload bytes
+#
+# Element time covers serialising the payload and queueing it for the
+# browser; the websocket send itself is asynchronous and not included.
+# Each profiled run is appended as one JSON line to JOB_PROFILE_LOG
+# (default: job_dashboard_profile.jsonl in the system temp directory).
+# Fragment reruns are not profiled.
+
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+PROFILE_ENV = "JOB_PROFILE"
+PROFILE_LOG_ENV = "JOB_PROFILE_LOG"
+PROFILE_QUERY_PARAM = "profile"
+
+_TRUTHY = ("1", "true", "yes", "on")
+
+# The profiler of the script run executing on this thread, if any.
+_active = threading.local()
+_log_lock = threading.Lock()
+_install_lock = threading.Lock()
+_installed = False
+
+
+def profiling_enabled():
+    if os.environ.get(PROFILE_ENV, "").strip().lower() in _TRUTHY:
+        return True
+    return str(st.query_params.get(PROFILE_QUERY_PARAM, "")).strip().lower() in _TRUTHY
+
+
+def profile_log_path():
+    return os.environ.get(PROFILE_LOG_ENV) or os.path.join(
+        tempfile.gettempdir(), "job_dashboard_profile.jsonl"
+    )
+
+
+class RunProfile:
+    """Spans recorded during one script run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = []
+        self.depth = 0
+
+    def add(self, kind, name, seconds, nbytes=None):
+        self.spans.append({
+            "kind": kind, "name": name, "depth": self.depth,
+            "seconds": round(seconds, 6), "bytes": nbytes,
+        })
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def current():
+    return getattr(_active, "profile", None)
+
+
+@contextmanager
+def span(kind, name):
+    """Time the enclosed block if this run is being profiled."""
+    profile = current()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    # Record at the position the span started, so nesting reads top-down.
+    index = len(profile.spans)
+    profile.depth += 1
+    try:
+        yield
+    finally:
+        profile.depth -= 1
+        profile.spans.insert(index, {
+            "kind": kind, "name": name, "depth": profile.depth,
+            "seconds": round(time.perf_counter() - started, 6), "bytes": None,
+        })
+
+
+def profiled(function):
+    """Record every call of ``function`` as a ``data`` span."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if current() is None:
+            return function(*args, **kwargs)
+        with span("data", function.__qualname__):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+# ------------------------------------------------------------
+# Element instrumentation
+# ------------------------------------------------------------
+def _figure_bytes(fig):
+    import plotly.io as pio
+
+    return len(pio.to_json(fig, validate=False))
+
+
+def _frame_bytes(data):
+    memory_usage = getattr(data, "memory_usage", None)
+    if memory_usage is None:
+        return None
+    usage = memory_usage(deep=True)
+    return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+
+
+def _timed_element(element, name, payload_bytes, payload_arg):
+    @functools.wraps(element)
+    def wrapper(*args, **kwargs):
+        profile = current()
+        if profile is None:
+            return element(*args, **kwargs)
+        # Measured outside the timed call; sizing a figure serialises it once more.
+        data = args[0] if args else kwargs.get(payload_arg)
+        nbytes = payload_bytes(data) if data is not None else None
+        started = time.perf_counter()
+        result = element(*args, **kwargs)
+        profile.add("element", name, time.perf_counter() - started, nbytes)
+        return result
+    return wrapper
+
+
+def install():
+    """Wrap st.plotly_chart / st.dataframe; done once, on the first profiled run."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        st.plotly_chart = _timed_element(
+            st.plotly_chart, "st.plotly_chart", _figure_bytes, "figure_or_data"
+        )
+        st.dataframe = _timed_element(st.dataframe, "st.dataframe", _frame_bytes, "data")
+        _installed = True
+
+
+# ------------------------------------------------------------
+# Run lifecycle, panel and log
+# ------------------------------------------------------------
+def start_profiling():
+    """Begin profiling this script run if enabled; returns the profile or None."""
+    if not profiling_enabled():
+        _active.profile = None
+        return None
+    install()
+    _active.profile = RunProfile()
+    return _active.profile
+
+
+def _write_log(record):
+    with _log_lock:
+        with open(profile_log_path(), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+
+def finish_profiling(profile, page):
+    """Stop profiling, append the run to the JSON log and draw the panel."""
+    _active.profile = None
+    if profile is None:
+        return None
+    total = profile.elapsed()
+    record = {
+        "time": time.time(),
+        "page": page,
+        "seconds": round(total, 6),
+        "spans": profile.spans,
+    }
+    _write_log(record)
+    profile_panel(record)
+    return record
+
+
+def profile_panel(record):
+    import pandas as pd
+
+    spans = pd.DataFrame(record["spans"], columns=["kind", "name", "depth", "seconds", "bytes"])
+    with st.sidebar.expander("⏱️ Profiler", expanded=True):
+        st.caption(f"{record['page']}: {record['seconds'] * 1000:,.0f} ms for this run")
+        if spans.empty:
+            return
+        by_kind = spans[spans["depth"] == 0].groupby("kind")["seconds"].sum()
+        st.caption(" · ".join(f"{kind} {seconds * 1000:,.0f} ms" for kind, seconds in by_kind.items()))
+        slowest = spans[spans["kind"] != "data"].nlargest(1, "seconds")
+        if len(slowest):
+            st.caption(f"Slowest chart step: {slowest['name'].iloc[0]} "
+                       f"({slowest['seconds'].iloc[0] * 1000:,.0f} ms)")
+        # In run order, nested spans indented under the call that made them.
+        spans["name"] = ["· " * depth + name for depth, name in zip(spans["depth"], spans["name"])]
+        spans["ms"] = (spans["seconds"] * 1000).round(1)
+        st.table(spans[["kind", "name", "ms", "bytes"]])
+        st.caption(f"Log: {profile_log_path()}")
@@ -0,0 +1,399 @@
+# ============================================================
+# PLUGGABLE QUERY BACKENDS
+# ============================================================
+# Pages ask a backend for the few aggregations they chart - rollups by
+# year / experience / demand level, grand totals, quantiles and reduced
+# chart data - instead of scanning a pandas frame themselves. The global
+# filters are applied when the backend is built (data_backend).
+#
+#   JOB_QUERY_BACKEND=pandas  (default) the in-memory frame and its cube
+#   JOB_QUERY_BACKEND=duckdb  embedded DuckDB over the Parquet files of
+#                             JOB_DATA_DIR (or a JOB_DATA_PATH .parquet)
+#
+# DuckDB streams the Parquet files with all cores and spills large
+# aggregations to disk, so pages on the duckdb backend never hold the
+# dataset in memory. Only the small query results are cached, per
+# dataset version. duckdb is an optional dependency
+# (pip install -r requirements-optional.txt).
+
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+import downsampling
+from aggregates import DEMAND_BUCKET_WIDTH, rollup, total
+from data_loader import configured_dir, configured_path, get_dataset
+from filter_state import apply_global_filters, filter_bounds, filter_dataset, filter_form, filter_suffix
+from ingestion import PART_PATTERN
+from profiler import profiled
+from recommendations import top_rows_per_level
+from shared_cache import warm_in_background
+from sketches import SKETCH_COLUMNS, SKETCH_GROUPS, sketch_box_stats, sketch_histogram
+
+QUERY_BACKEND_ENV = "JOB_QUERY_BACKEND"
+QUERY_BACKENDS = ("pandas", "duckdb")
+DEFAULT_QUERY_BACKEND = "pandas"
+
+SQL_STATS = {"mean": "avg", "sum": "sum", "min": "min", "max": "max", "count": "count"}
+
+
+def backend_name():
+    name = os.environ.get(QUERY_BACKEND_ENV, DEFAULT_QUERY_BACKEND).strip().lower()
+    if name not in QUERY_BACKENDS:
+        raise ValueError(
+            f"{QUERY_BACKEND_ENV} must be one of {', '.join(QUERY_BACKENDS)}, got {name!r}"
+        )
+    return name
+
+
+def _as_list(value):
+    return [value] if isinstance(value, str) else [v for v in value if v]
+
+
+class QueryBackend:
+    """Aggregations the pages need; every result is a small pandas object.
+
+    Subclasses provide the primitives (``row_count``, ``rows``,
+    ``sample``, ``binned_points``, ``box_stats``, ``histogram``,
+    ``top_per_level``, ...);
+    the chart helpers below apply the render mode from downsampling.py
+    on top of them.
+    """
+
+    name = None
+    version = None
+
+    def _reduce(self, mode):
+        mode = mode or downsampling.render_mode()
+        if mode != "full" and self.row_count() > downsampling.max_points():
+            return mode
+        return None
+
+    def scatter_frame(self, x, y, size=None, color=None, mode=None):
+        """Rows to hand to ``px.scatter`` under the configured render mode."""
+        reduce = self._reduce(mode)
+        if reduce == "aggregate":
+            return self.binned_points(x, y, size=size, color=color)
+        if reduce == "sample":
+            return self.sample(downsampling.max_points())
+        return self.rows([x, y, size, color])
+
+    def density_chart(self, chart, x, y, mode=None, **kwargs):
+        """``px.density_contour`` / ``px.density_heatmap`` on reduced data."""
+        reduce = self._reduce(mode)
+        if reduce == "aggregate":
+            binned = self.binned_points(x, y)
+            return chart(binned, x=x, y=y, z="rows", histfunc="sum", **kwargs)
+        if reduce == "sample":
+            return chart(self.sample(downsampling.max_points()), x=x, y=y, **kwargs)
+        return chart(self.rows([x, y]), x=x, y=y, **kwargs)
+
+    def distribution_chart(self, chart, y, x=None, mode=None, **kwargs):
+        """``px.box`` / ``px.violin``, drawn from quantiles when reduced."""
+        reduce = self._reduce(mode)
+        if reduce == "aggregate":
+            return downsampling.quantile_box_figure(
+                self.box_stats(y, x), y, x=x, title=kwargs.get("title")
+            )
+        if reduce == "sample":
+            return chart(self.sample(downsampling.max_points()), x=x, y=y, **kwargs)
+        return chart(self.rows([y, x]), x=x, y=y, **kwargs)
+
+    def histogram_chart(self, column, nbins, **kwargs):
+        """Histogram of ``column`` from pre-binned counts."""
+        bins = self.histogram(column, nbins)
+        fig = px.bar(bins, x=column, y="rows", **kwargs)
+        fig.update_traces(width=bins["width"].iloc[0] if len(bins) else None)
+        fig.update_layout(bargap=0, yaxis_title="count")
+        return fig
+
+
+# ------------------------------------------------------------
+# pandas: the in-memory frame and its aggregate cube
+# ------------------------------------------------------------
+class PandasBackend(QueryBackend):
+    name = "pandas"
+
+    def __init__(self, data, cube=None):
+        # A filter_state.FilteredDataset: row positions into the shared
+        # frame. Rows are copied out only where the result is cached.
+        self.data = data
+        self.version = data.version
+        self.cube = data.cube() if cube is None else cube
+
+    def rollup(self, by, columns, stat="mean"):
+        return rollup(self.cube, by, columns, stat)
+
+    def total(self, column, stat="mean"):
+        return total(self.cube, column, stat)
+
+    @property
+    def sketches(self):
+        return self.data.sketches()
+
+    def _frame(self, *columns):
+        return self.data.frame(dict.fromkeys(c for c in columns if c))
+
+    def quantile(self, column, q):
+        if column in SKETCH_COLUMNS:
+            return float(self.sketches[(column, None, None)].quantile(q))
+        return float(self._frame(column)[column].quantile(q))
+
+    def row_count(self):
+        return len(self.data)
+
+    def top_per_level(self, by, order_by, k):
+        return top_rows_per_level(self.data.frame(), _as_list(by), list(order_by), k)
+
+    # The in-memory frame keeps the exact chart behaviour of downsampling.py.
+    def scatter_frame(self, x, y, size=None, color=None, mode=None):
+        return downsampling.scatter_frame(self._frame(x, y, size, color), x, y, size=size, color=color, mode=mode)
+
+    def density_chart(self, chart, x, y, mode=None, **kwargs):
+        return downsampling.density_chart(chart, self._frame(x, y), x, y, mode=mode, **kwargs)
+
+    def distribution_chart(self, chart, y, x=None, mode=None, **kwargs):
+        stats = None
+        if y in SKETCH_COLUMNS and (x is None or x in SKETCH_GROUPS.get(y, ())):
+            stats = sketch_box_stats(self.sketches, y, x)
+        return downsampling.distribution_chart(chart, self._frame(x, y), y, x=x, mode=mode, stats=stats, **kwargs)
+
+    def histogram(self, column, nbins):
+        if column in SKETCH_COLUMNS:
+            return sketch_histogram(self.sketches, column, nbins)
+        counts, edges = np.histogram(self._frame(column)[column].dropna(), bins=nbins)
+        return pd.DataFrame({column: (edges[:-1] + edges[1:]) / 2, "rows": counts, "width": edges[1] - edges[0]})
+
+
+# ------------------------------------------------------------
+# DuckDB: lazy SQL over local Parquet files
+# ------------------------------------------------------------
+def parquet_sources():
+    """Parquet files behind the configured dataset, or [] if there are none."""
+    root = configured_dir()
+    if root:
+        return sorted(glob.glob(os.path.join(os.path.abspath(root), PART_PATTERN)))
+    path = configured_path()
+    if path.lower().endswith((".parquet", ".pq")):
+        return [os.path.abspath(path)]
+    return []
+
+
+def sources_fingerprint(files):
+    """Dataset version for a set of Parquet files: count, size, newest mtime."""
+    stats = [os.stat(path) for path in files]
+    newest = max(stat.st_mtime_ns for stat in stats)
+    size = sum(stat.st_size for stat in stats)
+    return f"duckdb:{len(files)}:{size}:{newest}"
+
+
+@st.cache_resource(show_spinner=False)
+def duckdb_connection():
+    import duckdb
+
+    connection = duckdb.connect(database=":memory:")
+    connection.execute(f"SET threads TO {os.cpu_count() or 1}")
+    return connection
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_query(version, sql, files):
+    # ``version`` changes whenever a file is added or rewritten.
+    cursor = duckdb_connection().cursor()
+    try:
+        return cursor.execute(sql, [list(files)]).df()
+    finally:
+        cursor.close()
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _where(thresholds):
+    return " AND ".join(f"{_quote(c)} >= {float(v)}" for c, v in thresholds.items()) or "TRUE"
+
+
+class DuckDBBackend(QueryBackend):
+    name = "duckdb"
+
+    def __init__(self, files, thresholds=()):
+        if not files:
+            raise ValueError(
+                "The duckdb query backend needs Parquet files: set JOB_DATA_DIR "
+                "to a partitioned dataset or JOB_DATA_PATH to a .parquet file"
+            )
+        self.files = tuple(files)
+        self.thresholds = dict(thresholds)
+        self.version = sources_fingerprint(self.files) + filter_suffix(self.thresholds)
+
+    @profiled
+    def query(self, sql):
+        """Run ``sql`` with ``src`` bound to the (filtered) dataset; cached per version."""
+        where = _where(self.thresholds)
+        sql = f"WITH src AS (SELECT * FROM read_parquet(?, union_by_name = true) WHERE {where}) {sql}"
+        return _cached_query(self.version, sql, self.files)
+
+    def _key(self, column):
+        if column == "demand_index" and DEMAND_BUCKET_WIDTH != 1:
+            return f"(demand_index // {DEMAND_BUCKET_WIDTH}) * {DEMAND_BUCKET_WIDTH}"
+        return _quote(column)
+
+    def rollup(self, by, columns, stat="mean"):
+        by, columns = _as_list(by), _as_list(columns)
+        keys = ", ".join(f"{self._key(key)} AS {_quote(key)}" for key in by)
+        values = ", ".join(f"{SQL_STATS[stat]}({_quote(c)}) AS {_quote(c)}" for c in columns)
+        order = ", ".join(str(i + 1) for i in range(len(by)))
+        return self.query(f"SELECT {keys}, {values} FROM src GROUP BY ALL ORDER BY {order}")
+
+    def total(self, column, stat="mean"):
+        return self.query(f"SELECT {SQL_STATS[stat]}({_quote(column)}) AS v FROM src")["v"].iloc[0]
+
+    def quantile(self, column, q):
+        return float(self.query(
+            f"SELECT quantile_cont({_quote(column)}, {float(q)}) AS v FROM src"
+        )["v"].iloc[0])
+
+    def row_count(self):
+        return int(self.query("SELECT count(*) AS n FROM src")["n"].iloc[0])
+
+    def top_per_level(self, by, order_by, k):
+        """The ``k`` best rows per ``by`` level, ranked by ``order_by`` (descending)."""
+        levels = ", ".join(map(_quote, _as_list(by)))
+        ranking = ", ".join(f"{_quote(c)} DESC NULLS LAST" for c in order_by)
+        return self.query(
+            f"SELECT * FROM src QUALIFY row_number() OVER "
+            f"(PARTITION BY {levels} ORDER BY {ranking}) <= {int(k)} "
+            f"ORDER BY {levels}, {ranking}"
+        )
+
+    def rows(self, columns):
+        columns = list(dict.fromkeys(_as_list(columns)))
+        return self.query(f"SELECT {', '.join(map(_quote, columns))} FROM src")
+
+    def sample(self, limit):
+        """Uniform reservoir sample (not stratified, unlike the pandas backend)."""
+        return self.query(f"SELECT * FROM src USING SAMPLE reservoir({int(limit)} ROWS) REPEATABLE (0)")
+
+    def _range(self, column):
+        row = self.query(
+            f"SELECT min({_quote(column)}) AS lo, max({_quote(column)}) AS hi, "
+            f"typeof(any_value({_quote(column)})) AS type FROM src"
+        ).iloc[0]
+        return row["lo"], row["hi"], row["type"]
+
+    def _bin_expr(self, column, bins):
+        """SQL bin index and the centre of every bin, as in downsampling._bin_codes."""
+        low, high, sql_type = self._range(column)
+        if "INT" in sql_type.upper() and high - low < bins:
+            return f"({_quote(column)} - {low})", np.arange(low, high + 1)
+        width = float(high - low) / bins or 1.0
+        code = f"least(greatest(floor(({_quote(column)} - {low}) / {width}), 0), {bins - 1})"
+        return code, low + (np.arange(bins) + 0.5) * width
+
+    def binned_points(self, x, y, size=None, color=None, bins=None):
+        bins = bins or max(1, int(np.sqrt(downsampling.max_points())))
+        x_code, x_centers = self._bin_expr(x, bins)
+        y_code, y_centers = self._bin_expr(y, bins)
+        extras = list(dict.fromkeys(c for c in (size, color) if c and c not in (x, y)))
+        means = "".join(f", avg({_quote(c)}) AS {_quote(c)}" for c in extras)
+        cells = self.query(
+            f"SELECT CAST({x_code} AS BIGINT) AS bx, CAST({y_code} AS BIGINT) AS by_, "
+            f"count(*) AS rows{means} FROM src "
+            f"WHERE {_quote(x)} IS NOT NULL AND {_quote(y)} IS NOT NULL "
+            f"GROUP BY ALL ORDER BY 1, 2"
+        )
+        result = pd.DataFrame({
+            x: x_centers[cells["bx"].to_numpy()],
+            y: y_centers[cells["by_"].to_numpy()],
+            "rows": cells["rows"].to_numpy(),
+        })
+        for column in extras:
+            result[column] = cells[column].to_numpy()
+        return result
+
+    def box_stats(self, y, x=None):
+        key = _quote(x) if x else "0"
+        column = _quote(y)
+        stats = self.query(
+            f"SELECT {key} AS k, quantile_cont({column}, 0.25) AS q1, "
+            f"quantile_cont({column}, 0.5) AS median, quantile_cont({column}, 0.75) AS q3, "
+            f"min({column}) AS min, max({column}) AS max, avg({column}) AS mean "
+            f"FROM src WHERE {column} IS NOT NULL GROUP BY 1 ORDER BY 1"
+        ).set_index("k")
+        iqr = stats["q3"] - stats["q1"]
+        stats["lowerfence"] = np.maximum(stats["min"], stats["q1"] - 1.5 * iqr)
+        stats["upperfence"] = np.minimum(stats["max"], stats["q3"] + 1.5 * iqr)
+        return stats
+
+    def histogram(self, column, nbins):
+        low, high, _ = self._range(column)
+        width = float(high - low) / nbins or 1.0
+        counts = self.query(
+            f"SELECT least(floor(({_quote(column)} - {low}) / {width}), {nbins - 1}) AS b, "
+            f"count(*) AS rows FROM src WHERE {_quote(column)} IS NOT NULL GROUP BY 1 ORDER BY 1"
+        )
+        return pd.DataFrame({
+            column: low + (counts["b"].to_numpy() + 0.5) * width,
+            "rows": counts["rows"].to_numpy(),
+            "width": width,
+        })
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _duckdb_backend(files, version, thresholds=()):
+    return DuckDBBackend(files, thresholds)
+
+
+def data_backend(thresholds=None):
+    """The configured query backend with ``thresholds`` (column -> minimum) applied.
+
+    Renders nothing; api.py uses it directly.
+    """
+    if backend_name() == "duckdb":
+        files = tuple(parquet_sources())
+        version = sources_fingerprint(files) if files else None
+        full = _duckdb_backend(files, version)
+        warm_in_background(full.version)
+        if not thresholds:
+            return full
+        return _duckdb_backend(files, version, tuple(sorted(thresholds.items())))
+    return PandasBackend(filter_dataset(*get_dataset(), thresholds))
+
+
+@profiled
+def get_backend():
+    """The configured query backend, with the global filters applied.
+
+    Renders the sidebar filter form (see filter_state.py).
+    """
+    if backend_name() == "duckdb":
+        full = data_backend()
+        thresholds = filter_form(filter_bounds(full.total))
+        return data_backend(thresholds) if thresholds else full
+    return PandasBackend(apply_global_filters(*get_dataset()))
+
+
+# ------------------------------------------------------------
+# Page metrics shared with api.py
+# ------------------------------------------------------------
+# name: (column, stat, decimals or None for an integer)
+MARKET_KPIS = {
+    "avg_demand_index": ("demand_index", "mean", 2),
+    "total_job_openings": ("job_openings", "sum", None),
+    "avg_median_salary_cny": ("salary_median_cny", "mean", None),
+    "avg_experience_years": ("experience_years", "mean", 1),
+}
+
+
+def market_kpis(backend):
+    """The headline KPIs of the Job Demand & Market KPIs page."""
+    kpis = {}
+    for name, (column, stat, decimals) in MARKET_KPIS.items():
+        value = backend.total(column, stat)
+        kpis[name] = int(value) if decimals is None else round(float(value), decimals)
+    return kpis
@@ -0,0 +1,138 @@
+# ============================================================
+# TOP-K JOB RECOMMENDATION INDEX
+# ============================================================
+# Recommending jobs used to filter the whole frame to the top demand
+# quartile and sort millions of rows on every rerun. Instead, the rows
+# are split once per dataset version into segments - one per
+# (experience level, demand index) pair - and only the TOP_K best paid
+# jobs of each segment are kept, in the segments at or above the
+# HIGH_DEMAND_QUANTILE of demand:
+#
+#   pandas   one partial sort (np.partition) per segment
+#   duckdb   a row_number() window, QUALIFY rank <= TOP_K
+#
+# A user profile (years of experience, minimum salary) is answered by
+# walking the segments from the highest demand down, taking the jobs
+# that pay enough from the levels the user qualifies for, until the
+# list is full. That touches a few thousand rows whatever the dataset
+# size, and ranks exactly like sorting the full frame on (demand,
+# salary) as long as no more than TOP_K jobs are asked for.
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from profiler import profiled
+
+TOP_K = 100
+# Only jobs in the top demand quartile are recommended.
+HIGH_DEMAND_QUANTILE = 0.75
+RECOMMENDATION_SEGMENTS = ("experience_years", "demand_index")
+RECOMMENDATION_RANKING = ("demand_index", "salary_median_cny")
+
+# Shown in the recommendations table when the dataset has them.
+RECOMMENDATION_COLUMNS = (
+    "skill", "industry", "city",
+    "experience_years", "salary_median_cny", "demand_index", "job_openings",
+)
+
+
+def _descending_key(values):
+    """Sort key putting the largest values first and missing values last."""
+    key = -np.asarray(values, dtype=np.float64)
+    key[np.isnan(key)] = np.inf
+    return key
+
+
+def top_rows_per_level(df, by, order_by, k):
+    """The ``k`` best rows of ``df`` per ``by`` level, ranked by ``order_by`` (descending).
+
+    Rows come grouped by level (ascending), best first within a level.
+    """
+    codes = np.zeros(len(df), dtype=np.int64)
+    for column in by:
+        column_codes, levels = pd.factorize(df[column].to_numpy(), sort=True)
+        codes = codes * (len(levels) + 1) + column_codes + 1
+    if len(codes) and codes.max() < np.iinfo(np.int16).max:
+        # numpy sorts 16-bit integers in linear time (radix sort).
+        codes = codes.astype(np.int16)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(codes.max() + 2 if len(codes) else 1))
+
+    primary = _descending_key(df[order_by[0]].to_numpy())
+    secondary = [df[column].to_numpy() for column in reversed(order_by)]
+    selected = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if start == end:
+            continue
+        rows = order[start:end]
+        if len(rows) > k:
+            # Keep every row tied with the k-th best, then rank exactly.
+            cutoff = np.partition(primary[rows], k - 1)[k - 1]
+            rows = rows[primary[rows] <= cutoff]
+        keys = [_descending_key(values[rows]) for values in secondary]
+        selected.append(rows[np.lexsort(keys)][:k])
+    positions = np.concatenate(selected) if selected else np.array([], dtype=np.int64)
+    return df.iloc[positions]
+
+
+class RecommendationIndex:
+    """Best paid jobs per (experience, demand) segment, highest demand first.
+
+    With ``min_demand``, segments below that demand index are left out.
+    """
+
+    def __init__(self, top, min_demand=None):
+        if min_demand is not None:
+            top = top[top["demand_index"].to_numpy() >= min_demand]
+        level, demand = (top[column].to_numpy() for column in RECOMMENDATION_SEGMENTS)
+        salary = top["salary_median_cny"].to_numpy()
+        order = np.lexsort([_descending_key(salary), level, _descending_key(demand)])
+        self.frame = top.iloc[order].reset_index(drop=True)
+        self.columns = [c for c in RECOMMENDATION_COLUMNS if c in self.frame]
+
+        # Missing salaries never meet a minimum.
+        self.salary = np.nan_to_num(salary[order].astype(np.float64), nan=-np.inf)
+        level, demand = level[order], demand[order]
+        changes = np.flatnonzero((level[1:] != level[:-1]) | (demand[1:] != demand[:-1])) + 1
+        self.starts = np.concatenate([[0], changes]) if len(order) else np.array([], dtype=np.int64)
+        self.segment_level = level[self.starts]
+        self.segment_demand = _descending_key(demand[self.starts])
+
+    def __len__(self):
+        return len(self.frame)
+
+    @profiled
+    def recommend(self, experience, min_salary=0, limit=20):
+        """The ``limit`` best jobs open to someone with ``experience`` years."""
+        if not len(self.starts):
+            return self.frame[self.columns]
+        # Salaries fall within a segment, so the jobs paying enough are a prefix.
+        counts = np.add.reduceat(self.salary >= min_salary, self.starts, dtype=np.int64)
+        counts = np.where(self.segment_level <= experience, np.minimum(counts, limit), 0)
+        filled = np.cumsum(counts)
+        last = int(np.searchsorted(filled, limit))
+        if last < len(counts):
+            # Finish the demand level that fills the list; salary breaks its ties.
+            last = int(np.searchsorted(self.segment_demand, self.segment_demand[last], side="right"))
+        counts, filled = counts[:last], filled[:last]
+        rows = np.repeat(self.starts[:last] - (filled - counts), counts) + np.arange(filled[-1] if last else 0)
+
+        candidates = self.frame.iloc[rows]
+        keys = [_descending_key(candidates[column].to_numpy()) for column in reversed(RECOMMENDATION_RANKING)]
+        best = np.lexsort(keys)[:limit]
+        return candidates.iloc[best][self.columns].reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner="Indexing recommendations...", max_entries=4)
+def _recommendation_index(_backend, version, k):
+    return RecommendationIndex(
+        _backend.top_per_level(list(RECOMMENDATION_SEGMENTS), RECOMMENDATION_RANKING[1:], k),
+        _backend.quantile("demand_index", HIGH_DEMAND_QUANTILE),
+    )
+
+
+@profiled
+def recommendation_index(backend, k=TOP_K):
+    """The recommendation index of ``backend``, built once per dataset version."""
+    return _recommendation_index(backend, backend.version, k)
@@ -0,0 +1,112 @@
+# ============================================================
+# COMPACT SCHEMA FOR THE JOB-MARKET FRAME
+# ============================================================
+# Every known column gets the narrowest dtype that holds its domain:
+# years in int16, experience and demand in uint8, salaries in float32.
+# String dimensions (city, industry, skill, ...) become categoricals.
+# Narrow columns cut memory several-fold and make the groupby / filter
+# scans in the pages proportionally cheaper.
+#
+# Set JOB_ARROW_BACKED=1 to store columns as Arrow-backed pandas
+# dtypes (dictionary-encoded strings) instead of NumPy ones.
+
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ARROW_BACKED_ENV = "JOB_ARROW_BACKED"
+
+SCHEMA = {
+    "year": "int16",
+    "salary_min_cny": "float32",
+    "salary_median_cny": "float32",
+    "salary_max_cny": "float32",
+    "experience_years": "uint8",
+    "demand_index": "uint8",
+    "job_openings": "uint32",
+}
+
+
+def arrow_backed():
+    return os.environ.get(ARROW_BACKED_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def _fits(series, dtype):
+    """Whether ``series`` can be stored as ``dtype`` without losing values."""
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        return True
+    if series.isna().any():
+        return False
+    if not pd.api.types.is_integer_dtype(series):
+        if not pd.api.types.is_numeric_dtype(series):
+            return False
+        if not np.array_equal(series, np.floor(series)):
+            return False
+    limits = np.iinfo(dtype)
+    return len(series) == 0 or (series.min() >= limits.min and series.max() <= limits.max)
+
+
+def _narrowest(series):
+    """Fallback for numeric columns outside the schema (or out of range)."""
+    if pd.api.types.is_integer_dtype(series):
+        kind = "unsigned" if len(series) and series.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=kind)
+    if pd.api.types.is_float_dtype(series):
+        return pd.to_numeric(series, downcast="float")
+    return series
+
+
+def apply_schema(df):
+    """Cast ``df`` to the compact schema, in place, and return it."""
+    for column in df.columns:
+        series = df[column]
+        target = SCHEMA.get(column)
+        if target is not None and pd.api.types.is_numeric_dtype(series) and _fits(series, target):
+            df[column] = series.astype(target)
+        elif pd.api.types.is_bool_dtype(series):
+            continue
+        elif pd.api.types.is_numeric_dtype(series):
+            if target is not None:
+                logger.warning(
+                    "column %r does not fit schema dtype %s; using %s",
+                    column, target, _narrowest(series).dtype,
+                )
+            df[column] = _narrowest(series)
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            df[column] = series.astype("category")
+
+    if arrow_backed():
+        df = to_arrow_backed(df)
+    return df
+
+
+def to_arrow_backed(df):
+    """Convert every column to an Arrow-backed pandas dtype."""
+    import pyarrow as pa
+
+    columns = {}
+    for column in df.columns:
+        # Categoricals come out dictionary-encoded.
+        array = pa.array(df[column], from_pandas=True)
+        columns[column] = pd.Series(array, dtype=pd.ArrowDtype(array.type), index=df.index)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def footprint(df):
+    """Dtype and deep memory usage of every column."""
+    return pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "bytes": df.memory_usage(index=False, deep=True),
+    })
+
+
+def memory_report(before, after):
+    """Join two ``footprint`` results into a before / after table."""
+    report = before.join(after, lsuffix="_before", rsuffix="_after")
+    report.loc["TOTAL"] = ["", report["bytes_before"].sum(), "", report["bytes_after"].sum()]
+    return report
@@ -0,0 +1,208 @@
+# ============================================================
+# SHARED ON-DISK CACHE
+# ============================================================
+# st.cache_data / st.cache_resource live in one server process, so each
+# of N Streamlit processes on a node recomputed the same cubes, sketches
+# and figures, and the first visitor after a deploy or data refresh
+# paid for all of them. With
+#     JOB_SHARED_CACHE_DIR=/var/cache/jobs streamlit run app.py
+# those results are also written to a directory every process reads:
+#
+#   datasets/  the loaded dataset in the compact schema, as an
+#              uncompressed Arrow IPC file every process memory-maps
+#   objects/   cubes and sketches, pickled, keyed by dataset version
+#   figures/   Plotly figures as JSON, keyed like figure_cache.py
+#   warm/      one marker per dataset version warmed by warmup.py
+#
+# Files are written under a temporary name and renamed into place, so
+# readers never see a partial entry. Entries of old dataset versions are
+# no longer looked up; warmup.py prunes files older than a week. The
+# directory must only be writable by the dashboard: entries are
+# unpickled.
+
+import hashlib
+import os
+import pickle
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+SHARED_CACHE_DIR_ENV = "JOB_SHARED_CACHE_DIR"
+WARMUP_CHILD_ENV = "JOB_WARMUP_CHILD"
+SHARED_CACHE_MAX_AGE_DAYS = 7
+# A warm-up claim older than this is assumed to belong to a dead process.
+WARMUP_CLAIM_SECONDS = 3600
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WARMUP_SCRIPT = os.path.join(HERE, "warmup.py")
+
+
+def shared_cache_dir():
+    return os.environ.get(SHARED_CACHE_DIR_ENV, "").strip()
+
+
+def _digest(key):
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+
+class SharedCache:
+    """Results keyed by dataset version, stored as files under ``root``."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def path(self, kind, key, suffix=""):
+        return os.path.join(self.root, kind, _digest(key) + suffix)
+
+    def _read(self, path):
+        try:
+            with open(path, "rb") as handle:
+                return handle.read()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.{uuid.uuid4().hex}.partial"
+        with open(partial, "wb") as handle:
+            handle.write(data)
+        os.replace(partial, path)
+
+    def get_frame(self, key):
+        """The frame stored under ``key`` as read-only views of a memory map.
+
+        Numeric columns without nulls are not copied: every process
+        mapping the file shares the same page-cache pages. Categorical
+        codes are decoded into private memory.
+        """
+        import pyarrow as pa
+
+        path = self.path("datasets", key, ".arrow")
+        try:
+            source = pa.memory_map(path, "r")
+        except FileNotFoundError:
+            return None
+        table = pa.ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True)
+
+    def put_frame(self, key, df):
+        import pyarrow as pa
+
+        path = self.path("datasets", key, ".arrow")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.{uuid.uuid4().hex}.partial"
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(partial, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(partial, path)
+
+    def get_object(self, kind, key):
+        data = self._read(self.path("objects", (kind, key), ".pkl"))
+        return None if data is None else pickle.loads(data)
+
+    def put_object(self, kind, key, value):
+        self._write(self.path("objects", (kind, key), ".pkl"), pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def get_figure(self, key):
+        import plotly.io as pio
+
+        data = self._read(self.path("figures", key, ".json"))
+        return None if data is None else pio.from_json(data.decode("utf-8"), skip_invalid=True)
+
+    def put_figure(self, key, fig):
+        import plotly.io as pio
+
+        self._write(self.path("figures", key, ".json"), pio.to_json(fig, validate=False).encode("utf-8"))
+
+    # ------------------------------------------------------------
+    # Warm-up bookkeeping
+    # ------------------------------------------------------------
+    def is_warm(self, version):
+        return os.path.exists(self.path("warm", version, ".done"))
+
+    def mark_warm(self, version):
+        self._write(self.path("warm", version, ".done"), version.encode("utf-8"))
+
+    def claim(self, version):
+        """Take the warm-up of ``version``; False if another process has it."""
+        path = self.path("warm", version, ".claim")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            if time.time() - os.path.getmtime(path) > WARMUP_CLAIM_SECONDS:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        return True
+
+    def release(self, version):
+        try:
+            os.remove(self.path("warm", version, ".claim"))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, max_age_days=SHARED_CACHE_MAX_AGE_DAYS):
+        """Delete entries written more than ``max_age_days`` ago; return how many."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for kind in ("datasets", "objects", "figures", "warm"):
+            directory = os.path.join(self.root, kind)
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+        return removed
+
+
+def shared_cache():
+    """The configured shared cache, or None when JOB_SHARED_CACHE_DIR is unset."""
+    root = shared_cache_dir()
+    return SharedCache(root) if root else None
+
+
+def shared_or_compute(kind, version, compute):
+    """``compute()``, unless the shared cache already holds it for ``version``."""
+    cache = shared_cache()
+    if cache is None:
+        return compute()
+    value = cache.get_object(kind, version)
+    if value is None:
+        value = compute()
+        cache.put_object(kind, version, value)
+    return value
+
+
+# Dataset versions this process has already checked or started warming.
+_requested = set()
+_requested_lock = threading.Lock()
+
+
+def warm_in_background(version):
+    """Start ``warmup.py`` for ``version`` unless it is warm or being warmed.
+
+    Called on every data access, so it returns immediately after the
+    first call per version and process.
+    """
+    if not shared_cache_dir() or os.environ.get(WARMUP_CHILD_ENV):
+        return
+    with _requested_lock:
+        if version in _requested:
+            return
+        _requested.add(version)
+    if shared_cache().is_warm(version):
+        return
+    subprocess.Popen(
+        [sys.executable, WARMUP_SCRIPT],
+        cwd=HERE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
@@ -0,0 +1,260 @@
+# ============================================================
+# MERGEABLE QUANTILE / HISTOGRAM SKETCHES
+# ============================================================
+# Percentile KPIs, histograms and box plots used to re-scan a full
+# column on every rerun. Instead, each column is summarised once into a
+# small sketch: a sorted list of bucket values with their row counts.
+#
+#   integer columns   one bucket per distinct value - exact
+#   other columns     logarithmic buckets (DDSketch style): every value
+#                     is represented within RELATIVE_ACCURACY (0.5%)
+#                     of itself, so quantiles carry the same bound
+#
+# Sketches of two row sets merge by adding counts of equal buckets, so
+# they are built per partition (of the in-memory frame, or per ingested
+# batch) and combined. Queries cost O(buckets) - a few thousand at most
+# - whatever the row count. Count, sum, min and max are kept exactly.
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from profiler import profiled
+from shared_cache import shared_or_compute
+
+RELATIVE_ACCURACY = 0.005
+SKETCH_PARTITION_ROWS = 1_000_000
+
+# Columns sketched over all rows, and per level of the listed columns.
+SKETCH_COLUMNS = ("salary_median_cny", "demand_index", "job_openings", "experience_years")
+SKETCH_GROUPS = {"salary_median_cny": ("experience_years",)}
+
+# Keeps log-bucket keys of values below 1 positive.
+_KEY_BIAS = 1 << 20
+
+
+class QuantileSketch:
+    """Bucket values (ascending) with row counts, plus exact moments."""
+
+    def __init__(self, values, counts, total, minimum, maximum):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.total = float(total)
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def merge(self, other):
+        """Sketch of the union of both row sets."""
+        if not self.count:
+            return other
+        if not other.count:
+            return self
+        values, inverse = np.unique(np.concatenate([self.values, other.values]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([self.counts, other.counts]))
+        return QuantileSketch(
+            values, counts.astype(np.int64), self.total + other.total,
+            min(self.minimum, other.minimum), max(self.maximum, other.maximum),
+        )
+
+    def quantile(self, q):
+        """Quantile(s) with linear interpolation, like ``Series.quantile``."""
+        q = np.asarray(q, dtype=np.float64)
+        if not self.count:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        # Ranks of the first row in each bucket's successor.
+        ends = np.cumsum(self.counts)
+        rank = q * (self.count - 1)
+        low = np.floor(rank).astype(np.int64)
+        high = np.minimum(low + 1, self.count - 1)
+        below = self.values[np.searchsorted(ends, low, side="right")]
+        above = self.values[np.searchsorted(ends, high, side="right")]
+        result = below + (above - below) * (rank - low)
+        # The extremes are known exactly.
+        result = np.where(q <= 0, self.minimum, np.where(q >= 1, self.maximum, result))
+        return float(result) if result.ndim == 0 else result
+
+    def histogram(self, nbins):
+        """``(edges, counts)`` of ``nbins`` equal-width bins over [min, max]."""
+        edges = np.linspace(self.minimum, self.maximum, nbins + 1)
+        counts, _ = np.histogram(
+            np.clip(self.values, self.minimum, self.maximum), bins=edges, weights=self.counts
+        )
+        return edges, counts.astype(np.int64)
+
+    def box_stats(self):
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            "q1": q1, "median": median, "q3": q3,
+            "min": self.minimum, "max": self.maximum,
+            "mean": self.total / self.count if self.count else np.nan,
+            # Whiskers stop at 1.5 IQR or the data range, as in downsampling.box_stats.
+            "lowerfence": max(self.minimum, q1 - 1.5 * iqr),
+            "upperfence": min(self.maximum, q3 + 1.5 * iqr),
+        }
+
+
+# ------------------------------------------------------------
+# Building
+# ------------------------------------------------------------
+def _bucket_keys(values, relative_accuracy=RELATIVE_ACCURACY):
+    """Integer bucket key per value and a function mapping keys to values."""
+    if values.dtype.kind in "iub":
+        return values.astype(np.int64), lambda keys: keys.astype(np.float64)
+
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+    log_gamma = np.log(gamma)
+    values = values.astype(np.float64, copy=False)
+    magnitude = np.abs(values)
+    with np.errstate(divide="ignore"):
+        index = np.ceil(np.log(magnitude) / log_gamma)
+    keys = np.where(magnitude > 0, index + _KEY_BIAS, 0).astype(np.int64) * np.sign(values).astype(np.int64)
+
+    def to_values(keys):
+        # Bucket midpoint: within relative_accuracy of every value in it.
+        centre = 2 * np.exp((np.abs(keys) - _KEY_BIAS) * log_gamma) / (gamma + 1)
+        return np.where(keys == 0, 0.0, np.sign(keys) * centre)
+
+    return keys, to_values
+
+
+def _count_keys(keys, groups=None, levels=1):
+    """Occupied ``(group, key)`` pairs and their counts."""
+    low = int(keys.min())
+    span = int(keys.max()) - low + 1
+    codes = keys - low
+    if groups is not None:
+        codes = groups.astype(np.int64) * span + codes
+    if span * levels <= 1 << 24:
+        counts = np.bincount(codes, minlength=span * levels)
+        occupied = np.flatnonzero(counts)
+        counts = counts[occupied]
+    else:
+        occupied, counts = np.unique(codes, return_counts=True)
+    return occupied // span, occupied % span + low, counts
+
+
+def _grouped_moments(values, groups, levels):
+    frame = pd.DataFrame({"v": values}).groupby(groups).agg(["sum", "min", "max"])["v"]
+    return frame.reindex(range(levels))
+
+
+def sketch_column(values, groups=None, levels=1):
+    """One sketch of ``values``, or one per group code in ``groups``."""
+    values = np.asarray(values)
+    present = ~pd.isna(values)
+    if not present.all():
+        values = values[present]
+        groups = groups[present] if groups is not None else None
+    if not len(values):
+        return [QuantileSketch([], [], 0, np.nan, np.nan) for _ in range(levels)]
+
+    keys, to_values = _bucket_keys(values)
+    group, key, counts = _count_keys(keys, groups, levels)
+    if groups is None:
+        return [QuantileSketch(to_values(key), counts, values.sum(dtype=np.float64),
+                               values.min(), values.max())]
+
+    moments = _grouped_moments(values.astype(np.float64), groups, levels)
+    sketches = []
+    for level in range(levels):
+        mine = group == level
+        row = moments.loc[level]
+        sketches.append(QuantileSketch(to_values(key[mine]), counts[mine],
+                                       row["sum"] if mine.any() else 0, row["min"], row["max"]))
+    return sketches
+
+
+def sketch_frame(df):
+    """Sketches of one partition: ``{(column, by, level): sketch}``."""
+    sketches = {}
+    for column in SKETCH_COLUMNS:
+        if column not in df:
+            continue
+        values = df[column].to_numpy()
+        sketches[(column, None, None)] = sketch_column(values)[0]
+        for by in SKETCH_GROUPS.get(column, ()):
+            codes, levels = pd.factorize(df[by].to_numpy(), sort=True)
+            # Rows missing the grouping value (code -1) belong to no level.
+            grouped = codes >= 0
+            for level, sketch in zip(levels, sketch_column(values[grouped], codes[grouped], len(levels))):
+                sketches[(column, by, level.item() if hasattr(level, "item") else level)] = sketch
+    return sketches
+
+
+def merge_sketches(left, right):
+    """Combine the sketch sets of two disjoint row sets."""
+    merged = dict(left)
+    for key, sketch in right.items():
+        merged[key] = merged[key].merge(sketch) if key in merged else sketch
+    return merged
+
+
+def compute_sketches(df, partition_rows=SKETCH_PARTITION_ROWS, rows=None):
+    """Sketch ``df`` one partition of rows at a time and merge (uncached).
+
+    With ``rows``, only those positions are sketched, copied out one
+    partition at a time.
+    """
+    sketches = {}
+    for start in range(0, max(len(df) if rows is None else len(rows), 1), partition_rows):
+        if rows is None:
+            part = df.iloc[start:start + partition_rows]
+        else:
+            part = df.take(rows[start:start + partition_rows])
+        sketches = merge_sketches(sketches, sketch_frame(part))
+    return sketches
+
+
+# Sketches maintained incrementally (see ingestion.py), by dataset version.
+_maintained_sketches = {}
+MAINTAINED_SKETCHES_KEPT = 4
+
+
+def register_sketches(version, sketches):
+    """Publish incrementally maintained sketches for ``version``."""
+    _maintained_sketches[version] = sketches
+    while len(_maintained_sketches) > MAINTAINED_SKETCHES_KEPT:
+        _maintained_sketches.pop(next(iter(_maintained_sketches)))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_sketches(_df, version, _rows=None):
+    return shared_or_compute("sketches", version, lambda: compute_sketches(_df, rows=_rows))
+
+
+@profiled
+def build_sketches(_df, version, rows=None):
+    """The sketches of ``_df`` (or of its ``rows`` positions), once per ``version``."""
+    if version in _maintained_sketches:
+        return _maintained_sketches[version]
+    return _cached_sketches(_df, version, rows)
+
+
+# ------------------------------------------------------------
+# Queries used by the pages
+# ------------------------------------------------------------
+def sketch_quantile(sketches, column, q):
+    return sketches[(column, None, None)].quantile(q)
+
+
+def sketch_histogram(sketches, column, nbins):
+    """Bin centres, row counts and bin width of ``column``, for a bar chart."""
+    edges, counts = sketches[(column, None, None)].histogram(nbins)
+    width = edges[1] - edges[0] if len(edges) > 1 else 1.0
+    return pd.DataFrame({column: (edges[:-1] + edges[1:]) / 2, "rows": counts, "width": width})
+
+
+def sketch_box_stats(sketches, y, x=None):
+    """Box statistics in the shape of ``downsampling.box_stats``."""
+    if x is None:
+        return pd.DataFrame([sketches[(y, None, None)].box_stats()], index=[0])
+    levels = sorted(level for column, by, level in sketches if column == y and by == x)
+    return pd.DataFrame(
+        [sketches[(y, x, level)].box_stats() for level in levels],
+        index=pd.Index(levels, name=x),
+    )
@@ -0,0 +1,59 @@
+# ============================================================
+# COLD-START MEASUREMENT
+# ============================================================
+# Autoscaled pods pay for imports plus the first render on every
+# scale-out. Pages import their heavy dependencies lazily, so the first
+# visit to each page is timed separately and logged once per process,
+# along with the wall time from process start to the first render.
+
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+
+def process_start_time():
+    """Epoch time this process started, from /proc (None off Linux)."""
+    try:
+        with open("/proc/self/stat") as handle:
+            # Fields after the parenthesised command name; starttime is field 22.
+            fields = handle.read().rpartition(")")[2].split()
+        with open("/proc/stat") as handle:
+            boot_time = next(int(line.split()[1]) for line in handle if line.startswith("btime "))
+        return boot_time + int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+
+
+class StartupTimings:
+    def __init__(self):
+        self.process_started = process_start_time()
+        self.cold_start = None
+        self.first_render = None
+        self.first_page_render = {}
+        self._lock = threading.Lock()
+
+    def record(self, page, started):
+        """Record a finished script run that began at ``started``."""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if self.first_render is None:
+                self.first_render = elapsed
+                logger.info("cold start: first render (%s) took %.3fs", page, elapsed)
+                if self.process_started is not None:
+                    self.cold_start = time.time() - self.process_started
+                    logger.info("cold start: %.3fs from process start to first render", self.cold_start)
+            if page not in self.first_page_render:
+                self.first_page_render[page] = elapsed
+                logger.info("first render of page %r took %.3fs", page, elapsed)
+        return elapsed
+
+
+@st.cache_resource(show_spinner=False)
+def startup_timings():
+    """Process-wide timings, created on the first script run."""
+    return StartupTimings()
@@ -0,0 +1,179 @@
+# ============================================================
+# SYNTHETIC JOB-MARKET DATA GENERATOR
+# ============================================================
+# Vectorized NumPy generator for datasets of any size with the columns
+# of the sample frame plus city, industry and skill dimensions:
+#
+#   - cities, industries and skills follow skewed popularity weights
+#   - experience is right-skewed (many juniors, few 15+ year seniors)
+#   - the median salary is log-normal around a base that grows with the
+#     year, city tier, industry, skill premium, experience (concave) and
+#     demand; min / max bracket the median
+#   - demand_index is driven by the skill, openings by demand and city
+#
+# Rows are produced in fixed-size chunks, each from its own seeded
+# generator, so output is reproducible and memory stays flat. Stream a
+# 100M-row dataset to Parquet with:
+#     python synthetic_data.py jobs.parquet --rows 100000000
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from schema import SCHEMA
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+YEARS = np.arange(2019, 2025)
+YEAR_WEIGHTS = np.array([0.12, 0.13, 0.16, 0.17, 0.20, 0.22])
+SALARY_GROWTH = 0.045
+
+# name: (popularity weight, salary multiplier, openings multiplier)
+CITIES = {
+    "Beijing": (0.14, 1.35, 1.6),
+    "Shanghai": (0.14, 1.38, 1.6),
+    "Shenzhen": (0.11, 1.30, 1.4),
+    "Guangzhou": (0.09, 1.12, 1.2),
+    "Hangzhou": (0.08, 1.18, 1.1),
+    "Chengdu": (0.07, 0.95, 1.0),
+    "Nanjing": (0.06, 1.02, 0.9),
+    "Wuhan": (0.06, 0.93, 0.9),
+    "Suzhou": (0.05, 1.00, 0.8),
+    "Xi'an": (0.05, 0.86, 0.7),
+    "Tianjin": (0.05, 0.92, 0.7),
+    "Chongqing": (0.05, 0.88, 0.8),
+    "Qingdao": (0.03, 0.85, 0.6),
+    "Changsha": (0.02, 0.84, 0.6),
+}
+
+# name: (popularity weight, salary multiplier)
+INDUSTRIES = {
+    "Internet": (0.22, 1.25),
+    "Finance": (0.12, 1.30),
+    "Manufacturing": (0.18, 0.90),
+    "Education": (0.09, 0.82),
+    "Healthcare": (0.08, 0.98),
+    "Retail": (0.11, 0.80),
+    "Energy": (0.06, 1.05),
+    "Logistics": (0.08, 0.85),
+    "Real Estate": (0.06, 0.95),
+}
+
+# name: (popularity weight, salary premium, mean demand index)
+SKILLS = {
+    "Python": (0.10, 1.15, 82),
+    "Java": (0.10, 1.10, 76),
+    "Machine Learning": (0.05, 1.35, 88),
+    "Data Analysis": (0.09, 1.08, 80),
+    "Cloud Computing": (0.05, 1.25, 85),
+    "Frontend Development": (0.08, 1.02, 70),
+    "Embedded Systems": (0.05, 1.12, 72),
+    "Project Management": (0.08, 1.05, 65),
+    "Sales": (0.12, 0.88, 60),
+    "Accounting": (0.09, 0.86, 55),
+    "Mechanical Design": (0.07, 0.95, 58),
+    "Customer Service": (0.12, 0.75, 50),
+}
+
+
+def _weights(table, column=0):
+    weights = np.array([row[column] for row in table.values()], dtype=np.float64)
+    return weights / weights.sum()
+
+
+def _attribute(table, column):
+    return np.array([row[column] for row in table.values()], dtype=np.float64)
+
+
+def _categorical(codes, table):
+    return pd.Categorical.from_codes(codes, categories=list(table))
+
+
+def generate_frame(rows, seed=0):
+    """``rows`` synthetic postings from a generator seeded with ``seed``."""
+    rng = np.random.default_rng(seed)
+
+    year = rng.choice(YEARS, rows, p=YEAR_WEIGHTS)
+    city = rng.choice(len(CITIES), rows, p=_weights(CITIES))
+    industry = rng.choice(len(INDUSTRIES), rows, p=_weights(INDUSTRIES))
+    skill = rng.choice(len(SKILLS), rows, p=_weights(SKILLS))
+
+    # Right-skewed experience, capped at 20 years.
+    experience = np.minimum(rng.gamma(1.6, 2.6, rows), 20).astype(np.uint8)
+
+    # Demand centres on the skill's level, drifts up a little over time.
+    demand = _attribute(SKILLS, 2)[skill] + 1.2 * (year - YEARS[0]) + rng.normal(0, 7, rows)
+    demand = np.clip(np.rint(demand), 1, 100)
+
+    base = (
+        7000.0
+        * (1 + SALARY_GROWTH) ** (year - YEARS[0])
+        * _attribute(CITIES, 1)[city]
+        * _attribute(INDUSTRIES, 1)[industry]
+        * _attribute(SKILLS, 1)[skill]
+        * (1 + 0.11 * experience - 0.0025 * experience.astype(np.float64) ** 2)
+        * (0.8 + 0.004 * demand)
+    )
+    median = base * rng.lognormal(0.0, 0.18, rows)
+    low = median * rng.uniform(0.62, 0.85, rows)
+    high = median * rng.uniform(1.25, 1.9, rows)
+
+    openings_mean = 4.0 * _attribute(CITIES, 2)[city] * np.exp((demand - 60.0) / 25.0)
+    openings = rng.poisson(openings_mean) + 1
+
+    frame = pd.DataFrame({
+        "year": year,
+        "salary_min_cny": np.round(low, -1),
+        "salary_median_cny": np.round(median, -1),
+        "salary_max_cny": np.round(high, -1),
+        "experience_years": experience,
+        "demand_index": demand,
+        "job_openings": openings,
+        "city": _categorical(city, CITIES),
+        "industry": _categorical(industry, INDUSTRIES),
+        "skill": _categorical(skill, SKILLS),
+    })
+    return frame.astype(SCHEMA)
+
+
+def generate(rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield ``rows`` rows as frames of at most ``chunk_rows`` rows.
+
+    Chunk ``i`` is drawn from ``default_rng([seed, i])``, so the same
+    arguments always produce the same data.
+    """
+    for index, start in enumerate(range(0, rows, chunk_rows)):
+        yield generate_frame(min(chunk_rows, rows - start), seed=[seed, index])
+
+
+def write_parquet(path, rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Stream ``rows`` synthetic rows to ``path``, one row group per chunk."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in generate(rows, seed, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic job-market dataset to Parquet.")
+    parser.add_argument("path", help="output .parquet file")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args(argv)
+    write_parquet(args.path, args.rows, args.seed, args.chunk_rows)
+    print(f"wrote {args.rows:,} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# Tests import the dashboard modules from the repository root.
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CITIES = ("Beijing", "Shanghai", "Shenzhen")
+
+
+def job_frame(rows, seed=0, missing_salary=0.0, year_weights=None, cities=CITIES):
+    """``rows`` random postings in the compact schema (see schema.py).
+
+    ``missing_salary`` is the share of NaN salaries; ``year_weights``
+    skews the years 2015-2024 (uniform by default).
+    """
+    rng = np.random.default_rng(seed)
+    years = rng.choice(np.arange(2015, 2025), rows, p=year_weights)
+    salary = rng.lognormal(9.5, 0.4, rows).astype("float32")
+    salary[rng.random(rows) < missing_salary] = np.nan
+    return pd.DataFrame({
+        "year": years.astype("int16"),
+        "experience_years": rng.integers(0, 11, rows).astype("uint8"),
+        "demand_index": rng.integers(0, 101, rows).astype("uint8"),
+        "salary_median_cny": salary,
+        "job_openings": rng.integers(1, 50, rows).astype("uint32"),
+        "city": pd.Categorical(rng.choice(cities, rows)),
+    })
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from aggregates import compute_cube, merge_cubes, rollup
+from conftest import job_frame
+
+
+@pytest.mark.parametrize("stat", ["mean", "sum", "count", "min", "max"])
+@pytest.mark.parametrize("by", [["year"], ["experience_years"], ["year", "demand_index"]])
+def test_rollup_matches_groupby(by, stat):
+    df = job_frame(50_000)
+    columns = ["salary_median_cny", "job_openings"]
+    expected = df.astype({"salary_median_cny": "float64"}).groupby(by)[columns].agg(stat).reset_index()
+    actual = rollup(compute_cube(df), by, columns, stat)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=False, rtol=1e-12)
+
+
+def test_float32_sums_are_accumulated_in_float64():
+    df = job_frame(200_000)
+    cube = compute_cube(df)
+    assert cube[("salary_median_cny", "sum")].dtype == "float64"
+    assert cube[("salary_median_cny", "sum")].sum() == pytest.approx(
+        df["salary_median_cny"].astype("float64").sum(), rel=1e-14
+    )
+
+
+def test_merged_cubes_match_a_full_build():
+    df = job_frame(20_000)
+    merged = merge_cubes(compute_cube(df.iloc[:7_000]), compute_cube(df.iloc[7_000:]))
+    for stat in ["mean", "sum", "count", "min", "max"]:
+        pd.testing.assert_frame_equal(
+            rollup(merged, ["year"], ["salary_median_cny"], stat),
+            rollup(compute_cube(df), ["year"], ["salary_median_cny"], stat),
+            check_dtype=False, check_exact=False, rtol=1e-12,
+        )
+
+
+def test_merge_keeps_the_cube_dtypes():
+    df = job_frame(20_000)
+    # Overlapping year ranges, so each side lacks some cells of the other.
+    left, right = df[df["year"] < 2020], df[df["year"] >= 2018]
+    merged = merge_cubes(compute_cube(left), compute_cube(right))
+    full = compute_cube(pd.concat([left, right]))
+    pd.testing.assert_series_equal(merged.dtypes, full.dtypes)
+    assert merged[("demand_index", "max")].max() == df["demand_index"].max()
+    assert str(merged[("demand_index", "max")].max()) == str(df["demand_index"].max())
@@ -0,0 +1,40 @@
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from aggregates import compute_cube, rollup
+from api import BadRequest, _number, forecast_endpoint, request_filters
+from conftest import job_frame
+from forecast_models import fit_panel, forecast
+
+
+class CubeBackend:
+    def __init__(self, cube):
+        self.rollup = partial(rollup, cube)
+
+
+@pytest.mark.parametrize("raw", ["nan", "inf", "-inf", "NaN"])
+def test_non_finite_numbers_are_bad_requests(raw):
+    with pytest.raises(BadRequest):
+        _number({"x": [raw]}, "x", 0)
+    with pytest.raises(BadRequest):
+        request_filters({"min_demand_index": [raw]})
+
+
+def test_number_bounds_and_defaults():
+    assert _number({}, "x", 3) == 3
+    assert _number({"x": ["2"]}, "x", 0, int, 1, 5) == 2
+    with pytest.raises(BadRequest):
+        _number({"x": ["9"]}, "x", 0, int, 1, 5)
+
+
+@pytest.mark.parametrize("model", ["linear trend", "holt", "seasonal naive"])
+@pytest.mark.parametrize("column,stat", [("salary_median_cny", "mean"), ("job_openings", "sum")])
+def test_forecast_matches_the_cube_fit(model, column, stat):
+    cube = compute_cube(job_frame(5_000))
+    query = {"model": [model], "horizon": ["3"], "column": [column], "stat": [stat]}
+    actual = forecast_endpoint(CubeBackend(cube), query)
+    name = {"linear trend": "Linear trend", "holt": "Holt", "seasonal naive": "Seasonal naive"}[model]
+    expected = forecast(fit_panel(cube, "test", (), column, stat), name, 3)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from conftest import job_frame
+from downsampling import stratified_sample
+
+# Three common years and seven rare ones.
+SKEWED_YEARS = np.r_[[0.3] * 3, [0.1 / 7] * 7]
+
+
+@pytest.mark.parametrize("limit", [50, 200, 1_000, 5_000])
+def test_sample_never_exceeds_the_limit(limit):
+    df = job_frame(100_000, seed=1, year_weights=SKEWED_YEARS)
+    sample = stratified_sample(df, limit)
+    assert len(sample) <= limit
+    assert sample.index.is_monotonic_increasing and sample.index.is_unique
+
+
+def test_every_stratum_is_kept_when_there_is_room():
+    df = job_frame(100_000, seed=1, year_weights=SKEWED_YEARS)
+    strata = df.groupby(["year", "experience_years"]).ngroups
+    sample = stratified_sample(df, strata + 10)
+    assert sample.groupby(["year", "experience_years"]).ngroups == strata
+
+
+def test_sample_is_roughly_proportional():
+    df = job_frame(200_000, seed=1, year_weights=SKEWED_YEARS)
+    sample = stratified_sample(df, 5_000)
+    assert len(sample) >= 4_500
+    expected = df["year"].value_counts(normalize=True)
+    actual = sample["year"].value_counts(normalize=True).reindex(expected.index)
+    np.testing.assert_allclose(actual, expected, atol=0.02)
+
+
+def test_small_frames_are_unchanged():
+    df = job_frame(100, seed=1, year_weights=SKEWED_YEARS)
+    assert stratified_sample(df, 100) is df
+
+
+def test_strata_missing_from_the_frame_are_ignored():
+    df = job_frame(50_000, seed=1, year_weights=SKEWED_YEARS)
+    by_experience = stratified_sample(df[["experience_years", "salary_median_cny"]], 200)
+    assert len(by_experience) <= 200
+    assert by_experience["experience_years"].nunique() == df["experience_years"].nunique()
+    assert len(stratified_sample(df[["salary_median_cny"]], 200)) <= 200
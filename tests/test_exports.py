@@ -0,0 +1,95 @@
+import io
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import exports
+from conftest import job_frame
+from exports import EXPORT_FORMATS, export_bytes, export_path
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(exports.EXPORT_DIR_ENV, str(tmp_path))
+
+
+def read(data, export_format):
+    if export_format == "Parquet":
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_csv(io.BytesIO(data), compression="gzip" if export_format == "CSV (gzip)" else None)
+
+
+@pytest.mark.parametrize("export_format", list(EXPORT_FORMATS))
+def test_export_of_row_positions_matches_the_subset(export_format):
+    df = job_frame(2_500)
+    rows = np.flatnonzero(df["year"].to_numpy() >= 2020)
+    exported = read(export_bytes(df, "v1|rows", export_format, rows), export_format)
+    expected = df.iloc[rows].reset_index(drop=True)
+    pd.testing.assert_frame_equal(exported, expected, check_dtype=False, check_categorical=False)
+
+
+def test_exports_of_different_paths_run_in_parallel(monkeypatch):
+    df = job_frame(10)
+    running, overlapped = set(), []
+
+    def slow_write(df, path, export_format, chunk_rows=None, rows=None):
+        running.add(path)
+        time.sleep(0.2)
+        overlapped.append(len(running) > 1)
+        running.discard(path)
+        open(path, "w").close()
+
+    monkeypatch.setattr(exports, "write_export", slow_write)
+    threads = [threading.Thread(target=export_path, args=(df, version, "CSV")) for version in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert any(overlapped)
+
+
+def test_same_export_is_written_once(monkeypatch):
+    df = job_frame(10)
+    writes = []
+
+    def counting_write(df, path, export_format, chunk_rows=None, rows=None):
+        writes.append(path)
+        time.sleep(0.05)
+        open(path, "w").close()
+
+    monkeypatch.setattr(exports, "write_export", counting_write)
+    threads = [threading.Thread(target=export_path, args=(df, "same", "CSV")) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(writes) == 1
+
+
+def test_old_exports_are_pruned(tmp_path, monkeypatch):
+    monkeypatch.setenv(exports.EXPORT_KEEP_ENV, "3")
+    df = job_frame(10)
+    paths = []
+    for number in range(6):
+        paths.append(export_path(df, f"v{number}", "CSV"))
+        # Distinct modification times, oldest first.
+        os.utime(paths[-1], (number, number))
+    export_path(df, "v1", "CSV")
+    export_path(df, "v6", "CSV")
+    kept = sorted(os.listdir(tmp_path))
+    expected = sorted(os.path.basename(p) for p in [paths[1], paths[5], export_path(df, "v6", "CSV")])
+    assert kept == expected
+
+
+def test_stale_partial_files_are_removed(tmp_path):
+    partial = tmp_path / f"{exports.EXPORT_BASENAME}-dead.csv.123.partial"
+    partial.write_text("x")
+    os.utime(partial, (0, 0))
+    fresh = tmp_path / f"{exports.EXPORT_BASENAME}-live.csv.456.partial"
+    fresh.write_text("x")
+    assert exports.prune_exports(str(tmp_path), keep=5) == [str(partial)]
+    assert fresh.exists()
@@ -0,0 +1,34 @@
+import plotly.express as px
+import plotly.io as pio
+import pytest
+
+from conftest import job_frame
+from figure_cache import FigureCache, figure_nbytes
+
+
+def figures():
+    df = job_frame(20_000)
+    return [
+        px.scatter(df, x="experience_years", y="salary_median_cny", color="city"),
+        px.scatter(df, x="demand_index", y="salary_median_cny", size="job_openings", hover_data=["city"]),
+        px.violin(df, x="city", y="salary_median_cny"),
+        px.bar(df.head(30), x="city", y="job_openings"),
+    ]
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_size_estimate_is_close_to_the_json_size(index):
+    fig = figures()[index]
+    fig.update_layout(template="plotly_white")
+    actual = len(pio.to_json(fig, validate=False))
+    assert 0.5 * actual < figure_nbytes(fig) < 2 * actual
+
+
+def test_cache_stays_within_its_budget():
+    figs = figures()
+    cache = FigureCache(max_bytes=figure_nbytes(figs[0]) + figure_nbytes(figs[3]))
+    for key, fig in enumerate(figs):
+        assert cache.get_or_build(key, lambda: fig) is fig
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.get_or_build(3, lambda: None) is figs[3]
+    assert cache.hits == 1
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from conftest import job_frame
+from filter_index import FILTER_COLUMNS, FilterIndex
+
+
+def mask_rows(df, thresholds):
+    keep = np.ones(len(df), dtype=bool)
+    for column, value in thresholds.items():
+        keep &= (df[column] >= value).to_numpy()
+    return np.flatnonzero(keep)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rows_at_least_matches_a_boolean_mask(seed):
+    df = job_frame(30_000, seed, missing_salary=0.03)
+    index = FilterIndex(df)
+    rng = np.random.default_rng(seed)
+    candidates = {
+        "experience_years": [-1, 0, 2.5, 5, 10, 11, 300],
+        "salary_median_cny": [0, 8_000, 13_000.5, 25_000, 60_000, 1e9],
+        "demand_index": [0, 30, 50.2, 90, 99, 100, 101],
+    }
+    for _ in range(50):
+        columns = rng.choice(FILTER_COLUMNS, rng.integers(1, 4), replace=False)
+        thresholds = {column: rng.choice(candidates[column]) for column in columns}
+        np.testing.assert_array_equal(index.rows_at_least(thresholds), mask_rows(df, thresholds))
+
+
+def test_no_thresholds_keeps_every_row():
+    df = job_frame(1_000, missing_salary=0.03)
+    np.testing.assert_array_equal(FilterIndex(df).rows_at_least({}), np.arange(len(df)))
+
+
+def test_low_threshold_on_a_column_with_nans_drops_them():
+    df = job_frame(1_000, missing_salary=0.03)
+    rows = FilterIndex(df).rows_at_least({"salary_median_cny": 0})
+    np.testing.assert_array_equal(rows, np.flatnonzero(df["salary_median_cny"].notna()))
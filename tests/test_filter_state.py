@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from aggregates import rollup, total
+from conftest import job_frame
+from filter_state import FILTER_STATE_KEY, filter_dataset
+
+THRESHOLDS = {"demand_index": 40, "experience_years": 3, "salary_median_cny": 12_000}
+# Clamped to the slider maxima, which no row reaches all at once.
+NOTHING = {"demand_index": 100, "experience_years": 10, "salary_median_cny": 10 ** 9}
+
+
+@pytest.fixture(scope="module")
+def df():
+    return job_frame(30_000, missing_salary=0.02)
+
+
+def masked(df, thresholds):
+    keep = np.ones(len(df), dtype=bool)
+    for column, value in thresholds.items():
+        keep &= (df[column] >= value).to_numpy()
+    return df[keep]
+
+
+@pytest.mark.parametrize("thresholds", [{"demand_index": 60}, THRESHOLDS])
+def test_frame_matches_a_boolean_mask(df, thresholds):
+    filtered = filter_dataset(df, f"filter-frame-{len(thresholds)}", thresholds)
+    expected = masked(df, thresholds)
+    assert len(filtered) == len(expected)
+    pd.testing.assert_frame_equal(filtered.frame(), expected)
+    columns = ["city", "salary_median_cny"]
+    pd.testing.assert_frame_equal(filtered.frame(columns), expected[columns])
+
+
+def test_cube_matches_a_boolean_mask(df):
+    filtered = filter_dataset(df, "filter-cube", THRESHOLDS)
+    expected = masked(df, THRESHOLDS).astype({"salary_median_cny": "float64"})
+    cube = filtered.cube()
+    columns = ["salary_median_cny", "job_openings"]
+    for stat in ["mean", "sum", "count", "min", "max"]:
+        pd.testing.assert_frame_equal(
+            rollup(cube, ["year"], columns, stat),
+            expected.groupby("year")[columns].agg(stat).reset_index(),
+            check_dtype=False, check_exact=False, rtol=1e-12,
+        )
+        assert total(cube, "demand_index", stat) == pytest.approx(expected["demand_index"].agg(stat))
+
+
+def test_pages_match_a_boolean_mask(df):
+    filtered = filter_dataset(df, "filter-pages", THRESHOLDS)
+    expected = masked(df, THRESHOLDS)
+    pd.testing.assert_frame_equal(filtered.page(1, 50), expected.iloc[:50])
+    last = -(-len(expected) // 50)
+    pd.testing.assert_frame_equal(filtered.page(last, 50), expected.iloc[(last - 1) * 50:])
+
+    order = filtered.sort_permutation("salary_median_cny", ascending=False)
+    by_salary = expected.sort_values("salary_median_cny", ascending=False, kind="stable", na_position="last")
+    pd.testing.assert_frame_equal(filtered.page(3, 50, order), by_salary.iloc[100:150])
+
+
+def test_no_thresholds_keep_the_dataset_and_its_version(df):
+    filtered = filter_dataset(df, "filter-none", {})
+    assert filtered.rows is None
+    assert filtered.version == "filter-none"
+    assert filtered.frame() is df
+    assert len(filtered) == len(df)
+
+
+def test_thresholds_get_their_own_version(df):
+    first = filter_dataset(df, "filter-version", {"experience_years": 3, "demand_index": 40})
+    second = filter_dataset(df, "filter-version", {"demand_index": 40, "experience_years": 3})
+    assert first.version == second.version == "filter-version|min:demand_index>=40,experience_years>=3"
+    assert first.rows is second.rows
+    assert not first.rows.flags.writeable
+
+
+def _filters_app():
+    import streamlit as st
+    from conftest import job_frame
+    from filter_state import apply_global_filters
+
+    filtered = apply_global_filters(job_frame(30_000, missing_salary=0.02), "filter-app")
+    st.session_state["result"] = (len(filtered), filtered.version)
+
+
+@pytest.mark.parametrize(
+    ("thresholds", "fallback"), [({}, False), (THRESHOLDS, False), (NOTHING, True)]
+)
+def test_apply_global_filters_reads_the_session_thresholds(df, thresholds, fallback):
+    app = AppTest.from_function(_filters_app, default_timeout=60)
+    app.session_state[FILTER_STATE_KEY] = thresholds
+    app.run()
+    assert not app.exception, [error.message for error in app.exception]
+
+    rows, version = app.session_state["result"]
+    if fallback:
+        assert (rows, version) == (len(df), "filter-app")
+        assert app.sidebar.warning
+    else:
+        assert rows == len(masked(df, thresholds))
+        assert version == filter_dataset(df, "filter-app", thresholds).version
+        assert not app.sidebar.warning
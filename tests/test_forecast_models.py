@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregates import compute_cube
+from forecast_models import fit_linear, fit_panel, forecast
+
+
+def linear_frame(rows_per_cell=20, seed=0):
+    """Mean salary per (year, experience) lies exactly on 8000 + 400 * (year - 2015) + 1000 * experience."""
+    rng = np.random.default_rng(seed)
+    cells = [(year, experience) for year in range(2015, 2025) for experience in range(0, 6)]
+    frames = []
+    for year, experience in cells:
+        # Noise symmetric around the cell mean, so the mean is exact.
+        noise = rng.normal(0, 500, rows_per_cell // 2)
+        mean = 8000 + 400 * (year - 2015) + 1000 * experience
+        frames.append(pd.DataFrame({
+            "year": year,
+            "experience_years": experience,
+            "demand_index": rng.integers(0, 101, rows_per_cell),
+            "salary_median_cny": mean + np.r_[noise, -noise],
+            "job_openings": 1,
+        }))
+    return pd.concat(frames, ignore_index=True).astype({
+        "year": "int16", "experience_years": "uint8", "demand_index": "uint8", "job_openings": "uint32",
+    })
+
+
+def test_linear_trend_recovers_a_known_line():
+    cube = compute_cube(linear_frame())
+    panel = fit_panel(cube, "linear-test", (), "salary_median_cny")
+    params = panel["params"]["Linear trend"]
+    # The overall mean averages experience 0..5, adding 2500.
+    np.testing.assert_allclose(params["slope"], [400])
+    np.testing.assert_allclose(params["intercept"] + params["slope"] * 2015, [10_500])
+    np.testing.assert_allclose(params["sigma"], [0], atol=1e-6)
+
+    result = forecast(panel, "Linear trend", horizon=3)
+    np.testing.assert_array_equal(result["year"], [2025, 2026, 2027])
+    np.testing.assert_allclose(result["forecast"], [14_500, 14_900, 15_300])
+    np.testing.assert_allclose(result["lower"], result["forecast"], atol=1e-6)
+
+
+def test_segments_are_fitted_separately():
+    cube = compute_cube(linear_frame())
+    panel = fit_panel(cube, "linear-test", ("experience_years",), "salary_median_cny")
+    assert panel["keys"]["experience_years"].tolist() == list(range(6))
+    result = forecast(panel, "Linear trend", horizon=1)
+    np.testing.assert_allclose(result["forecast"], 8000 + 400 * 10 + 1000 * np.arange(6))
+
+
+def test_other_models_on_a_line():
+    cube = compute_cube(linear_frame())
+    panel = fit_panel(cube, "linear-test", (), "salary_median_cny")
+    naive = forecast(panel, "Seasonal naive", horizon=2)
+    np.testing.assert_allclose(naive["forecast"], [14_100, 14_100])
+    holt = forecast(panel, "Holt", horizon=2)
+    np.testing.assert_allclose(holt["forecast"], [14_500, 14_900], rtol=0.02)
+
+
+def test_fit_linear_matches_polyfit_with_gaps():
+    rng = np.random.default_rng(1)
+    years = np.arange(2010, 2025)
+    values = 50 + 3 * (years - 2010)[None, :] + rng.normal(0, 2, (4, len(years)))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    params = fit_linear(values, years)
+    for row, series in enumerate(values):
+        observed = ~np.isnan(series)
+        slope, intercept = np.polyfit(years[observed], series[observed], 1)
+        assert params["slope"][row] == pytest.approx(slope)
+        assert params["intercept"][row] == pytest.approx(intercept)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from conftest import job_frame
+from ingestion import FrameBuffer, PartitionedStore, ingest
+
+
+def batch(rows, seed, cities):
+    """A batch whose cities are drawn from ``cities``, some missing."""
+    df = job_frame(rows, seed, cities=cities)
+    missing = np.random.default_rng(seed).random(rows) < 0.05
+    df["city"] = df["city"].astype(object).mask(missing).astype("category")
+    return df
+
+
+def naive(batches):
+    frame = pd.concat(batches, ignore_index=True)
+    frame["city"] = frame["city"].astype("str").where(frame["city"].notna())
+    return frame
+
+
+def test_appends_match_a_full_concat():
+    buffer = FrameBuffer()
+    batches = [
+        batch(1_000, 0, ["Beijing", "Shanghai"]),
+        batch(10, 1, ["Shenzhen", "Beijing"]),
+        batch(3_000, 2, ["Chengdu"]),
+        batch(1, 3, ["Beijing"]),
+    ]
+    frames = [buffer.append(part) for part in batches]
+    for count, frame in enumerate(frames, start=1):
+        # Earlier frames keep their rows after later appends.
+        expected = naive(batches[:count])
+        actual = frame.assign(city=frame["city"].astype("str").where(frame["city"].notna()))
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        assert frame["city"].dtype == "category"
+
+
+def test_dtype_widening_keeps_values():
+    buffer = FrameBuffer()
+    first = batch(100, 0, ["Beijing"])
+    second = batch(100, 1, ["Beijing"]).astype({"job_openings": "float64"})
+    second.loc[0, "job_openings"] = 0.5
+    frame = buffer.append(first)
+    frame = buffer.append(second)
+    assert frame["job_openings"].dtype == "float64"
+    np.testing.assert_array_equal(frame["job_openings"], np.r_[first["job_openings"], second["job_openings"]])
+
+
+def test_refresh_publishes_one_snapshot(tmp_path):
+    store = PartitionedStore(str(tmp_path))
+    assert store.refresh() == 0 and store.snapshot is None
+    ingest(batch(500, 0, ["Beijing"]).assign(month=1), str(tmp_path))
+    store.refresh()
+    first = store.snapshot
+    ingest(batch(200, 1, ["Shanghai"]).assign(month=2), str(tmp_path))
+    assert store.refresh() > 0
+    second = store.snapshot
+    assert len(first.frame) == 500 and len(second.frame) == 700
+    assert first.version != second.version
+    assert second.cube is not first.cube
+    pd.testing.assert_series_equal(second.cube.dtypes, first.cube.dtypes)
+    assert first.frame["city"].cat.categories.tolist() == ["Beijing"]
@@ -0,0 +1,37 @@
+import importlib.util
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from synthetic_data import write_parquet
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app_pages")
+PAGES = sorted(name[:-3] for name in os.listdir(PAGES_DIR) if name.endswith(".py") and not name.startswith("_"))
+BACKENDS = ["pandas"] + (["duckdb"] if importlib.util.find_spec("duckdb") else [])
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    # A file of its own: figures are cached per dataset version, not per render mode.
+    return write_parquet(str(tmp_path_factory.mktemp("pages") / "sample-mode.parquet"), 5_000, seed=7)
+
+
+@pytest.mark.parametrize("filtered", [False, True], ids=["all rows", "filtered"])
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("page", PAGES)
+def test_page_renders_in_sample_mode(page, backend, filtered, dataset, tmp_path, monkeypatch):
+    monkeypatch.setenv("JOB_DATA_PATH", dataset)
+    monkeypatch.setenv("JOB_QUERY_BACKEND", backend)
+    monkeypatch.setenv("JOB_RENDER_MODE", "sample")
+    # Below the row count, so every row-level chart is sampled.
+    monkeypatch.setenv("JOB_MAX_POINTS", "500")
+    monkeypatch.setenv("JOB_EXPORT_DIR", str(tmp_path))
+    monkeypatch.delenv("JOB_DATA_DIR", raising=False)
+    monkeypatch.delenv("JOB_SHARED_CACHE_DIR", raising=False)
+
+    app = AppTest.from_file(os.path.join(PAGES_DIR, f"{page}.py"), default_timeout=120)
+    if filtered:
+        app.session_state["global_filters"] = {"demand_index": 50, "experience_years": 2}
+    app.run()
+    assert not app.exception, [error.message for error in app.exception]
@@ -0,0 +1,69 @@
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from query_backend import data_backend, market_kpis
+from synthetic_data import write_parquet
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec("duckdb") is None, reason="duckdb is not installed")
+
+THRESHOLDS = [{}, {"demand_index": 60}, {"experience_years": 3, "salary_median_cny": 12_000}]
+STATS = ["mean", "sum", "count", "min", "max"]
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    return write_parquet(str(tmp_path_factory.mktemp("backends") / "parity.parquet"), 20_000, seed=3)
+
+
+@pytest.fixture
+def backends(dataset, monkeypatch):
+    """``backends(thresholds)`` -> (pandas backend, duckdb backend) over the same file."""
+    monkeypatch.setenv("JOB_DATA_PATH", dataset)
+    monkeypatch.delenv("JOB_DATA_DIR", raising=False)
+    monkeypatch.delenv("JOB_SHARED_CACHE_DIR", raising=False)
+
+    def build(thresholds):
+        pair = []
+        for name in ("pandas", "duckdb"):
+            monkeypatch.setenv("JOB_QUERY_BACKEND", name)
+            pair.append(data_backend(thresholds))
+        return pair
+
+    return build
+
+
+@pytest.mark.parametrize("thresholds", THRESHOLDS)
+def test_filtered_row_counts_match(backends, dataset, thresholds):
+    pandas_backend, duckdb_backend = backends(thresholds)
+    df = pd.read_parquet(dataset)
+    keep = np.ones(len(df), dtype=bool)
+    for column, value in thresholds.items():
+        keep &= (df[column] >= value).to_numpy()
+    assert pandas_backend.row_count() == duckdb_backend.row_count() == keep.sum()
+
+
+@pytest.mark.parametrize("thresholds", THRESHOLDS)
+@pytest.mark.parametrize("by", [["year"], ["experience_years"], ["year", "demand_index"]])
+@pytest.mark.parametrize("stat", STATS)
+def test_rollups_match(backends, thresholds, by, stat):
+    pandas_backend, duckdb_backend = backends(thresholds)
+    columns = ["salary_median_cny", "job_openings"]
+    pd.testing.assert_frame_equal(
+        pandas_backend.rollup(by, columns, stat).reset_index(drop=True),
+        duckdb_backend.rollup(by, columns, stat).reset_index(drop=True),
+        check_dtype=False, check_exact=False, rtol=1e-6,
+    )
+
+
+@pytest.mark.parametrize("thresholds", THRESHOLDS)
+def test_kpis_and_totals_match(backends, thresholds):
+    pandas_backend, duckdb_backend = backends(thresholds)
+    assert market_kpis(pandas_backend) == pytest.approx(market_kpis(duckdb_backend), rel=1e-6)
+    for stat in STATS:
+        assert float(pandas_backend.total("demand_index", stat)) == pytest.approx(
+            float(duckdb_backend.total("demand_index", stat))
+        )
+    assert pandas_backend.quantile("demand_index", 0.75) == duckdb_backend.quantile("demand_index", 0.75)
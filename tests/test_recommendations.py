@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from conftest import job_frame
+from recommendations import (
+    HIGH_DEMAND_QUANTILE, RECOMMENDATION_RANKING, RECOMMENDATION_SEGMENTS, TOP_K,
+    RecommendationIndex, top_rows_per_level,
+)
+
+
+def brute_force(df, experience, min_salary, limit):
+    keep = (
+        (df["demand_index"] >= df["demand_index"].quantile(HIGH_DEMAND_QUANTILE))
+        & (df["experience_years"] <= experience)
+        & (df["salary_median_cny"] >= min_salary)
+    )
+    ranked = df[keep].sort_values(list(RECOMMENDATION_RANKING), ascending=False, na_position="last")
+    return ranked.head(limit)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_recommend_matches_filter_and_sort(seed):
+    df = job_frame(20_000, seed, missing_salary=0.02)
+    # Round salaries so some jobs tie on (demand, salary).
+    df["salary_median_cny"] = df["salary_median_cny"].round(-2)
+    top = top_rows_per_level(df, list(RECOMMENDATION_SEGMENTS), RECOMMENDATION_RANKING[1:], TOP_K)
+    index = RecommendationIndex(top, df["demand_index"].quantile(HIGH_DEMAND_QUANTILE))
+    rng = np.random.default_rng(seed)
+    for _ in range(20):
+        experience = int(rng.integers(0, 11))
+        min_salary = float(rng.choice([0, 10_000, 15_000, 30_000]))
+        limit = int(rng.integers(1, TOP_K + 1))
+        actual = index.recommend(experience, min_salary, limit)
+        expected = brute_force(df, experience, min_salary, limit)
+        # Rows tied on (demand, salary) may come in any order.
+        columns = list(RECOMMENDATION_RANKING)
+        np.testing.assert_array_equal(actual[columns].to_numpy(), expected[columns].to_numpy())
+        assert (actual["experience_years"] <= experience).all()
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import job_frame
+from schema import ARROW_BACKED_ENV, SCHEMA, apply_schema
+
+
+def raw_frame(rows, seed=0):
+    """A frame as read from CSV: int64 / float64 numbers and object strings."""
+    df = job_frame(rows, seed)
+    rng = np.random.default_rng(seed)
+    salary = df["salary_median_cny"].astype("float64").round()
+    return df.astype({column: "int64" for column in ("year", "experience_years", "demand_index", "job_openings")}).assign(
+        salary_min_cny=salary * 0.8,
+        salary_median_cny=salary,
+        salary_max_cny=salary * 1.2,
+        city=df["city"].astype(object),
+        remote_share=rng.random(rows),
+        views=rng.integers(0, 200, rows),
+    )
+
+
+@pytest.fixture(autouse=True)
+def numpy_backed(monkeypatch):
+    monkeypatch.delenv(ARROW_BACKED_ENV, raising=False)
+
+
+def test_round_trip_keeps_every_value():
+    raw = raw_frame(5_000)
+    compact = apply_schema(raw.copy())
+    for column, dtype in SCHEMA.items():
+        assert compact[column].dtype == dtype
+    assert compact["city"].dtype == "category"
+    back = compact.astype({column: raw[column].dtype for column in raw.columns})
+    pd.testing.assert_frame_equal(back, raw, check_exact=False, rtol=1e-6)
+
+
+def test_compact_frame_is_smaller():
+    raw = raw_frame(5_000)
+    before = raw.memory_usage(deep=True).sum()
+    assert apply_schema(raw.copy()).memory_usage(deep=True).sum() * 3 < before
+
+
+def test_columns_that_do_not_fit_keep_their_values():
+    raw = raw_frame(1_000)
+    raw.loc[0, "demand_index"] = 1_000
+    raw.loc[1, "experience_years"] = np.nan
+    compact = apply_schema(raw.copy())
+    assert compact["demand_index"].dtype != "uint8"
+    assert compact["demand_index"].max() == 1_000
+    assert compact["experience_years"].isna().sum() == 1
+    pd.testing.assert_series_equal(
+        compact["experience_years"].astype("float64"), raw["experience_years"], check_exact=False, rtol=1e-6
+    )
+
+
+def test_arrow_backed_round_trip(monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv(ARROW_BACKED_ENV, "1")
+    raw = raw_frame(1_000)
+    compact = apply_schema(raw.copy())
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in compact.dtypes)
+    back = compact.astype({column: raw[column].dtype for column in raw.columns if column != "city"})
+    pd.testing.assert_frame_equal(back.drop(columns="city"), raw.drop(columns="city"), check_exact=False, rtol=1e-6)
+    assert compact["city"].astype(str).tolist() == raw["city"].tolist()
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from conftest import job_frame
+from sketches import (
+    RELATIVE_ACCURACY, compute_sketches, merge_sketches, sketch_box_stats, sketch_frame, sketch_quantile,
+)
+
+QUANTILES = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+
+def test_float_quantiles_within_relative_accuracy():
+    df = job_frame(20_000)
+    sketches = sketch_frame(df)
+    expected = df["salary_median_cny"].astype("float64").quantile(QUANTILES).to_numpy()
+    actual = sketch_quantile(sketches, "salary_median_cny", QUANTILES)
+    # Interpolating between two buckets can add one more bucket's error.
+    np.testing.assert_allclose(actual, expected, rtol=2 * RELATIVE_ACCURACY)
+
+
+@pytest.mark.parametrize("column", ["demand_index", "job_openings", "experience_years"])
+def test_integer_quantiles_are_exact(column):
+    df = job_frame(5_000)
+    expected = df[column].quantile(QUANTILES).to_numpy()
+    np.testing.assert_allclose(sketch_quantile(sketch_frame(df), column, QUANTILES), expected)
+
+
+def test_moments_are_exact():
+    df = job_frame(5_000)
+    sketch = sketch_frame(df)[("salary_median_cny", None, None)]
+    salary = df["salary_median_cny"].astype("float64")
+    assert sketch.count == len(df)
+    assert sketch.total == pytest.approx(salary.sum())
+    assert (sketch.minimum, sketch.maximum) == (salary.min(), salary.max())
+
+
+def test_merge_is_associative_and_matches_a_full_build():
+    df = job_frame(9_000)
+    a, b, c = (sketch_frame(df.iloc[start:start + 3_000]) for start in (0, 3_000, 6_000))
+    left = merge_sketches(merge_sketches(a, b), c)
+    right = merge_sketches(a, merge_sketches(b, c))
+    full = sketch_frame(df)
+    assert left.keys() == right.keys() == full.keys()
+    for key in full:
+        for sketch in (left[key], right[key]):
+            np.testing.assert_array_equal(sketch.values, full[key].values)
+            np.testing.assert_array_equal(sketch.counts, full[key].counts)
+            assert sketch.total == pytest.approx(full[key].total)
+
+
+def test_partitioned_build_matches_single_partition():
+    df = job_frame(10_000)
+    partitioned = compute_sketches(df, partition_rows=3_000)
+    whole = sketch_frame(df)
+    for key in whole:
+        np.testing.assert_array_equal(partitioned[key].counts, whole[key].counts)
+
+
+def test_grouped_sketches_skip_rows_without_a_group():
+    df = job_frame(2_000)
+    df["experience_years"] = df["experience_years"].astype("float64")
+    df.loc[[3, 10, 500], "experience_years"] = np.nan
+    stats = sketch_box_stats(sketch_frame(df), "salary_median_cny", "experience_years")
+
+    grouped = df.dropna(subset=["experience_years"]).groupby("experience_years")["salary_median_cny"]
+    assert list(stats.index) == list(grouped.groups)
+    np.testing.assert_allclose(stats["median"], grouped.median(), rtol=2 * RELATIVE_ACCURACY)
+    np.testing.assert_allclose(stats["max"], grouped.max())
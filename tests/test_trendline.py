@@ -0,0 +1,61 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from aggregates import compute_cube
+from conftest import job_frame
+from trendline import add_trendlines, ols_fit
+
+X, Y = "experience_years", "salary_median_cny"
+
+
+def polyfit(df):
+    paired = df[[X, Y]].dropna().astype("float64")
+    slope, intercept = np.polyfit(paired[X], paired[Y], 1)
+    return len(paired), slope, intercept
+
+
+def test_overall_fit_matches_polyfit():
+    df = job_frame(50_000, missing_salary=0.05)
+    fit = ols_fit(compute_cube(df), X, Y).iloc[0]
+    n, slope, intercept = polyfit(df)
+    assert fit["n"] == n
+    assert fit["slope"] == pytest.approx(slope, rel=1e-9)
+    assert fit["intercept"] == pytest.approx(intercept, rel=1e-9)
+    assert (fit["x_min"], fit["x_max"]) == (df[X].min(), df[X].max())
+
+
+def test_per_year_fits_match_polyfit():
+    df = job_frame(50_000, missing_salary=0.05)
+    fits = ols_fit(compute_cube(df), X, Y, by="year").set_index("year")
+    assert list(fits.index) == sorted(df["year"].unique())
+    for year, group in df.groupby("year"):
+        n, slope, intercept = polyfit(group)
+        assert fits.loc[year, "n"] == n
+        assert fits.loc[year, "slope"] == pytest.approx(slope, rel=1e-9)
+        assert fits.loc[year, "intercept"] == pytest.approx(intercept, rel=1e-9)
+
+
+def test_a_single_experience_level_gives_a_flat_line_at_the_mean():
+    df = job_frame(5_000).assign(experience_years=np.uint8(4))
+    fit = ols_fit(compute_cube(df), X, Y).iloc[0]
+    assert fit["slope"] == 0
+    assert fit["intercept"] == pytest.approx(df[Y].astype("float64").mean(), rel=1e-12)
+    assert fit["x_min"] == fit["x_max"] == 4
+
+
+def test_an_empty_cube_has_no_fit():
+    cube = compute_cube(job_frame(100).iloc[:0])
+    overall = ols_fit(cube, X, Y).iloc[0]
+    assert overall["n"] == 0
+    assert np.isnan(overall["intercept"])
+    assert ols_fit(cube, X, Y, by="year").empty
+
+
+def test_one_trace_per_fitted_group():
+    fits = ols_fit(compute_cube(job_frame(5_000)), X, Y, by="year")
+    fig = add_trendlines(go.Figure(), fits, by="year")
+    assert len(fig.data) == len(fits)
+    first = fig.data[0]
+    assert list(first.x) == [fits["x_min"].iloc[0], fits["x_max"].iloc[0]]
+    assert first.y[0] == pytest.approx(fits["intercept"].iloc[0] + fits["slope"].iloc[0] * first.x[0])
@@ -0,0 +1,68 @@
+# ============================================================
+# CLOSED-FORM OLS TRENDLINES FROM THE AGGREGATE CUBE
+# ============================================================
+# px.scatter(trendline="ols") fits with statsmodels over every plotted
+# row on each rerun. The cube already stores n, Σx, Σy, Σxy and Σx² for
+# the pairs in aggregates.REGRESSION_PAIRS, so the least-squares line
+# (overall or per group) is a handful of arithmetic on a few cube rows:
+#
+#     slope     = (n Σxy - Σx Σy) / (n Σx² - (Σx)²)
+#     intercept = (Σy - slope Σx) / n
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from aggregates import regression_columns, rollup, total
+
+
+def ols_fit(cube, x, y, by=None):
+    """Least-squares fit of ``y`` on ``x``, overall or per ``by`` group.
+
+    Returns one row per group with ``n``, ``slope``, ``intercept`` and
+    the ``x_min`` / ``x_max`` range the line should span.
+    """
+    names = regression_columns(x, y)
+    sums = [names["x"], names["y"], names["xy"], names["xx"]]
+
+    if by:
+        stats = rollup(cube, by, sums, "sum")
+        stats["n"] = rollup(cube, by, names["xy"], "count")[names["xy"]]
+        stats["x_min"] = rollup(cube, by, names["x"], "min")[names["x"]]
+        stats["x_max"] = rollup(cube, by, names["x"], "max")[names["x"]]
+    else:
+        stats = pd.DataFrame([{column: total(cube, column, "sum") for column in sums}])
+        stats["n"] = total(cube, names["xy"], "count")
+        stats["x_min"] = total(cube, names["x"], "min")
+        stats["x_max"] = total(cube, names["x"], "max")
+
+    n = stats["n"].to_numpy(dtype=np.float64)
+    sum_x = stats[names["x"]].to_numpy()
+    sum_y = stats[names["y"]].to_numpy()
+    sxx = n * stats[names["xx"]].to_numpy() - sum_x ** 2
+    sxy = n * stats[names["xy"]].to_numpy() - sum_x * sum_y
+
+    # A group with a single distinct x has no slope; draw it flat.
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+    intercept = np.divide(sum_y - slope * sum_x, n, out=np.full_like(n, np.nan), where=n > 0)
+
+    keys = [by] if isinstance(by, str) else list(by or [])
+    return stats[keys + ["n", "x_min", "x_max"]].assign(slope=slope, intercept=intercept)
+
+
+def add_trendlines(fig, fits, by=None, name="OLS trend"):
+    """Draw each fitted line from ``ols_fit`` as its own line trace."""
+    for _, fit in fits.iterrows():
+        xs = np.array([fit["x_min"], fit["x_max"]])
+        label = f"{name} ({by} {fit[by]:g})" if by else name
+        fig.add_trace(go.Scatter(
+            x=xs,
+            y=fit["intercept"] + fit["slope"] * xs,
+            mode="lines",
+            name=label,
+            hovertemplate=(
+                f"{label}<br>y = {fit['slope']:,.2f} x + {fit['intercept']:,.2f}"
+                f"<br>n = {int(fit['n']):,}<extra></extra>"
+            ),
+        ))
+    return fig
@@ -0,0 +1,119 @@
+# ============================================================
+# MULTI-PROCESS CACHE WARM-UP
+# ============================================================
+# Fills the shared on-disk cache (see shared_cache.py) for the current
+# dataset version before any visitor asks for it:
+#
+#   1. this process loads the dataset and writes its aggregate cube and
+#      quantile sketches to the shared cache
+#   2. a process pool renders every page of navigation.PAGES headlessly
+#      (streamlit.testing.v1.AppTest); each figure built on the way is
+#      written to the shared cache, the cube and sketches are read back
+#
+# Run it once per deploy, before or next to the servers:
+#     JOB_SHARED_CACHE_DIR=/var/cache/jobs python warmup.py
+# Servers with JOB_SHARED_CACHE_DIR set also start it in the background
+# whenever they see a dataset version that has not been warmed (the
+# first load after startup, or after ingestion.py added data), and
+# ingestion.py runs it after writing a batch. Only one warm-up per
+# version runs at a time across the node. Every pool worker loads its
+# own copy of the dataset; size JOB_WARMUP_WORKERS (default: one per
+# page, at most one per CPU) to the memory available.
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from navigation import PAGES
+from shared_cache import WARMUP_CHILD_ENV, shared_cache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WARMUP_WORKERS_ENV = "JOB_WARMUP_WORKERS"
+DEFAULT_PAGE_TIMEOUT = 600
+
+
+def warmup_workers():
+    try:
+        return max(1, int(os.environ[WARMUP_WORKERS_ENV]))
+    except (KeyError, ValueError):
+        return max(1, min(len(PAGES), os.cpu_count() or 1))
+
+
+def warm_page(path, timeout=DEFAULT_PAGE_TIMEOUT):
+    """Render one page headlessly; return ``(path, seconds, error or None)``."""
+    from streamlit.testing.v1 import AppTest
+
+    # Pages import the dashboard modules from this directory.
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    started = time.perf_counter()
+    at = AppTest.from_file(os.path.join(HERE, path), default_timeout=timeout).run()
+    error = at.exception[0].message if at.exception else None
+    return path, time.perf_counter() - started, error
+
+
+def warm(workers=None, timeout=DEFAULT_PAGE_TIMEOUT):
+    """Warm the shared cache for the current dataset version.
+
+    Returns ``{page path: (seconds, error)}``, or None if another
+    process is already warming this version.
+    """
+    cache = shared_cache()
+    if cache is None:
+        raise RuntimeError("Set JOB_SHARED_CACHE_DIR to the shared cache directory")
+    # Data loads in this process and its workers must not start warm-ups.
+    os.environ[WARMUP_CHILD_ENV] = "1"
+
+    from aggregates import build_cube
+    from data_loader import get_dataset
+    from sketches import build_sketches
+
+    df, version = get_dataset()
+    if not cache.claim(version):
+        return None
+    try:
+        build_cube(df, version)
+        build_sketches(df, version)
+        del df
+
+        paths = [path for path, _ in PAGES]
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers or warmup_workers(), mp_context=context) as pool:
+            results = {
+                path: (seconds, error)
+                for path, seconds, error in pool.map(warm_page, paths, [timeout] * len(paths))
+            }
+        if not any(error for _, error in results.values()):
+            cache.mark_warm(version)
+        cache.prune()
+        return results
+    finally:
+        cache.release(version)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the shared cache for every page.")
+    parser.add_argument("--workers", type=int, help=f"pool size (default: ${WARMUP_WORKERS_ENV} or one per page)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_PAGE_TIMEOUT, help="seconds per page")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = warm(args.workers, args.timeout)
+    if results is None:
+        print("another process is warming this dataset version")
+        return 0
+    for path, (seconds, error) in results.items():
+        print(f"{path:<40} {seconds:8.2f}s {error or ''}")
+    print(f"warmed {len(results)} pages in {time.perf_counter() - started:.2f}s")
+    return 1 if any(error for _, error in results.values()) else 0
+
+
+if __name__ == "__main__":
+    # Run from the importable module: pool tasks are pickled by module
+    # name, and AppTest replaces __main__ inside the workers.
+    from warmup import main
+
+    sys.exit(main())